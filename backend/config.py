@@ -4,6 +4,14 @@ Compatible with v1 .bridge_burner_config.json format
 """
 import os
 import json
+import mmap
+from typing import Optional
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 # App directory is the backend folder's parent
 BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -20,50 +28,136 @@ DEFAULT_LIBRARY_PATH = os.path.join(APP_DIR, "projects")
 PROJECT_SUBDIRS = ["RAW", "JPEG", "Video", "Other"]
 
 # Supported file extensions
-IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".bmp", ".tiff", ".tif", ".webp"}
-RAW_EXTENSIONS = {".arw", ".cr2", ".cr3", ".nef", ".orf", ".raf", ".rw2", ".dng", ".raw"}
-VIDEO_EXTENSIONS = {".mp4", ".mov", ".avi", ".mkv", ".mts", ".m2ts"}
+IMAGE_EXTENSIONS = frozenset({".jpg", ".jpeg", ".png", ".gif", ".bmp", ".tiff", ".tif", ".webp"})
+RAW_EXTENSIONS = frozenset({".arw", ".cr2", ".cr3", ".nef", ".orf", ".raf", ".rw2", ".dng", ".raw"})
+VIDEO_EXTENSIONS = frozenset({".mp4", ".mov", ".avi", ".mkv", ".mts", ".m2ts"})
+
+# Precomputed unions so per-file checks are a single lookup
+PHOTO_EXTENSIONS = IMAGE_EXTENSIONS | RAW_EXTENSIONS
+ALL_MEDIA_EXTENSIONS = PHOTO_EXTENSIONS | VIDEO_EXTENSIONS
 
 # Thumbnail settings
 THUMBNAIL_SIZE = (300, 300)
 THUMBNAIL_QUALITY = 85
 
 
+def json_loads(data):
+    """Parse JSON from a bytes-like object, using orjson when available"""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(bytes(data))
+
+
+def json_dumps(obj, pretty: bool = False) -> bytes:
+    """Serialize to JSON bytes (compact unless pretty), using orjson when available"""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else None)
+    if pretty:
+        return json.dumps(obj, indent=2).encode("utf-8")
+    # Compact separators keep stdlib json on its C encoder fast path
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+# Parsed config cache, keyed on the file it came from and that file's mtime
+_CONFIG_CACHE = {"path": None, "mtime": None, "data": None}
+
+# Set once neither config file could be loaded; cleared by save_config()
+_MISSING_CONFIG = False
+
+# Library path as of the last load/save. Handlers ask for it on every request,
+# so it's served from memory; save_config() and reload_config() reset it.
+_LIBRARY_PATH = None
+
+
+def _load_config_file(path: str) -> Optional[dict]:
+    """Load a config file, reusing the cached parse if the file is unchanged"""
+    # Open directly rather than exists()+open() - one path lookup instead of two
+    try:
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    except OSError:
+        return None
+
+    try:
+        st = os.fstat(fd)
+        mtime = st.st_mtime_ns
+        if _CONFIG_CACHE["path"] == path and _CONFIG_CACHE["mtime"] == mtime:
+            return _CONFIG_CACHE["data"]
+        if st.st_size == 0:
+            # mmap rejects zero-length files (and empty isn't valid JSON anyway)
+            return None
+        # Parse straight from the page cache instead of copying into a read buffer
+        with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            data = json_loads(view)
+    except (OSError, ValueError):
+        # Unreadable file or invalid JSON - try the next location
+        return None
+    finally:
+        os.close(fd)
+
+    _CONFIG_CACHE.update(path=path, mtime=mtime, data=data)
+    return data
+
+
 def get_config() -> dict:
     """
     Load app configuration from config file.
     Checks v2 location first, then falls back to v1 location for compatibility.
+    Parsed results are cached until the file's mtime changes.
     """
-    # Try v2 location first
-    if os.path.exists(CONFIG_FILE_V2):
-        try:
-            with open(CONFIG_FILE_V2, "r") as f:
-                return json.load(f)
-        except Exception:
-            pass
-
-    # Fall back to v1 location
-    if os.path.exists(CONFIG_FILE_V1):
-        try:
-            with open(CONFIG_FILE_V1, "r") as f:
-                return json.load(f)
-        except Exception:
-            pass
-
-    # Return defaults
+    global _MISSING_CONFIG
+    if _MISSING_CONFIG:
+        return {"library_path": DEFAULT_LIBRARY_PATH}
+
+    # Try v2 location first, then fall back to v1 location
+    for path in (CONFIG_FILE_V2, CONFIG_FILE_V1):
+        data = _load_config_file(path)
+        if data is not None:
+            # Return a copy so callers can't mutate the cached dict
+            return dict(data)
+
+    # Return defaults, and skip the file probes until a config is saved
+    _MISSING_CONFIG = True
     return {"library_path": DEFAULT_LIBRARY_PATH}
 
 
-def save_config(config: dict) -> None:
-    """Save app configuration to config file (v2 location)"""
-    with open(CONFIG_FILE_V2, "w") as f:
-        json.dump(config, f, indent=2)
+def save_config(config: dict, pretty: bool = False) -> None:
+    """
+    Save app configuration to config file (v2 location).
+    Writes to a temp file and renames it into place, so a crash mid-write
+    can't leave a truncated config that would silently load as defaults.
+    Pass pretty=True for an indented, hand-editable file.
+    """
+    global _MISSING_CONFIG, _LIBRARY_PATH
+    data = json_dumps(config, pretty)
+    tmp_path = CONFIG_FILE_V2 + ".tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        os.write(fd, data)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, CONFIG_FILE_V2)
+    _MISSING_CONFIG = False
+    _LIBRARY_PATH = None
+
+    # Refresh the cache so the next read doesn't re-parse what we just wrote
+    _CONFIG_CACHE.update(path=CONFIG_FILE_V2, mtime=os.stat(CONFIG_FILE_V2).st_mtime_ns, data=dict(config))
+
+
+def reload_config() -> None:
+    """Forget cached config so the next read goes back to the file (e.g. after a hand edit)"""
+    global _MISSING_CONFIG, _LIBRARY_PATH
+    _CONFIG_CACHE.update(path=None, mtime=None, data=None)
+    _MISSING_CONFIG = False
+    _LIBRARY_PATH = None
 
 
 def get_library_path() -> str:
     """Get the configured library path"""
-    config = get_config()
-    return config.get("library_path", DEFAULT_LIBRARY_PATH)
+    global _LIBRARY_PATH
+    if _LIBRARY_PATH is None:
+        _LIBRARY_PATH = get_config().get("library_path", DEFAULT_LIBRARY_PATH)
+    return _LIBRARY_PATH
 
 
 def set_library_path(path: str) -> None:
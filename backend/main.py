@@ -4,49 +4,102 @@ Photo culling and organization tool
 """
 import os
 import sys
-import signal
-import webbrowser
-import threading
-import atexit
+import asyncio
+import anyio.to_thread
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
-from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
-import uvicorn
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import FileResponse, Response, JSONResponse, ORJSONResponse
 
-from config import get_config
+from config import get_config, APP_DIR, HAS_ORJSON
 from routers import projects
 from routers import imports
 
+APP_URL = "http://localhost:8000"
+
+# Set by the __main__ launcher; tests and other importers never open a browser
+OPEN_BROWSER_ON_STARTUP = False
+
+# Threads for the blocking (plain def) endpoints; anyio's default is 40, and
+# thumbnail requests can sit waiting on generation while other calls queue
+THREADPOOL_SIZE = 100
+
 
 @asynccontextmanager
 async def lifespan(app):
     """Lifespan context manager for startup/shutdown events"""
     # Startup: Clear preview cache from previous sessions
     imports.clear_preview_cache()
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+    if OPEN_BROWSER_ON_STARTUP:
+        # Sockets are bound right after startup completes, so a short delay suffices
+        import webbrowser
+        asyncio.get_running_loop().call_later(0.1, webbrowser.open, APP_URL)
     yield
-    # Shutdown: nothing special needed
+    # Shutdown: stop the RAW preview and thumbnail workers
+    imports.shutdown_raw_pool()
+    projects.shutdown_thumb_pool()
 
 
-app = FastAPI(title="Bridge Burner", version="2.0.0", lifespan=lifespan)
+# orjson renders the large project/file listings much faster than stdlib json
+app = FastAPI(
+    title="Bridge Burner",
+    version="2.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse if HAS_ORJSON else JSONResponse,
+)
 
 # Include routers
 app.include_router(projects.router, prefix="/api/projects", tags=["projects"])
 app.include_router(imports.router, prefix="/api/import", tags=["import"])
 
-# Get the frontend directory path - handle both dev and PyInstaller bundle
-if getattr(sys, 'frozen', False):
-    # Running as compiled exe
-    BUNDLE_DIR = sys._MEIPASS
-    FRONTEND_DIR = os.path.join(BUNDLE_DIR, "frontend")
-else:
-    # Running as script
-    BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
-    ROOT_DIR = os.path.dirname(BACKEND_DIR)
-    FRONTEND_DIR = os.path.join(ROOT_DIR, "frontend")
-
-# Mount static files
-app.mount("/static", StaticFiles(directory=FRONTEND_DIR), name="static")
+# Get the frontend directory path - handle both dev and PyInstaller bundle.
+# The bundle dir (sys._MEIPASS) is only known at runtime, so resolve it once here.
+IS_FROZEN = getattr(sys, 'frozen', False)
+BUNDLE_DIR = sys._MEIPASS if IS_FROZEN else APP_DIR
+FRONTEND_DIR = os.path.join(BUNDLE_DIR, "frontend")
+
+
+def build_static_index(frontend_dir: str) -> dict:
+    """
+    Index the frontend bundle once at startup.
+    Maps URL path (e.g. "js/app.js") -> (absolute path, stat_result) so /static
+    requests skip per-request path resolution and validation.
+    """
+    index = {}
+    for root, dirs, filenames in os.walk(frontend_dir):
+        for filename in filenames:
+            filepath = os.path.join(root, filename)
+            rel_path = os.path.relpath(filepath, frontend_dir).replace(os.sep, "/")
+            try:
+                index[rel_path] = (filepath, os.stat(filepath))
+            except OSError:
+                continue
+    return index
+
+
+STATIC_INDEX = build_static_index(FRONTEND_DIR)
+
+
+@app.api_route("/static/{path:path}", methods=["GET", "HEAD"], include_in_schema=False)
+async def static_file(path: str, request: Request):
+    """Serve a frontend asset from the prebuilt static index"""
+    entry = STATIC_INDEX.get(path)
+    if entry is None:
+        raise HTTPException(status_code=404, detail="Not Found")
+
+    filepath, stat_result = entry
+    # The bundled exe's frontend is immutable, so its cached stat is always valid.
+    # When running from source the files may be edited, so re-stat them.
+    if not IS_FROZEN:
+        try:
+            stat_result = os.stat(filepath)
+        except OSError:
+            raise HTTPException(status_code=404, detail="Not Found")
+
+    response = FileResponse(filepath, stat_result=stat_result)
+    if request.headers.get("if-none-match") == response.headers["etag"]:
+        return Response(status_code=304, headers={"etag": response.headers["etag"]})
+    return response
 
 
 @app.get("/")
@@ -61,33 +114,45 @@ async def health():
     return {"status": "ok", "version": "2.0.0"}
 
 
-def open_browser():
-    """Open browser after a short delay"""
-    import time
-    time.sleep(1)
-    webbrowser.open("http://localhost:8000")
-
-
-def cleanup_and_exit(*args):
-    """Clean shutdown - ensures port is released"""
-    print("\nShutting down Bridge Burner...")
-    os._exit(0)
-
-
 if __name__ == "__main__":
-    # Register signal handlers for clean shutdown
+    # Needed for the RAW preview process pool in the frozen exe
+    import multiprocessing
+    multiprocessing.freeze_support()
+
+    # Launcher-only imports - kept out of module scope so importing the app
+    # (tests, workers) doesn't pay for them
+    import signal
+    import uvicorn
+
+    def cleanup_and_exit(*args):
+        """Fast shutdown on Ctrl+C - ensures port is released"""
+        # Raw write to fd 2 skips Python's buffered stdout, which can block on
+        # the Windows console during shutdown
+        os.write(2, b"\nShutting down Bridge Burner...\n")
+        os._exit(0)
+
+    # Ctrl+C exits immediately. SIGTERM is left to uvicorn's graceful shutdown
+    # so in-flight requests finish and atexit/finalizers still run.
     signal.signal(signal.SIGINT, cleanup_and_exit)
-    signal.signal(signal.SIGTERM, cleanup_and_exit)
-
-    # On Windows, also handle CTRL_CLOSE_EVENT via atexit
-    atexit.register(cleanup_and_exit)
 
-    # Open browser in background thread
-    threading.Thread(target=open_browser, daemon=True).start()
+    # Open browser once the server has started (see lifespan)
+    OPEN_BROWSER_ON_STARTUP = True
+
+    # Prefer the libuv event loop (not available on Windows) and the C HTTP parser
+    try:
+        import uvloop  # noqa: F401
+        loop = "uvloop"
+    except ImportError:
+        loop = "asyncio"
+    try:
+        import httptools  # noqa: F401
+        http = "httptools"
+    except ImportError:
+        http = "h11"
 
     # Run the server
     # When frozen (exe), disable uvicorn's fancy logging to avoid isatty errors
-    if getattr(sys, 'frozen', False):
-        uvicorn.run(app, host="127.0.0.1", port=8000, log_config=None)
+    if IS_FROZEN:
+        uvicorn.run(app, host="127.0.0.1", port=8000, loop=loop, http=http, log_config=None)
     else:
-        uvicorn.run(app, host="127.0.0.1", port=8000)
+        uvicorn.run(app, host="127.0.0.1", port=8000, loop=loop, http=http)
@@ -3,42 +3,195 @@ Import and conversion endpoints for Bridge Burner v2
 Handles scanning folders, organizing files, and video conversion
 """
 import os
-import json
+import random
+import re
 import shutil
-from datetime import datetime
-from typing import List
-from fastapi import APIRouter, HTTPException, BackgroundTasks
+import time
+import asyncio
+import hashlib
+import threading
+from bisect import bisect_right
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import List, Optional
+from fastapi import APIRouter, HTTPException, BackgroundTasks, Request, Response
 from pydantic import BaseModel
 
+try:
+    from PIL import Image
+    from PIL.ExifTags import TAGS
+    HAS_PIL = True
+    # Resolve the tag id once instead of scanning TAGS/every EXIF entry per file
+    EXIF_DATETIME_ORIGINAL_TAG = next(k for k, v in TAGS.items() if v == "DateTimeOriginal")
+except ImportError:
+    HAS_PIL = False
+    EXIF_DATETIME_ORIGINAL_TAG = None
+
+# Pointer from IFD0 to the Exif sub-IFD, where DateTimeOriginal lives
+EXIF_IFD_POINTER_TAG = 0x8769
+
+try:
+    import xxhash
+    HAS_XXHASH = True
+except ImportError:
+    HAS_XXHASH = False
+
 import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from config import (
     get_library_path,
+    json_dumps,
     PROJECT_SUBDIRS,
     IMAGE_EXTENSIONS,
     RAW_EXTENSIONS,
     VIDEO_EXTENSIONS,
+    PHOTO_EXTENSIONS,
 )
-from services.thumbnails import get_or_create_thumbnail
+from services.files import walk_files, walk_files_parallel, copy_file
+from services.folder_picker import browse_folder_native
+from services.exif import read_datetime_original, ExifUnsupported
+from services.thumbnails import get_or_create_thumbnail, create_thumbnail_from_raw, HAS_RAWPY
+from routers.projects import get_metadata_path, load_metadata, edit_metadata
 from services.conversion import (
     find_ffmpeg,
     get_ffmpeg_version,
     get_presets_list,
     convert_video,
+    convert_video_batch,
+    throttle_progress,
     is_gopro_file,
+    resolve_preset,
     ConversionPreset,
     PRESETS,
+    HARDWARE_PRESETS,
+    NVENC_MAX_SESSIONS,
 )
 
 router = APIRouter()
 
+# Output of a previous conversion (e.g. GX010001_dnxhd.mov) - never re-imported.
+# Hidden files are already skipped by walk_files.
+_CONVERTED_NAME_RE = re.compile(r"_dnxhd", re.IGNORECASE)
+
+# Extension -> scan category, and scan category -> project subdirectory,
+# so per-file classification is one dict lookup
+_EXT_CATEGORY = {
+    **{ext: "video" for ext in VIDEO_EXTENSIONS},
+    **{ext: "jpeg" for ext in IMAGE_EXTENSIONS},
+    **{ext: "raw" for ext in RAW_EXTENSIONS},
+}
+_CATEGORY_SUBDIR = {"raw": "RAW", "jpeg": "JPEG", "video": "Video", "other": "Other"}
+
 # Track active conversion jobs
 active_jobs = {}
 
+# Cached /scan results: abspath -> (root dir mtime, monotonic time cached, result)
+# Entries expire after SCAN_CACHE_TTL seconds, when the source folder's mtime
+# changes, or when an import from that folder finishes. Expired entries are
+# dropped whenever a new result is stored, and at most SCAN_CACHE_MAX_ENTRIES
+# folders are kept (oldest evicted first).
+_scan_cache = {}
+_scan_cache_lock = threading.Lock()
+SCAN_CACHE_TTL = 60
+SCAN_CACHE_MAX_ENTRIES = 8
+
+
+def invalidate_scan_cache(path: str) -> None:
+    """Drop any cached scan result for a source folder"""
+    with _scan_cache_lock:
+        _scan_cache.pop(os.path.abspath(path), None)
+
+
+def _store_scan_result(cache_key: str, root_mtime: float, result: dict) -> None:
+    """Cache a scan result, evicting expired entries and the oldest beyond the limit"""
+    now = time.monotonic()
+    with _scan_cache_lock:
+        for key in [key for key, cached in _scan_cache.items() if now - cached[1] >= SCAN_CACHE_TTL]:
+            del _scan_cache[key]
+        _scan_cache.pop(cache_key, None)  # Re-inserted below as the newest
+        while len(_scan_cache) >= SCAN_CACHE_MAX_ENTRIES:
+            del _scan_cache[next(iter(_scan_cache))]
+        _scan_cache[cache_key] = (root_mtime, now, result)
+
+
 # Preview cache directory
 import tempfile
 PREVIEW_CACHE_DIR = os.path.join(tempfile.gettempdir(), "bridgeburner_preview_cache")
+PREVIEW_QUALITY = 80
+
+# RAW decoding is CPU-bound, so previews are rendered in a process pool rather
+# than on the event loop. The pool is created on first use and shut down with
+# the app; in-flight jobs are tracked by cache path so a request for a preview
+# that is already being prefetched waits on that job instead of starting another.
+_raw_pool = None
+_raw_pool_lock = threading.RLock()  # Reentrant: submit_raw_preview calls get_raw_pool under it
+_raw_preview_jobs = {}
+
+
+def get_raw_pool() -> ProcessPoolExecutor:
+    """Get the shared RAW preview process pool, starting it if needed"""
+    global _raw_pool
+    with _raw_pool_lock:
+        if _raw_pool is None:
+            _raw_pool = ProcessPoolExecutor(max_workers=os.cpu_count() or 1)
+        return _raw_pool
+
+
+def shutdown_raw_pool() -> None:
+    """Stop the RAW preview process pool (called on app shutdown)"""
+    global _raw_pool
+    with _raw_pool_lock:
+        if _raw_pool is not None:
+            _raw_pool.shutdown(wait=False, cancel_futures=True)
+            _raw_pool = None
+        _raw_preview_jobs.clear()
+
+
+def get_preview_cache_key(filepath: str) -> str:
+    """
+    Get a 16 hex char cache key for a source file's preview (path + mtime).
+    This is only a cache key, so a fast non-cryptographic hash is used:
+    xxh3 when xxhash is installed, otherwise 8-byte blake2b from the stdlib.
+    """
+    mtime = os.path.getmtime(filepath)
+    hash_input = f"{filepath}:{mtime}".encode()
+    if HAS_XXHASH:
+        return f"{xxhash.xxh3_64_intdigest(hash_input):016x}"
+    return hashlib.blake2b(hash_input, digest_size=8).hexdigest()
+
+
+def get_preview_cache_path(filepath: str, file_hash: Optional[str] = None) -> str:
+    """Get the preview cache path for a source file (keyed on path + mtime)"""
+    if file_hash is None:
+        file_hash = get_preview_cache_key(filepath)
+    # Fan out over 256 subdirectories so no single directory grows huge
+    return os.path.join(PREVIEW_CACHE_DIR, file_hash[:2], f"{file_hash[2:]}.jpg")
+
+
+def submit_raw_preview(filepath: str, cache_path: str) -> Future:
+    """
+    Render a RAW preview into cache_path on the process pool.
+    Returns a future resolving to True on success. Joins an in-flight job for
+    the same cache path, and returns an already-completed future if cached.
+    """
+    # One critical section from lookup to insert, so two requests can't both
+    # submit a render of the same file
+    with _raw_pool_lock:
+        future = _raw_preview_jobs.get(cache_path)
+        if future is not None:
+            return future
+        if os.path.exists(cache_path):
+            future = Future()
+            future.set_result(True)
+            return future
+
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        future = get_raw_pool().submit(create_thumbnail_from_raw, filepath, cache_path, PREVIEW_QUALITY)
+        _raw_preview_jobs[cache_path] = future
+    future.add_done_callback(lambda f: _raw_preview_jobs.pop(cache_path, None))
+    return future
 
 
 def clear_preview_cache():
@@ -74,7 +227,7 @@ class ConvertRequest(BaseModel):
 
 
 @router.get("/ffmpeg-status")
-async def ffmpeg_status():
+def ffmpeg_status():
     """Check if ffmpeg is available and get version"""
     ffmpeg_path = find_ffmpeg()
     version = get_ffmpeg_version() if ffmpeg_path else None
@@ -92,18 +245,12 @@ async def list_presets():
     return {"presets": get_presets_list()}
 
 
-@router.post("/browse-folder")
-async def browse_folder():
-    """Open native folder picker dialog and return selected path"""
+def _browse_folder_powershell() -> str:
+    """Windows fallback folder picker via PowerShell + WinForms"""
     import subprocess
-    import platform
 
-    try:
-        system = platform.system()
-
-        if system == "Windows":
-            # PowerShell folder picker - uses STA thread for proper COM dialog handling
-            ps_script = '''
+    # PowerShell folder picker - uses STA thread for proper COM dialog handling
+    ps_script = '''
 Add-Type -AssemblyName System.Windows.Forms
 [System.Windows.Forms.Application]::EnableVisualStyles()
 $folder = New-Object System.Windows.Forms.FolderBrowserDialog
@@ -116,14 +263,33 @@ if ($result -eq [System.Windows.Forms.DialogResult]::OK) {
 }
 $folder.Dispose()
 '''
-            result = subprocess.run(
-                ["powershell", "-NoProfile", "-STA", "-WindowStyle", "Hidden", "-Command", ps_script],
-                capture_output=True,
-                text=True,
-                timeout=120,
-                creationflags=subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0
-            )
-            path = result.stdout.strip()
+    result = subprocess.run(
+        ["powershell", "-NoProfile", "-STA", "-WindowStyle", "Hidden", "-Command", ps_script],
+        capture_output=True,
+        text=True,
+        timeout=120,
+        creationflags=subprocess.CREATE_NO_WINDOW if hasattr(subprocess, 'CREATE_NO_WINDOW') else 0
+    )
+    return result.stdout.strip()
+
+
+@router.post("/browse-folder")
+async def browse_folder():
+    """Open native folder picker dialog and return selected path"""
+    import subprocess
+    import platform
+
+    try:
+        system = platform.system()
+
+        if system == "Windows":
+            # Shell folder dialog called in-process on its own STA thread;
+            # fall back to PowerShell if it can't be shown
+            try:
+                path = await asyncio.wrap_future(browse_folder_native("Select Folder"))
+            except OSError as e:
+                print(f"[Browse] Native folder picker failed, using PowerShell: {e}")
+                path = _browse_folder_powershell()
 
         elif system == "Darwin":  # macOS
             # AppleScript for native folder picker
@@ -172,6 +338,21 @@ async def scan_folder(request: ScanRequest):
     if not os.path.isdir(path):
         raise HTTPException(status_code=400, detail=f"Path is not a directory: {path}")
 
+    # The walk blocks, so run it in a worker thread and keep the event loop free
+    # for other requests (e.g. job progress polling)
+    return await asyncio.to_thread(_scan_folder_sync, path)
+
+
+def _scan_folder_sync(path: str) -> dict:
+    """Blocking body of scan_folder (walks the tree and classifies files)"""
+    # Repeat scans of the same unchanged folder (scan -> preview -> import) reuse the last result
+    cache_key = os.path.abspath(path)
+    root_mtime = os.stat(path).st_mtime
+    with _scan_cache_lock:
+        cached = _scan_cache.get(cache_key)
+    if cached and cached[0] == root_mtime and time.monotonic() - cached[1] < SCAN_CACHE_TTL:
+        return cached[2]
+
     files = {
         "raw": [],
         "jpeg": [],
@@ -180,228 +361,294 @@ async def scan_folder(request: ScanRequest):
         "other": [],
     }
 
+    counts = dict.fromkeys(files, 0)
     total_size = 0
+    # Walker paths are root + separator + relative path, so slicing off the
+    # prefix gives the same result as os.path.relpath without normalising each path
+    root_prefix_len = len(os.path.join(path, ""))
 
-    for root, dirs, filenames in os.walk(path):
-        # Skip hidden directories
-        dirs[:] = [d for d in dirs if not d.startswith(".")]
-
-        for filename in filenames:
-            if filename.startswith("."):
-                continue
-
-            filepath = os.path.join(root, filename)
-            ext = os.path.splitext(filename)[1].lower()
-
-            try:
-                size = os.path.getsize(filepath)
-                total_size += size
-            except OSError:
-                size = 0
+    for entry in walk_files_parallel(path):
+        filename = entry.name
+        filepath = entry.path
+        ext = os.path.splitext(filename)[1].lower()
 
-            file_info = {
-                "filename": filename,
-                "path": filepath,
-                "size": size,
-                "relative_path": os.path.relpath(filepath, path),
-            }
+        try:
+            size = entry.stat().st_size
+            total_size += size
+        except OSError:
+            size = 0
+
+        file_info = {
+            "filename": filename,
+            "path": filepath,
+            "size": size,
+            "relative_path": filepath[root_prefix_len:],
+        }
 
-            if ext in RAW_EXTENSIONS:
-                files["raw"].append(file_info)
-            elif ext in IMAGE_EXTENSIONS:
-                files["jpeg"].append(file_info)
-            elif ext in VIDEO_EXTENSIONS:
-                # Check if it's a GoPro file
-                if is_gopro_file(filepath):
-                    file_info["is_gopro"] = True
-                    files["gopro"].append(file_info)
-                else:
-                    files["video"].append(file_info)
-            else:
-                files["other"].append(file_info)
+        category = _EXT_CATEGORY.get(ext, "other")
+        # Check if a video is a GoPro file
+        if category == "video" and is_gopro_file(filepath):
+            file_info["is_gopro"] = True
+            category = "gopro"
+        files[category].append(file_info)
+        counts[category] += 1
 
-    return {
+    counts["total"] = sum(counts.values())
+    result = {
         "path": path,
         "files": files,
-        "counts": {
-            "raw": len(files["raw"]),
-            "jpeg": len(files["jpeg"]),
-            "video": len(files["video"]),
-            "gopro": len(files["gopro"]),
-            "other": len(files["other"]),
-            "total": sum(len(f) for f in files.values()),
-        },
+        "counts": counts,
         "total_size": total_size,
     }
+    _store_scan_result(cache_key, root_mtime, result)
+    return result
+
+
+# Samples shown per date, and how often (in photos) the stream reports progress
+DATE_PREVIEW_SAMPLES = 3
+DATE_PREVIEW_PROGRESS_EVERY = 250
+
+
+def _reservoir_slot(reservoir: list, seen: int) -> Optional[int]:
+    """
+    Reservoir sampling step for a uniform sample of DATE_PREVIEW_SAMPLES items.
+    seen counts the new item. Returns the index the new item goes in (which
+    may be len(reservoir), i.e. append), or None if it isn't sampled.
+    """
+    if len(reservoir) < DATE_PREVIEW_SAMPLES:
+        return len(reservoir)
+    j = random.randrange(seen)
+    return j if j < DATE_PREVIEW_SAMPLES else None
+
+
+def _iter_date_previews(path: str):
+    """
+    Yield NDJSON lines for get_date_previews: "progress" lines while walking,
+    then one "date" line per date (newest first), then a "done" summary.
+    Only per-date counts and a small random sample are kept, not every file.
+    """
+    # date -> {"jpeg_count", "raw_count", "jpegs", "raws"} (jpegs/raws are reservoirs)
+    dates = {}
+    scanned = 0
+
+    for entry in walk_files(path):
+        filename = entry.name
+        filepath = entry.path
+        ext = os.path.splitext(filename)[1].lower()
 
+        # Only include images (JPEG and RAW)
+        if ext not in PHOTO_EXTENSIONS:
+            continue
 
-@router.post("/date-previews")
-async def get_date_previews(request: ScanRequest):
-    """Get preview images grouped by date (3 per date) for quick review"""
-    path = request.path
-
-    if not os.path.exists(path):
-        raise HTTPException(status_code=404, detail=f"Path not found: {path}")
+        try:
+            mtime = entry.stat().st_mtime
+        except OSError:
+            continue
 
-    if not os.path.isdir(path):
-        raise HTTPException(status_code=400, detail=f"Path is not a directory: {path}")
+        # EXIF date for JPEGs, file modification time as fallback
+        date_str = get_file_date_for_import(filepath, ext, mtime)
+        if date_str is None:
+            continue
 
-    from collections import defaultdict
-    import random
+        group = dates.get(date_str)
+        if group is None:
+            group = dates[date_str] = {"jpeg_count": 0, "raw_count": 0, "jpegs": [], "raws": []}
 
-    # Group files by date
-    files_by_date = defaultdict(list)
+        is_raw = ext in RAW_EXTENSIONS
+        if is_raw:
+            group["raw_count"] += 1
+            reservoir, seen = group["raws"], group["raw_count"]
+        else:
+            group["jpeg_count"] += 1
+            reservoir, seen = group["jpegs"], group["jpeg_count"]
 
-    for root, dirs, filenames in os.walk(path):
-        dirs[:] = [d for d in dirs if not d.startswith(".")]
+        # Only files that land in the sample get a record built for them
+        slot = _reservoir_slot(reservoir, seen)
+        if slot is not None:
+            item = {
+                "filename": filename,
+                "filepath": filepath,
+                "ext": ext,
+                "is_raw": is_raw,
+            }
+            if slot == len(reservoir):
+                reservoir.append(item)
+            else:
+                reservoir[slot] = item
 
-        for filename in filenames:
-            if filename.startswith("."):
-                continue
+        scanned += 1
+        if scanned % DATE_PREVIEW_PROGRESS_EVERY == 0:
+            yield json_dumps({"type": "progress", "scanned": scanned}) + b"\n"
 
-            filepath = os.path.join(root, filename)
-            ext = os.path.splitext(filename)[1].lower()
+    # Build preview data: 3 random samples per date
+    total_files = 0
+    for date_str in sorted(dates.keys(), reverse=True):
+        group = dates[date_str]
 
-            # Only include images (JPEG and RAW)
-            if ext not in IMAGE_EXTENSIONS and ext not in RAW_EXTENSIONS:
-                continue
+        # Pick up to 3 samples, preferring JPEGs (faster to load), topping up with RAW
+        samples = random.sample(group["jpegs"], len(group["jpegs"]))
+        if len(samples) < DATE_PREVIEW_SAMPLES and group["raws"]:
+            samples += random.sample(group["raws"], min(DATE_PREVIEW_SAMPLES - len(samples), len(group["raws"])))
 
+        for sample in samples:
+            # Version goes in the preview URL so the browser can cache it forever
             try:
-                # Get file modification time as fallback
-                mtime = os.path.getmtime(filepath)
-                from datetime import datetime
-                date_str = datetime.fromtimestamp(mtime).strftime("%Y-%m-%d")
-
-                # Try to get EXIF date if available (for JPEGs)
-                if ext in IMAGE_EXTENSIONS:
-                    try:
-                        from PIL import Image
-                        from PIL.ExifTags import TAGS
-                        with Image.open(filepath) as img:
-                            exif = img._getexif()
-                            if exif:
-                                for tag_id, value in exif.items():
-                                    tag = TAGS.get(tag_id, tag_id)
-                                    if tag == "DateTimeOriginal":
-                                        # Format: "2024:01:15 14:30:00"
-                                        date_str = value.split(" ")[0].replace(":", "-")
-                                        break
-                    except Exception:
-                        pass  # Fall back to mtime
-
-                files_by_date[date_str].append({
-                    "filename": filename,
-                    "filepath": filepath,
-                    "ext": ext,
-                    "is_raw": ext in RAW_EXTENSIONS,
-                })
+                sample["version"] = get_preview_cache_key(sample["filepath"])
             except OSError:
                 continue
+            # Start rendering RAW samples now so they're cached by the time the UI asks
+            if sample["is_raw"] and HAS_RAWPY:
+                try:
+                    submit_raw_preview(sample["filepath"], get_preview_cache_path(sample["filepath"], sample["version"]))
+                except Exception:
+                    pass
 
-    # Build preview data: 3 random samples per date
-    previews = []
-    for date_str in sorted(files_by_date.keys(), reverse=True):
-        files = files_by_date[date_str]
-        # Prefer JPEGs for previews (faster to load), but include RAW if no JPEGs
-        jpegs = [f for f in files if not f["is_raw"]]
-        raws = [f for f in files if f["is_raw"]]
-
-        # Pick up to 3 samples, preferring JPEGs
-        samples = []
-        if jpegs:
-            samples = random.sample(jpegs, min(3, len(jpegs)))
-        if len(samples) < 3 and raws:
-            samples += random.sample(raws, min(3 - len(samples), len(raws)))
-
-        previews.append({
+        total_count = group["jpeg_count"] + group["raw_count"]
+        total_files += total_count
+        yield json_dumps({
+            "type": "date",
             "date": date_str,
-            "total_count": len(files),
-            "jpeg_count": len(jpegs),
-            "raw_count": len(raws),
+            "total_count": total_count,
+            "jpeg_count": group["jpeg_count"],
+            "raw_count": group["raw_count"],
             "samples": samples,
-        })
+        }) + b"\n"
 
-    return {
+    yield json_dumps({
+        "type": "done",
         "path": path,
-        "dates": previews,
-        "total_dates": len(previews),
-        "total_files": sum(p["total_count"] for p in previews),
-    }
+        "total_dates": len(dates),
+        "total_files": total_files,
+    }) + b"\n"
+
+
+@router.post("/date-previews")
+async def get_date_previews(request: ScanRequest):
+    """
+    Get preview images grouped by date (3 per date) for quick review.
+    Streams NDJSON (see _iter_date_previews) so the UI can show progress on
+    large cards instead of waiting for the whole walk.
+    """
+    from fastapi.responses import StreamingResponse
+
+    path = request.path
+
+    if not os.path.exists(path):
+        raise HTTPException(status_code=404, detail=f"Path not found: {path}")
+
+    if not os.path.isdir(path):
+        raise HTTPException(status_code=400, detail=f"Path is not a directory: {path}")
+
+    # A plain generator is iterated in Starlette's threadpool, off the event loop
+    return StreamingResponse(_iter_date_previews(path), media_type="application/x-ndjson")
 
 
 @router.delete("/preview-cache")
-async def delete_preview_cache():
+def delete_preview_cache():
     """Clear the preview image cache"""
     clear_preview_cache()
     return {"success": True, "message": "Preview cache cleared"}
 
 
 @router.get("/preview-image")
-async def get_preview_image(filepath: str):
-    """Serve a preview image (generates thumbnail for RAW files)"""
+async def get_preview_image(request: Request, filepath: str, v: Optional[str] = None):
+    """
+    Serve a preview image (generates thumbnail for RAW files).
+    The ETag is the path + mtime cache key; when the URL carries the current
+    key as ?v= the response is marked immutable so the browser never re-asks.
+    """
     from fastapi.responses import FileResponse
-    import hashlib
 
     if not os.path.exists(filepath):
         raise HTTPException(status_code=404, detail="File not found")
 
+    file_hash = get_preview_cache_key(filepath)
+    etag = f'"{file_hash}"'
+    if v == file_hash:
+        cache_control = "public, max-age=31536000, immutable"
+    else:
+        cache_control = "no-cache"
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+
     ext = os.path.splitext(filepath)[1].lower()
 
     # For RAW files, generate a cached preview thumbnail
     if ext in RAW_EXTENSIONS:
+        if not HAS_RAWPY:
+            raise HTTPException(status_code=404, detail="RAW support not available (rawpy not installed)")
+
         try:
-            import rawpy
-            from PIL import Image
+            cache_path = get_preview_cache_path(filepath, file_hash)
+            # Decode in the process pool (or join a prefetch already running)
+            # so the event loop stays free for other requests
+            if not await asyncio.wrap_future(submit_raw_preview(filepath, cache_path)):
+                raise RuntimeError("could not decode RAW file")
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Failed to process RAW: {str(e)}")
 
-            # Use the global cache directory
-            os.makedirs(PREVIEW_CACHE_DIR, exist_ok=True)
+        return FileResponse(cache_path, media_type="image/jpeg", headers=headers)
 
-            # Generate cache filename based on filepath + mtime
-            mtime = os.path.getmtime(filepath)
-            hash_input = f"{filepath}:{mtime}"
-            file_hash = hashlib.md5(hash_input.encode()).hexdigest()[:12]
-            cache_path = os.path.join(PREVIEW_CACHE_DIR, f"{file_hash}.jpg")
+    # For JPEGs, serve directly (browser will handle resizing)
+    return FileResponse(filepath, media_type="image/jpeg", headers=headers)
 
-            # Return cached version if exists
-            if os.path.exists(cache_path):
-                return FileResponse(cache_path, media_type="image/jpeg")
 
-            # Generate preview from RAW
-            with rawpy.imread(filepath) as raw:
-                # Try embedded thumbnail first (fast)
-                try:
-                    thumb = raw.extract_thumb()
-                    if thumb.format == rawpy.ThumbFormat.JPEG:
-                        with open(cache_path, "wb") as f:
-                            f.write(thumb.data)
-                        # Resize if too large
-                        with Image.open(cache_path) as img:
-                            if img.size[0] > 300 or img.size[1] > 300:
-                                img.thumbnail((300, 300), Image.Resampling.LANCZOS)
-                                img.save(cache_path, "JPEG", quality=80)
-                        return FileResponse(cache_path, media_type="image/jpeg")
-                    elif thumb.format == rawpy.ThumbFormat.BITMAP:
-                        img = Image.fromarray(thumb.data)
-                        img.thumbnail((300, 300), Image.Resampling.LANCZOS)
-                        img.save(cache_path, "JPEG", quality=80)
-                        return FileResponse(cache_path, media_type="image/jpeg")
-                except Exception:
-                    pass
+def _import_files_sync(request: ImportRequest, source_path: str, project_name: str, project_path: str):
+    """Blocking body of import_files: copy/move files into the project, return (imported, errors)"""
+    # Create subdirectories
+    for subdir in PROJECT_SUBDIRS:
+        os.makedirs(os.path.join(project_path, subdir), exist_ok=True)
 
-                # Fall back to full RAW processing (slower)
-                rgb = raw.postprocess(use_camera_wb=True, half_size=True)
-                img = Image.fromarray(rgb)
-                img.thumbnail((300, 300), Image.Resampling.LANCZOS)
-                img.save(cache_path, "JPEG", quality=80)
-                return FileResponse(cache_path, media_type="image/jpeg")
+    # Create metadata file
+    if not os.path.exists(get_metadata_path(project_path)):
+        with edit_metadata(project_path) as metadata:  # Defaults for a new project
+            metadata["import_source"] = source_path
 
-        except ImportError:
-            raise HTTPException(status_code=404, detail="RAW support not available (rawpy not installed)")
+    # Scan and organize files
+    imported = {"raw": 0, "jpeg": 0, "video": 0, "other": 0}
+    errors = []
+
+    # One listing per subdirectory instead of an exists() check per candidate name
+    existing_names = {
+        subdir: _list_existing_names(os.path.join(project_path, subdir))
+        for subdir in PROJECT_SUBDIRS
+    }
+
+    for entry in walk_files(source_path):
+        filename = entry.name
+        filepath = entry.path
+        ext = os.path.splitext(filename)[1].lower()
+
+        # Determine destination subdirectory
+        category = _EXT_CATEGORY.get(ext, "other")
+        dest_subdir = _CATEGORY_SUBDIR[category]
+        imported[category] += 1
+
+        # Handle duplicate filenames
+        names = existing_names[dest_subdir]
+        new_filename = filename
+        counter = 1
+        base_name = os.path.splitext(filename)[0]
+        while new_filename.lower() in names:
+            new_filename = f"{base_name}_{counter}{ext}"
+            counter += 1
+        names.add(new_filename.lower())
+        dest_path = os.path.join(project_path, dest_subdir, new_filename)
+
+        try:
+            if request.delete_originals:
+                shutil.move(filepath, dest_path)
+            else:
+                copy_file(filepath, dest_path)
         except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Failed to process RAW: {str(e)}")
+            errors.append({"file": filename, "error": str(e)})
 
-    # For JPEGs, serve directly (browser will handle resizing)
-    return FileResponse(filepath, media_type="image/jpeg")
+    # Source contents may have changed (moved files); don't serve a stale scan
+    invalidate_scan_cache(source_path)
+
+    return imported, errors
 
 
 @router.post("/import")
@@ -417,69 +664,10 @@ async def import_files(request: ImportRequest, background_tasks: BackgroundTasks
     # Create project directory
     project_path = os.path.join(library_path, project_name)
 
-    # Create subdirectories
-    for subdir in PROJECT_SUBDIRS:
-        os.makedirs(os.path.join(project_path, subdir), exist_ok=True)
-
-    # Create metadata file
-    metadata_path = os.path.join(project_path, ".metadata.json")
-    if not os.path.exists(metadata_path):
-        metadata = {
-            "notes": "",
-            "created": datetime.now().isoformat(),
-            "project_name": project_name,
-            "culled_files": [],
-            "session_notes": [],
-            "import_source": source_path,
-        }
-        with open(metadata_path, "w") as f:
-            json.dump(metadata, f, indent=2)
-
-    # Scan and organize files
-    imported = {"raw": 0, "jpeg": 0, "video": 0, "other": 0}
-    errors = []
-
-    for root, dirs, filenames in os.walk(source_path):
-        dirs[:] = [d for d in dirs if not d.startswith(".")]
-
-        for filename in filenames:
-            if filename.startswith("."):
-                continue
-
-            filepath = os.path.join(root, filename)
-            ext = os.path.splitext(filename)[1].lower()
-
-            # Determine destination subdirectory
-            if ext in RAW_EXTENSIONS:
-                dest_subdir = "RAW"
-                imported["raw"] += 1
-            elif ext in IMAGE_EXTENSIONS:
-                dest_subdir = "JPEG"
-                imported["jpeg"] += 1
-            elif ext in VIDEO_EXTENSIONS:
-                dest_subdir = "Video"
-                imported["video"] += 1
-            else:
-                dest_subdir = "Other"
-                imported["other"] += 1
-
-            dest_path = os.path.join(project_path, dest_subdir, filename)
-
-            # Handle duplicate filenames
-            counter = 1
-            base_name = os.path.splitext(filename)[0]
-            while os.path.exists(dest_path):
-                new_filename = f"{base_name}_{counter}{ext}"
-                dest_path = os.path.join(project_path, dest_subdir, new_filename)
-                counter += 1
-
-            try:
-                if request.delete_originals:
-                    shutil.move(filepath, dest_path)
-                else:
-                    shutil.copy2(filepath, dest_path)
-            except Exception as e:
-                errors.append({"file": filename, "error": str(e)})
+    # Copying blocks, so run it in a worker thread to keep the event loop free
+    imported, errors = await asyncio.to_thread(
+        _import_files_sync, request, source_path, project_name, project_path
+    )
 
     # If conversion requested, start background job
     job_id = None
@@ -510,6 +698,32 @@ async def import_files(request: ImportRequest, background_tasks: BackgroundTasks
     }
 
 
+# Concurrent ffmpeg processes for batch conversion (each is itself multithreaded)
+CONVERSION_WORKERS = max(1, min(4, (os.cpu_count() or 2) // 2))
+
+# Most GoPro clips converted by a single ffmpeg process
+GOPRO_BATCH_SIZE = 8
+
+
+# Concurrent remuxes - they're disk-bound, and more than two parallel
+# streams mostly adds seeking on spinning disks and card readers
+REMUX_WORKERS = 2
+
+
+def conversion_workers(preset: ConversionPreset) -> int:
+    """Concurrent ffmpeg processes for a preset (GPU encoders have few sessions)"""
+    if preset in HARDWARE_PRESETS:
+        return min(CONVERSION_WORKERS, NVENC_MAX_SESSIONS)
+    if preset == ConversionPreset.COPY:
+        return min(CONVERSION_WORKERS, REMUX_WORKERS)
+    return CONVERSION_WORKERS
+
+
+def encoder_threads(workers: int) -> int:
+    """Encoder threads per ffmpeg process so concurrent encodes split the cores"""
+    return max(1, (os.cpu_count() or 1) // workers)
+
+
 def run_batch_conversion(job_id: str, project_path: str, preset_name: str):
     """Background task to convert all videos in a project"""
     job = active_jobs[job_id]
@@ -522,7 +736,7 @@ def run_batch_conversion(job_id: str, project_path: str, preset_name: str):
 
     # Get preset
     try:
-        preset = ConversionPreset(preset_name)
+        preset = resolve_preset(ConversionPreset(preset_name))
     except ValueError:
         preset = ConversionPreset.DNXHD_1080P
 
@@ -535,35 +749,55 @@ def run_batch_conversion(job_id: str, project_path: str, preset_name: str):
         if ext in VIDEO_EXTENSIONS:
             video_files.append(filename)
 
-    job["total"] = len(video_files)
+    total = len(video_files)
+    job["total"] = total
 
-    for i, filename in enumerate(video_files):
+    # Per-file progress (0-100); overall progress is their average
+    lock = threading.Lock()
+    file_progress = {}
+
+    def convert_one(filename):
         input_path = os.path.join(video_dir, filename)
         base_name = os.path.splitext(filename)[0]
         output_path = os.path.join(video_dir, base_name + settings.extension)
 
         # Skip if already converted
         if os.path.exists(output_path) and output_path != input_path:
-            job["completed"] += 1
-            continue
+            return {"success": True}
 
-        job["current_file"] = filename
+        with lock:
+            job["current_file"] = filename
 
         def update_progress(progress, message):
-            job["progress"] = progress
-            job["current_message"] = message
-
-        result = convert_video(input_path, output_path, preset, update_progress)
+            with lock:
+                file_progress[filename] = progress
+                job["progress"] = sum(file_progress.values()) / total
+                job["current_message"] = message
+
+        # Throttled so concurrent conversions don't contend on the lock
+        return convert_video(input_path, output_path, preset, throttle_progress(update_progress), threads)
+
+    # Several ffmpeg processes at once: one encode rarely saturates every core,
+    # and overlapping files hides each one's decode/IO-bound stretches
+    workers = conversion_workers(preset)
+    threads = encoder_threads(workers)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(convert_one, filename): filename for filename in video_files}
+        for future in as_completed(futures):
+            filename = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                result = {"success": False, "error": str(e)}
 
-        if result["success"]:
-            job["completed"] += 1
-            # Optionally remove original after successful conversion
-            # if input_path != output_path:
-            #     os.remove(input_path)
-        else:
-            job["errors"].append({"file": filename, "error": result.get("error", "Unknown error")})
+            with lock:
+                if result["success"]:
+                    job["completed"] += 1
+                else:
+                    job["errors"].append({"file": filename, "error": result.get("error", "Unknown error")})
 
-        job["progress"] = ((i + 1) / len(video_files)) * 100
+                file_progress[filename] = 100
+                job["progress"] = sum(file_progress.values()) / total
 
     job["status"] = "completed"
     job["current_file"] = None
@@ -677,31 +911,34 @@ async def detect_gopro(request: ScanRequest):
     if not os.path.exists(path):
         raise HTTPException(status_code=404, detail=f"Path not found: {path}")
 
+    return await asyncio.to_thread(_detect_gopro_sync, path)
+
+
+def _detect_gopro_sync(path: str) -> dict:
+    """Blocking body of detect_gopro"""
     gopro_files = []
     total_size = 0
 
-    for root, dirs, filenames in os.walk(path):
-        dirs[:] = [d for d in dirs if not d.startswith(".")]
+    for entry in walk_files_parallel(path):
+        filename = entry.name
+        ext = os.path.splitext(filename)[1].lower()
+        if ext not in VIDEO_EXTENSIONS:
+            continue
 
-        for filename in filenames:
-            ext = os.path.splitext(filename)[1].lower()
-            if ext not in VIDEO_EXTENSIONS:
-                continue
+        filepath = entry.path
 
-            filepath = os.path.join(root, filename)
+        if is_gopro_file(filepath, deep=True):
+            try:
+                size = entry.stat().st_size
+                total_size += size
+            except OSError:
+                size = 0
 
-            if is_gopro_file(filepath):
-                try:
-                    size = os.path.getsize(filepath)
-                    total_size += size
-                except OSError:
-                    size = 0
-
-                gopro_files.append({
-                    "filename": filename,
-                    "path": filepath,
-                    "size": size,
-                })
+            gopro_files.append({
+                "filename": filename,
+                "path": filepath,
+                "size": size,
+            })
 
     return {
         "path": path,
@@ -712,7 +949,7 @@ async def detect_gopro(request: ScanRequest):
 
 
 @router.get("/disk-space")
-async def get_disk_space(path: str = None):
+def get_disk_space(path: str = None):
     """Get disk space information for a path"""
     if path is None:
         path = get_library_path()
@@ -767,65 +1004,164 @@ class ImportRequestV2(BaseModel):
     selected_dates: List[str] = []  # Filter to only import files from these dates (empty = all)
 
 
-def get_file_date_for_import(filepath, ext):
-    """Get file date (EXIF for images, mtime for others)"""
+def get_exif_date(filepath) -> Optional[str]:
+    """Get the EXIF DateTimeOriginal date as YYYY-MM-DD, or None if unavailable"""
+    # JPEGs: read just the APP1 header, skipping Pillow entirely
+    if os.path.splitext(filepath)[1].lower() in (".jpg", ".jpeg"):
+        try:
+            value = read_datetime_original(filepath)
+            return value.split(" ")[0].replace(":", "-") if value else None
+        except (ExifUnsupported, OSError):
+            pass  # Fall back to Pillow
+
+    if not HAS_PIL:
+        return None
     try:
-        mtime = os.path.getmtime(filepath)
-        date_str = datetime.fromtimestamp(mtime).strftime("%Y-%m-%d")
+        # Image.open only reads headers; getexif() parses IFD0 and get_ifd() just
+        # the Exif sub-IFD, rather than _getexif() decoding every IFD into a dict
+        with Image.open(filepath) as img:
+            exif = img.getexif()
+            value = exif.get_ifd(EXIF_IFD_POINTER_TAG).get(EXIF_DATETIME_ORIGINAL_TAG)
+            if not value:
+                # Some writers put it in IFD0
+                value = exif.get(EXIF_DATETIME_ORIGINAL_TAG)
+        if value:
+            # Format: "2024:01:15 14:30:00"
+            return value.split(" ")[0].replace(":", "-")
+    except Exception:
+        pass
+    return None
 
+
+def get_file_date_for_import(filepath, ext, mtime=None):
+    """Get file date (EXIF for images, mtime for others). Pass mtime if already known."""
+    try:
         # Try EXIF for JPEGs
         if ext in IMAGE_EXTENSIONS:
-            try:
-                from PIL import Image
-                from PIL.ExifTags import TAGS
-                with Image.open(filepath) as img:
-                    exif = img._getexif()
-                    if exif:
-                        for tag_id, value in exif.items():
-                            tag = TAGS.get(tag_id, tag_id)
-                            if tag == "DateTimeOriginal":
-                                date_str = value.split(" ")[0].replace(":", "-")
-                                break
-            except Exception:
-                pass
-        return date_str
+            exif_date = get_exif_date(filepath)
+            if exif_date:
+                return exif_date
+
+        if mtime is None:
+            mtime = os.path.getmtime(filepath)
+        return datetime.fromtimestamp(mtime).strftime("%Y-%m-%d")
     except Exception:
         return None
 
 
+def build_date_filter(selected_dates) -> Optional[tuple]:
+    """
+    Prepare a date filter for passes_date_filter, or None if no dates are selected.
+    Each selected date is also turned into a local-time [start, end) timestamp
+    range, so files dated by mtime are checked with a bisect on the raw
+    timestamp instead of formatting a date string for every file.
+    """
+    if not selected_dates:
+        return None
+    ranges = []
+    for date_str in selected_dates:
+        try:
+            day = datetime.strptime(date_str, "%Y-%m-%d")
+        except (TypeError, ValueError):
+            continue
+        ranges.append((day.timestamp(), (day + timedelta(days=1)).timestamp()))
+    ranges.sort()
+    return (
+        frozenset(selected_dates),
+        [start for start, _ in ranges],
+        [end for _, end in ranges],
+    )
+
+
+def passes_date_filter(entry, ext, date_filter) -> bool:
+    """Check a walked file against a build_date_filter() filter (images only)"""
+    if date_filter is None or ext not in PHOTO_EXTENSIONS:
+        return True
+    dates, starts, ends = date_filter
+
+    # EXIF date for JPEGs, file modification time as fallback
+    if ext in IMAGE_EXTENSIONS:
+        exif_date = get_exif_date(entry.path)
+        if exif_date:
+            return exif_date in dates
+    try:
+        mtime = entry.stat().st_mtime
+    except OSError:
+        return True  # Undated files aren't filtered out
+    i = bisect_right(starts, mtime) - 1
+    return i >= 0 and mtime < ends[i]
+
+
 def count_files_to_import(source_path: str, selected_dates_set: set = None, convert_gopro: bool = True):
     """Count how many files will be imported (for progress tracking)"""
     total = 0
     gopro_count = 0
+    date_filter = build_date_filter(selected_dates_set)
+
+    for entry in walk_files(source_path):
+        filename = entry.name
+        filepath = entry.path
+        ext = os.path.splitext(filename)[1].lower()
+        # Skip already converted files
+        if _CONVERTED_NAME_RE.search(filename):
+            continue
 
-    for root, dirs, filenames in os.walk(source_path):
-        dirs[:] = [d for d in dirs if not d.startswith(".")]
+        # Date filter check (for images only)
+        if not passes_date_filter(entry, ext, date_filter):
+            continue
 
-        for filename in filenames:
-            if filename.startswith("."):
-                continue
+        # Count the file
+        if ext in VIDEO_EXTENSIONS and convert_gopro and is_gopro_file(filepath):
+            gopro_count += 1  # Will be handled separately
+        else:
+            total += 1
 
-            filepath = os.path.join(root, filename)
-            ext = os.path.splitext(filename)[1].lower()
-            stem = os.path.splitext(filename)[0]
+    return total, gopro_count
 
-            # Skip already converted files
-            if '_dnxhd' in stem.lower():
-                continue
 
-            # Date filter check (for images only)
-            if selected_dates_set and ext in (IMAGE_EXTENSIONS | RAW_EXTENSIONS):
-                file_date = get_file_date_for_import(filepath, ext)
-                if file_date and file_date not in selected_dates_set:
-                    continue
+def _list_existing_names(folder_path: str) -> set:
+    """
+    Snapshot a destination folder's filenames (lowercased, since Windows and
+    macOS filesystems are case-insensitive) for in-memory duplicate checks.
+    """
+    try:
+        return {name.lower() for name in os.listdir(folder_path)}
+    except OSError:
+        return set()
 
-            # Count the file
-            if ext in VIDEO_EXTENSIONS and convert_gopro and is_gopro_file(filepath):
-                gopro_count += 1  # Will be handled separately
-            else:
-                total += 1
 
-    return total, gopro_count
+@lru_cache(maxsize=32)
+def _file_number_pattern(prefix: str) -> re.Pattern:
+    """Compiled matcher for "<prefix>_<number>[.ext]" (lowercase names)"""
+    return re.compile(rf"{re.escape(prefix.lower())}_(\d+)(?:\.[^.]*)?")
+
+
+def get_next_file_number(names, prefix: str) -> int:
+    """Next free "<prefix>_NNNN" number given a folder's (lowercased) filenames"""
+    if not prefix:
+        return 1
+    fullmatch = _file_number_pattern(prefix).fullmatch
+    return max((int(m.group(1)) for m in map(fullmatch, names) if m), default=0) + 1
+
+
+# Files copied concurrently during an import. Copies are I/O-bound and release
+# the GIL, so overlapping them hides per-file latency on cards, USB and NAS.
+IMPORT_COPY_WORKERS = 8
+
+
+def _import_one_file(filepath: str, dest_path: str, dest_subdir: str, project_path: str, delete_originals: bool):
+    """Copy (or move) one planned file into the project and pre-generate its thumbnail"""
+    if delete_originals:
+        shutil.move(filepath, dest_path)
+    else:
+        copy_file(filepath, dest_path)
+
+    # Pre-generate thumbnail for images/RAWs
+    if dest_subdir in ("RAW", "JPEG"):
+        try:
+            get_or_create_thumbnail(dest_path, project_path)
+        except Exception as thumb_err:
+            print(f"[Import] Thumbnail generation failed for {os.path.basename(dest_path)}: {thumb_err}")
 
 
 def run_import_job(
@@ -844,58 +1180,23 @@ def run_import_job(
     job["status"] = "running"
 
     selected_dates_set = set(selected_dates) if selected_dates else None
+    date_filter = build_date_filter(selected_dates_set)
 
     print(f"[Import] Starting import from {source_path}")
     print(f"[Import] Job ID: {job_id}, Prefix: {file_prefix}")
     if selected_dates_set:
         print(f"[Import] Date filter active: {selected_dates_set}")
 
-    # Get starting file numbers for each category
-    def get_next_file_number(folder_path, prefix):
-        if not os.path.exists(folder_path) or not prefix:
-            return 1
-        max_num = 0
-        for filename in os.listdir(folder_path):
-            if filename.startswith('.'):
-                continue
-            name = os.path.splitext(filename)[0]
-            if name.startswith(prefix + '_'):
-                parts = name.rsplit('_', 1)
-                if len(parts) == 2 and parts[1].isdigit():
-                    max_num = max(max_num, int(parts[1]))
-        return max_num + 1
+    # Snapshot each destination folder once; numbering and duplicate checks
+    # below run against these sets instead of hitting the filesystem per file
+    existing_names = {
+        subdir: _list_existing_names(os.path.join(project_path, subdir))
+        for subdir in PROJECT_SUBDIRS
+    }
 
     counters = {}
     for subdir in PROJECT_SUBDIRS:
-        counters[subdir] = get_next_file_number(
-            os.path.join(project_path, subdir),
-            file_prefix
-        )
-
-    # Load or create metadata
-    metadata_path = os.path.join(project_path, ".metadata.json")
-    if os.path.exists(metadata_path):
-        with open(metadata_path, "r") as f:
-            metadata = json.load(f)
-        metadata["last_import"] = datetime.now().isoformat()
-        if notes:
-            # Append new notes to existing notes
-            existing_notes = metadata.get("notes", "")
-            if existing_notes:
-                timestamp = datetime.now().strftime("%Y-%m-%d")
-                metadata["notes"] = f"{existing_notes}\n\n--- {timestamp} ---\n{notes}"
-            else:
-                metadata["notes"] = notes
-    else:
-        metadata = {
-            "notes": notes,
-            "created": datetime.now().isoformat(),
-            "project_name": os.path.basename(project_path),
-            "culled_files": [],
-            "session_notes": [],
-            "import_source": source_path,
-            "last_import": datetime.now().isoformat(),
-        }
+        counters[subdir] = get_next_file_number(existing_names[subdir], file_prefix)
 
     imported = {"RAW": 0, "JPEG": 0, "Video": 0, "Other": 0}
     gopro_files = []
@@ -903,93 +1204,99 @@ def run_import_job(
     files_processed = 0
     skipped_by_date = 0
 
-    for root, dirs, filenames in os.walk(source_path):
-        dirs[:] = [d for d in dirs if not d.startswith(".")]
-
-        for filename in filenames:
-            if filename.startswith("."):
-                continue
-
-            filepath = os.path.join(root, filename)
-            ext = os.path.splitext(filename)[1].lower()
-            stem = os.path.splitext(filename)[0]
-
-            # Skip already converted files
-            if '_dnxhd' in stem.lower():
-                continue
-
-            # Date filter check (for images only)
-            if selected_dates_set and ext in (IMAGE_EXTENSIONS | RAW_EXTENSIONS):
-                file_date = get_file_date_for_import(filepath, ext)
-                if file_date and file_date not in selected_dates_set:
-                    skipped_by_date += 1
-                    continue
-
-            # Determine destination subdirectory and check for GoPro
-            if ext in RAW_EXTENSIONS:
-                dest_subdir = "RAW"
-            elif ext in IMAGE_EXTENSIONS:
-                dest_subdir = "JPEG"
-            elif ext in VIDEO_EXTENSIONS:
-                dest_subdir = "Video"
-                # Check if GoPro
-                if is_gopro_file(filepath):
-                    if convert_gopro:
-                        gopro_files.append(filepath)
-                        print(f"[Import] Queued GoPro for conversion: {filename}")
-                        continue  # Will be handled by conversion job
-            else:
-                dest_subdir = "Other"
-
-            # Generate new filename with prefix
-            counter = counters[dest_subdir]
-            if file_prefix:
-                new_filename = f"{file_prefix}_{counter:04d}{ext}"
-            else:
-                new_filename = filename
+    # Plan pass: pick every destination name up front, in walk order, so file
+    # numbering stays deterministic even though the copies run concurrently
+    planned = []
+    for entry in walk_files(source_path):
+        filename = entry.name
+        filepath = entry.path
+        ext = os.path.splitext(filename)[1].lower()
+        # Skip already converted files
+        if _CONVERTED_NAME_RE.search(filename):
+            continue
 
-            dest_path = os.path.join(project_path, dest_subdir, new_filename)
+        # Date filter check (for images only)
+        if not passes_date_filter(entry, ext, date_filter):
+            skipped_by_date += 1
+            continue
 
-            # Handle duplicates
-            dup_counter = 1
-            base_new_name = os.path.splitext(new_filename)[0]
-            while os.path.exists(dest_path):
-                new_filename = f"{base_new_name}_{dup_counter}{ext}"
-                dest_path = os.path.join(project_path, dest_subdir, new_filename)
-                dup_counter += 1
+        # Determine destination subdirectory and check for GoPro
+        dest_subdir = _CATEGORY_SUBDIR[_EXT_CATEGORY.get(ext, "other")]
+        if dest_subdir == "Video" and is_gopro_file(filepath):
+            if convert_gopro:
+                gopro_files.append(filepath)
+                print(f"[Import] Queued GoPro for conversion: {filename}")
+                continue  # Will be handled by conversion job
 
+        # Generate new filename with prefix
+        counter = counters[dest_subdir]
+        if file_prefix:
+            new_filename = f"{file_prefix}_{counter:04d}{ext}"
+        else:
+            new_filename = filename
+
+        # Handle duplicates (on disk, or already claimed by an earlier planned file)
+        names = existing_names[dest_subdir]
+        dup_counter = 1
+        base_new_name = os.path.splitext(new_filename)[0]
+        while new_filename.lower() in names:
+            new_filename = f"{base_new_name}_{dup_counter}{ext}"
+            dup_counter += 1
+        names.add(new_filename.lower())
+
+        dest_path = os.path.join(project_path, dest_subdir, new_filename)
+        counters[dest_subdir] += 1
+        planned.append((filepath, filename, dest_subdir, dest_path, new_filename))
+
+    # Copy pass: run the planned copies concurrently, tracking progress here
+    with ThreadPoolExecutor(max_workers=IMPORT_COPY_WORKERS) as pool:
+        futures = {}
+        for filepath, filename, dest_subdir, dest_path, new_filename in planned:
+            print(f"[Import] Copying {filename} -> {dest_subdir}/{new_filename}")
+            future = pool.submit(_import_one_file, filepath, dest_path, dest_subdir, project_path, delete_originals)
+            futures[future] = (filename, dest_subdir)
+
+        for future in as_completed(futures):
+            filename, dest_subdir = futures[future]
             try:
-                print(f"[Import] Copying {filename} -> {dest_subdir}/{new_filename}")
-                if delete_originals:
-                    shutil.move(filepath, dest_path)
-                else:
-                    shutil.copy2(filepath, dest_path)
-                imported[dest_subdir] += 1
-                counters[dest_subdir] += 1
-                files_processed += 1
-
-                # Pre-generate thumbnail for images/RAWs
-                if dest_subdir in ("RAW", "JPEG"):
-                    try:
-                        get_or_create_thumbnail(dest_path, project_path)
-                    except Exception as thumb_err:
-                        print(f"[Import] Thumbnail generation failed for {new_filename}: {thumb_err}")
-
-                # Update job progress
-                if job["total"] > 0:
-                    job["progress"] = (files_processed / job["total"]) * 100
-                job["completed"] = files_processed
-                job["current_file"] = filename
-
+                future.result()
             except Exception as e:
                 print(f"[Import] ERROR copying {filename}: {e}")
                 errors.append({"file": filename, "error": str(e)})
+                continue
+
+            imported[dest_subdir] += 1
+            files_processed += 1
+
+            # Update job progress
+            if job["total"] > 0:
+                job["progress"] = (files_processed / job["total"]) * 100
+            job["completed"] = files_processed
+            job["current_file"] = filename
 
     print(f"[Import] Done! Copied {sum(imported.values())} files, {len(gopro_files)} GoPro queued for conversion, {skipped_by_date} skipped by date filter")
 
-    # Save metadata
-    with open(metadata_path, "w") as f:
-        json.dump(metadata, f, indent=2)
+    # Metadata is only loaded now, so culls made while the import ran are
+    # kept when the save folds the cull log into the file
+    is_new_project = not os.path.exists(get_metadata_path(project_path))
+    with edit_metadata(project_path) as metadata:
+        if not is_new_project:
+            metadata["last_import"] = datetime.now().isoformat()
+            if notes:
+                # Append new notes to existing notes
+                existing_notes = metadata.get("notes", "")
+                if existing_notes:
+                    timestamp = datetime.now().strftime("%Y-%m-%d")
+                    metadata["notes"] = f"{existing_notes}\n\n--- {timestamp} ---\n{notes}"
+                else:
+                    metadata["notes"] = notes
+        else:
+            metadata["notes"] = notes
+            metadata["import_source"] = source_path
+            metadata["last_import"] = datetime.now().isoformat()
+
+    # Source contents may have changed (moved files); don't serve a stale scan
+    invalidate_scan_cache(source_path)
 
     # Update job with final results
     job["imported"] = imported
@@ -1027,9 +1334,10 @@ async def import_files_v2(request: ImportRequestV2, background_tasks: Background
     for subdir in PROJECT_SUBDIRS:
         os.makedirs(os.path.join(project_path, subdir), exist_ok=True)
 
-    # Count files to import (for progress tracking)
+    # Count files to import (for progress tracking) - walks the source, so off the event loop
     selected_dates_set = set(request.selected_dates) if request.selected_dates else None
-    total_files, gopro_count = count_files_to_import(
+    total_files, gopro_count = await asyncio.to_thread(
+        count_files_to_import,
         source_path,
         selected_dates_set,
         request.convert_gopro
@@ -1089,44 +1397,41 @@ def run_gopro_conversion(
     video_dir = os.path.join(project_path, "Video")
 
     try:
-        preset = ConversionPreset(preset_name)
+        preset = resolve_preset(ConversionPreset(preset_name))
     except ValueError:
         preset = ConversionPreset.DNXHD_1080P
 
     settings = PRESETS[preset]
-    counter = start_counter
-    print(f"[Conversion] Using preset: {preset_name}, extension: {settings.extension}")
+    print(f"[Conversion] Using preset: {preset.value}, extension: {settings.extension}")
 
     total_files = len(gopro_files)
 
+    # Assign output names up front, in queue order, so numbering doesn't depend
+    # on which conversion finishes first
+    outputs = []
     for i, input_path in enumerate(gopro_files):
         if file_prefix:
-            output_filename = f"{file_prefix}_{counter:04d}{settings.extension}"
+            outputs.append(f"{file_prefix}_{start_counter + i:04d}{settings.extension}")
         else:
-            output_filename = os.path.splitext(os.path.basename(input_path))[0] + settings.extension
-
-        output_path = os.path.join(video_dir, output_filename)
-
-        job["current_file"] = os.path.basename(input_path)
-        current_file_name = os.path.basename(input_path)
-        print(f"[Conversion] [{i+1}/{total_files}] Converting {current_file_name} -> {output_filename}")
-
-        # Create progress callback with captured values (not references)
-        def make_progress_callback(file_index, file_name, total, job_dict, jid):
-            def update_progress(progress, message):
-                file_progress = (file_index + (progress / 100)) / total * 100
-                job_dict["progress"] = file_progress
-                job_dict["current_message"] = message
-                print(f"[Callback] Job {jid}: file_progress={file_progress:.1f}%, ffmpeg_progress={progress:.1f}%")
-            return update_progress
-
-        progress_cb = make_progress_callback(i, current_file_name, total_files, job, job_id)
-        result = convert_video(input_path, output_path, preset, progress_cb)
+            outputs.append(os.path.splitext(os.path.basename(input_path))[0] + settings.extension)
+
+    # Per-file progress (0-100); overall progress is their average
+    lock = threading.Lock()
+    file_progress = {}
+
+    def report(indices, progress, message):
+        with lock:
+            for i in indices:
+                file_progress[i] = progress
+            overall = sum(file_progress.values()) / total_files
+            job["progress"] = overall
+            job["current_message"] = message
+        print(f"[Callback] Job {job_id}: file_progress={overall:.1f}%, ffmpeg_progress={progress:.1f}%")
 
+    def finish(i, result):
+        input_path, output_filename = gopro_files[i], outputs[i]
         if result["success"]:
             print(f"[Conversion] SUCCESS: {output_filename}")
-            job["completed"] += 1
-            counter += 1
             if delete_originals:
                 try:
                     os.remove(input_path)
@@ -1134,12 +1439,74 @@ def run_gopro_conversion(
                     pass
         else:
             print(f"[Conversion] FAILED: {os.path.basename(input_path)} - {result.get('error', 'Unknown error')}")
-            job["errors"].append({
-                "file": os.path.basename(input_path),
-                "error": result.get("error", "Unknown error")
-            })
 
-        job["progress"] = ((i + 1) / total_files) * 100
+        with lock:
+            if result["success"]:
+                job["completed"] += 1
+            else:
+                job["errors"].append({
+                    "file": os.path.basename(input_path),
+                    "error": result.get("error", "Unknown error")
+                })
+            file_progress[i] = 100
+            job["progress"] = sum(file_progress.values()) / total_files
+
+    def convert_one(i):
+        input_path, output_filename = gopro_files[i], outputs[i]
+        output_path = os.path.join(video_dir, output_filename)
+        with lock:
+            job["current_file"] = os.path.basename(input_path)
+        print(f"[Conversion] [{i+1}/{total_files}] Converting {os.path.basename(input_path)} -> {output_filename}")
+
+        progress_cb = throttle_progress(lambda progress, message: report([i], progress, message))
+        try:
+            return convert_video(input_path, output_path, preset, progress_cb, threads)
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+    def convert_chunk(indices):
+        # Several clips share one ffmpeg process; if the batch fails, redo the
+        # clips one at a time so a single bad file doesn't fail its neighbours
+        if len(indices) > 1:
+            with lock:
+                job["current_file"] = os.path.basename(gopro_files[indices[0]])
+            names = ", ".join(outputs[i] for i in indices)
+            print(f"[Conversion] [{indices[0]+1}-{indices[-1]+1}/{total_files}] Converting batch -> {names}")
+
+            progress_cb = throttle_progress(lambda progress, message: report(indices, progress, message))
+            try:
+                result = convert_video_batch(
+                    [gopro_files[i] for i in indices],
+                    [os.path.join(video_dir, outputs[i]) for i in indices],
+                    preset,
+                    progress_cb,
+                    threads,
+                )
+            except Exception as e:
+                result = {"success": False, "error": str(e)}
+
+            if result["success"]:
+                for i in indices:
+                    finish(i, result)
+                return
+            print(f"[Conversion] Batch failed, converting individually: {result.get('error', 'Unknown error')}")
+
+        for i in indices:
+            finish(i, convert_one(i))
+
+    # Split the queue so every worker gets a chunk, up to GOPRO_BATCH_SIZE clips each
+    workers = max(1, min(total_files, conversion_workers(preset)))
+    threads = encoder_threads(workers)
+    chunk_size = max(1, min(GOPRO_BATCH_SIZE, -(-total_files // workers)))
+    if preset in HARDWARE_PRESETS:
+        # Every input of a batch is its own NVENC session (and CUDA decode),
+        # so one clip per ffmpeg keeps workers within NVENC_MAX_SESSIONS
+        chunk_size = 1
+    chunks = [list(range(start, min(start + chunk_size, total_files))) for start in range(0, total_files, chunk_size)]
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for future in as_completed([pool.submit(convert_chunk, chunk) for chunk in chunks]):
+            future.result()
 
     job["status"] = "completed"
     job["current_file"] = None
@@ -1147,7 +1514,7 @@ def run_gopro_conversion(
 
 
 @router.get("/project-info/{name}")
-async def get_project_info(name: str):
+def get_project_info(name: str):
     """Get info about an existing project for 'add to existing' feature"""
     library_path = get_library_path()
     project_path = os.path.join(library_path, name)
@@ -1155,25 +1522,26 @@ async def get_project_info(name: str):
     if not os.path.exists(project_path):
         raise HTTPException(status_code=404, detail=f"Project not found: {name}")
 
-    metadata_path = os.path.join(project_path, ".metadata.json")
     metadata = {}
-    if os.path.exists(metadata_path):
-        with open(metadata_path, "r") as f:
-            metadata = json.load(f)
+    if os.path.exists(get_metadata_path(project_path)):
+        metadata = load_metadata(project_path)
 
     # Detect file prefix from existing files
     detected_prefix = ""
     for subdir in PROJECT_SUBDIRS:
         subdir_path = os.path.join(project_path, subdir)
-        if os.path.exists(subdir_path):
-            files = [f for f in os.listdir(subdir_path) if not f.startswith('.')]
-            if files:
-                first_file = files[0]
-                name_part = os.path.splitext(first_file)[0]
-                parts = name_part.rsplit('_', 1)
-                if len(parts) == 2 and parts[1].isdigit():
-                    detected_prefix = parts[0]
-                    break
+        try:
+            # Only the first visible file is needed, so stop reading the directory there
+            with os.scandir(subdir_path) as it:
+                first_file = next((e.name for e in it if not e.name.startswith('.')), None)
+        except OSError:
+            continue
+        if first_file:
+            name_part = os.path.splitext(first_file)[0]
+            parts = name_part.rsplit('_', 1)
+            if len(parts) == 2 and parts[1].isdigit():
+                detected_prefix = parts[0]
+                break
 
     return {
         "name": name,
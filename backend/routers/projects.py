@@ -2,12 +2,17 @@
 Project management endpoints for Bridge Burner v2
 """
 import os
-import json
+import glob
 import subprocess
 import shutil
+import threading
+import time
+from contextlib import contextmanager
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from datetime import datetime
-from typing import Optional
-from fastapi import APIRouter, HTTPException, BackgroundTasks
+from functools import lru_cache
+from typing import List, Optional
+from fastapi import APIRouter, HTTPException, BackgroundTasks, Request, Response
 from fastapi.responses import FileResponse
 from pydantic import BaseModel
 
@@ -17,13 +22,16 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config import (
     get_library_path,
     set_library_path,
+    reload_config,
+    json_loads,
+    json_dumps,
     PROJECT_SUBDIRS,
     IMAGE_EXTENSIONS,
     RAW_EXTENSIONS,
     VIDEO_EXTENSIONS,
 )
-from services.files import get_project_files, get_file_info
-from services.thumbnails import get_or_create_thumbnail, get_or_create_preview
+from services.files import get_project_files, get_project_file_entries, get_file_info, get_file_type
+from services.thumbnails import get_or_create_thumbnail, get_or_create_preview, forget_preview, ThumbnailBusy
 
 router = APIRouter()
 
@@ -49,73 +57,359 @@ def get_metadata_path(project_path: str) -> str:
     return os.path.join(project_path, ".metadata.json")
 
 
+def get_cull_log_path(project_path: str) -> str:
+    """Get path to the project's append-only cull/keep log"""
+    return os.path.join(project_path, ".culled.log")
+
+
+# Cull/keep clicks append one "<op><filename>" line to .culled.log instead
+# of rewriting the whole metadata file. load_metadata replays the log over
+# culled_files/kept_files, and save_metadata folds it back into the JSON.
+CULL_OP = "+"  # culled (and no longer kept)
+KEEP_OP = "-"  # kept (and no longer culled)
+# Fold the log into .metadata.json once it grows past this many bytes
+CULL_LOG_COMPACT_SIZE = 64 * 1024
+# Chunk read back from the end of the log when looking for where a torn last
+# record starts
+CULL_LOG_TAIL_READ = 4096
+
+# Serializes metadata writes and log appends (re-entrant so edit_metadata can save)
+_metadata_lock = threading.RLock()
+
+
+def _write_metadata_file(project_path: str, data: bytes) -> None:
+    """Write metadata via a temp file + rename so a crash can't truncate it"""
+    metadata_path = get_metadata_path(project_path)
+    tmp_path = metadata_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, metadata_path)
+    _read_metadata_cached.cache_clear()
+
+
+@lru_cache(maxsize=2048)
+def _read_metadata_cached(metadata_path: str, mtime_ns: int) -> bytes:
+    """Read a metadata file's bytes; keyed on mtime so edits on disk miss the cache"""
+    with open(metadata_path, "rb") as f:
+        return f.read()
+
+
+@lru_cache(maxsize=2048)
+def _read_cull_log_cached(log_path: str, mtime_ns: int, size: int) -> tuple:
+    """Parse a cull log into (op, filename) pairs"""
+    ops = []
+    with open(log_path, "rb") as f:
+        for line in f:
+            # A line without its newline is a torn write from a crash - skip it
+            if len(line) < 2 or not line.endswith(b"\n"):
+                continue
+            op = line[:1].decode("ascii", "replace")
+            if op not in (CULL_OP, KEEP_OP):
+                continue
+            try:
+                ops.append((op, line[1:-1].decode("utf-8")))
+            except UnicodeDecodeError:
+                continue  # Damaged record - don't let it break the project
+    return tuple(ops)
+
+
+def _apply_cull_log(project_path: str, metadata: dict) -> None:
+    """Replay pending cull/keep ops onto metadata's culled/kept lists"""
+    log_path = get_cull_log_path(project_path)
+    try:
+        st = os.stat(log_path)
+    except OSError:
+        return
+    ops = _read_cull_log_cached(log_path, st.st_mtime_ns, st.st_size)
+    if not ops:
+        return
+
+    # dicts as ordered sets, so existing order is kept
+    culled = dict.fromkeys(metadata.get("culled_files", []))
+    kept = dict.fromkeys(metadata.get("kept_files", []))
+    for op, filename in ops:
+        if op == CULL_OP:
+            culled[filename] = None
+            kept.pop(filename, None)
+        else:
+            kept[filename] = None
+            culled.pop(filename, None)
+    metadata["culled_files"] = list(culled)
+    metadata["kept_files"] = list(kept)
+
+
 def load_metadata(project_path: str) -> dict:
     """Load project metadata, creating default if missing"""
     metadata_path = get_metadata_path(project_path)
+    metadata = None
 
-    if os.path.exists(metadata_path):
+    try:
+        mtime_ns = os.stat(metadata_path).st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    if mtime_ns is not None:
         try:
-            with open(metadata_path, "r") as f:
-                return json.load(f)
+            # Only the bytes are cached: callers mutate the dict, and a fresh
+            # parse is cheaper than deep-copying a cached one
+            metadata = json_loads(_read_metadata_cached(metadata_path, mtime_ns))
         except Exception:
             pass
 
-    # Create default metadata
-    return {
-        "notes": "",
-        "created": datetime.now().isoformat(),
-        "project_name": os.path.basename(project_path),
-        "culled_files": [],
-        "session_notes": [],
-    }
+    if metadata is None:
+        # Create default metadata
+        metadata = {
+            "notes": "",
+            "created": datetime.now().isoformat(),
+            "project_name": os.path.basename(project_path),
+            "culled_files": [],
+            "session_notes": [],
+        }
+
+    _apply_cull_log(project_path, metadata)
+    return metadata
 
 
 def save_metadata(project_path: str, metadata: dict) -> None:
-    """Save project metadata"""
-    metadata_path = get_metadata_path(project_path)
-    with open(metadata_path, "w") as f:
-        json.dump(metadata, f, indent=2)
+    """
+    Save project metadata. The metadata should come from load_metadata, as
+    the cull log is folded into it and then removed.
+    """
+    data = json_dumps(metadata, pretty=True)
+    with _metadata_lock:
+        _write_metadata_file(project_path, data)
+        invalidate_project_list()
+        # If we crash before this, replaying the log again is harmless
+        try:
+            os.remove(get_cull_log_path(project_path))
+        except FileNotFoundError:
+            pass
+
+
+def _drop_torn_record(f) -> None:
+    """
+    Cut a last record left without its newline by a crash mid-append, so the
+    next record isn't written onto the end of it
+    """
+    end = f.seek(0, os.SEEK_END)
+    if not end:
+        return
+    f.seek(end - 1)
+    if f.read(1) == b"\n":
+        return
+
+    # Walk back to the end of the last complete record
+    while end:
+        start = max(0, end - CULL_LOG_TAIL_READ)
+        f.seek(start)
+        cut = f.read(end - start).rfind(b"\n")
+        if cut >= 0:
+            f.truncate(start + cut + 1)
+            return
+        end = start
+    f.truncate(0)
+
+
+def append_cull_op(project_path: str, filename: str, op: str) -> None:
+    """Record a cull (CULL_OP) or keep (KEEP_OP) with a single append + fsync"""
+    with _metadata_lock:
+        with open(get_cull_log_path(project_path), "a+b") as f:
+            _drop_torn_record(f)
+            f.write(f"{op}{filename}\n".encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+            log_size = f.tell()
+        invalidate_project_list()
+
+    if log_size > CULL_LOG_COMPACT_SIZE:
+        with edit_metadata(project_path):
+            pass  # Saving folds the log into the JSON
+
+
+@contextmanager
+def edit_metadata(project_path: str):
+    """
+    Load metadata, let the caller modify it, then save it. The lock is held
+    throughout, so a cull/keep appended meanwhile can't be dropped when the
+    save removes the log.
+    """
+    with _metadata_lock:
+        metadata = load_metadata(project_path)
+        yield metadata
+        save_metadata(project_path, metadata)
+
+
+_PROJECT_SUBDIR_NAMES = frozenset(PROJECT_SUBDIRS)
 
 
 def is_valid_project(folder_path: str) -> bool:
     """Check if a folder is a valid project (has required subdirectories)"""
-    if not os.path.isdir(folder_path):
+    # One directory read instead of an isdir() plus an exists() per subdir;
+    # a missing path or a plain file just fails the scandir
+    try:
+        with os.scandir(folder_path) as it:
+            return any(entry.name in _PROJECT_SUBDIR_NAMES and entry.is_dir() for entry in it)
+    except OSError:
         return False
 
-    # Check for project subdirectories
-    for subdir in PROJECT_SUBDIRS:
-        subdir_path = os.path.join(folder_path, subdir)
-        if os.path.exists(subdir_path):
-            return True
-
-    return False
 
-
-def generate_missing_thumbnails(project_path: str, files: list):
-    """Background task to generate thumbnails for files that don't have them yet"""
+# Thumbnail decoding is CPU-bound, so opening a project pre-generates missing
+# thumbnails on a process pool (created on first use, shut down with the app).
+# In-flight jobs are tracked by source path so a second get_project doesn't
+# queue the same file again and a tile request for it waits on that job.
+_thumb_pool = None
+_thumb_pool_lock = threading.RLock()  # Reentrant: submit_thumbnail calls get_thumb_pool under it
+_thumbnail_jobs = {}
+
+
+def get_thumb_pool() -> ProcessPoolExecutor:
+    """Get the shared thumbnail process pool, starting it if needed"""
+    global _thumb_pool
+    with _thumb_pool_lock:
+        if _thumb_pool is None:
+            _thumb_pool = ProcessPoolExecutor(max_workers=os.cpu_count() or 1)
+        return _thumb_pool
+
+
+def shutdown_thumb_pool() -> None:
+    """Stop the thumbnail process pool (called on app shutdown)"""
+    global _thumb_pool
+    with _thumb_pool_lock:
+        if _thumb_pool is not None:
+            _thumb_pool.shutdown(wait=False, cancel_futures=True)
+            _thumb_pool = None
+        _thumbnail_jobs.clear()
+
+
+def submit_thumbnail(filepath: str, project_path: str) -> Future:
+    """
+    Generate a thumbnail on the process pool.
+    Returns a future resolving to the thumbnail path (or None), joining an
+    in-flight job for the same file.
+    """
+    # One critical section from lookup to insert, so two callers can't both
+    # queue the same file
+    with _thumb_pool_lock:
+        future = _thumbnail_jobs.get(filepath)
+        if future is not None:
+            return future
+        future = get_thumb_pool().submit(get_or_create_thumbnail, filepath, project_path)
+        _thumbnail_jobs[filepath] = future
+    future.add_done_callback(lambda f: _thumbnail_jobs.pop(filepath, None))
+    return future
+
+
+def generate_missing_thumbnails(project_path: str, entries: list):
+    """
+    Background task to queue thumbnails for files that don't have an
+    up-to-date one yet. Takes the project's scandir entries, whose stat is
+    already cached from building the file list.
+    """
     from services.thumbnails import get_thumbnail_dir, get_thumbnail_filename
 
+    # Thumbnail name -> mtime of the source it was made from (stamped on it)
     thumb_dir = get_thumbnail_dir(project_path)
-    existing_thumbs = set(os.listdir(thumb_dir)) if os.path.exists(thumb_dir) else set()
+    try:
+        with os.scandir(thumb_dir) as it:
+            existing_thumbs = {entry.name: entry.stat().st_mtime_ns for entry in it}
+    except OSError:
+        existing_thumbs = {}
+
+    for entry in entries:
+        if get_file_type(entry.name) not in ("image", "raw"):
+            continue
+        try:
+            mtime_ns = entry.stat().st_mtime_ns
+        except OSError:
+            continue
+        if existing_thumbs.get(get_thumbnail_filename(entry.path)) != mtime_ns:
+            submit_thumbnail(entry.path, project_path)
 
-    for filepath in files:
-        thumb_filename = get_thumbnail_filename(filepath)
-        if thumb_filename not in existing_thumbs:
-            # Generate the thumbnail
-            get_or_create_thumbnail(filepath, project_path)
+
+# filename -> full path for files already listed or served, per project, so a
+# file request costs one stat instead of one per PROJECT_SUBDIRS entry (and
+# no path building)
+_file_index = {}  # project_path -> {filename: filepath}
+_file_index_lock = threading.Lock()
+
+
+def find_project_file(project_path: str, filename: str) -> Optional[str]:
+    """Return the full path of a file in any of the project's subdirs, or None"""
+    with _file_index_lock:
+        filepath = _file_index.get(project_path, {}).get(filename)
+    if filepath is not None and os.path.exists(filepath):
+        return filepath
+
+    # Index miss or stale entry (file moved/deleted) - refresh the whole index
+    # from the project listing (cached on subdir mtimes), so the requests for
+    # the rest of the grid after a restart hit the index too
+    with _file_index_lock:
+        _file_index.pop(project_path, None)
+    index_project_files(project_path, get_project_files(project_path))
+    with _file_index_lock:
+        return _file_index.get(project_path, {}).get(filename)
+
+
+def index_project_files(project_path: str, files: List[str]) -> None:
+    """Record the full path of each file from a project listing"""
+    entries = {os.path.basename(filepath): filepath for filepath in files}
+    with _file_index_lock:
+        _file_index.setdefault(project_path, {}).update(entries)
+
+
+def forget_project_files(project_path: str, filenames: List[str]) -> None:
+    """Drop index entries for files that were deleted"""
+    with _file_index_lock:
+        index = _file_index.get(project_path)
+        if index:
+            for filename in filenames:
+                index.pop(filename, None)
+
+
+def json_response(content) -> Response:
+    """
+    Render a JSON response with json_dumps (orjson when installed). Returning
+    a Response skips FastAPI's jsonable_encoder walk, which dominates for
+    large file listings; content must already be plain JSON types.
+    """
+    return Response(content=json_dumps(content), media_type="application/json")
+
+
+# Cached list_projects response body: (library path, library dir mtime,
+# listing version) -> rendered JSON. Our own changes bump the version; anything else (files
+# copied in by hand, a running import) shows up within PROJECT_LIST_TTL seconds.
+PROJECT_LIST_TTL = 2.0
+_project_list_cache = {"key": None, "time": 0.0, "body": None}
+_project_list_version = 0
+
+
+def invalidate_project_list() -> None:
+    """Make the next list_projects call rebuild the listing"""
+    global _project_list_version
+    _project_list_version += 1
 
 
 @router.get("")
-async def list_projects():
+def list_projects():
     """List all projects in the library"""
     library_path = get_library_path()
 
-    if not os.path.exists(library_path):
+    try:
+        library_mtime = os.stat(library_path).st_mtime_ns
+    except FileNotFoundError:
         return {"projects": [], "library_path": library_path}
+    key = (library_path, library_mtime, _project_list_version)
+    cache = _project_list_cache
+    if cache["key"] == key and time.monotonic() - cache["time"] < PROJECT_LIST_TTL:
+        return Response(content=cache["body"], media_type="application/json")
+
+    with os.scandir(library_path) as it:
+        folders = [entry for entry in it if entry.is_dir()]
 
     projects = []
-    for name in os.listdir(library_path):
-        project_path = os.path.join(library_path, name)
+    for entry in folders:
+        name, project_path = entry.name, entry.path
         if is_valid_project(project_path):
             metadata = load_metadata(project_path)
             files = get_project_files(project_path)
@@ -131,11 +425,13 @@ async def list_projects():
 
     # Sort by name
     projects.sort(key=lambda p: p["name"].lower())
-    return {"projects": projects, "library_path": library_path}
+    response = json_response({"projects": projects, "library_path": library_path})
+    cache.update(key=key, time=time.monotonic(), body=response.body)
+    return response
 
 
 @router.get("/{name}")
-async def get_project(name: str, background_tasks: BackgroundTasks):
+def get_project(name: str, background_tasks: BackgroundTasks):
     """Get project details and file list"""
     library_path = get_library_path()
     project_path = os.path.join(library_path, name)
@@ -144,12 +440,14 @@ async def get_project(name: str, background_tasks: BackgroundTasks):
         raise HTTPException(status_code=404, detail=f"Project '{name}' not found")
 
     metadata = load_metadata(project_path)
-    files = get_project_files(project_path)
-    culled_files = set(metadata.get("culled_files", []))
-    kept_files = set(metadata.get("kept_files", []))
+    entries = get_project_file_entries(project_path)
+    files = [entry.path for entry in entries]
+    index_project_files(project_path, files)
+    culled_files = frozenset(metadata.get("culled_files", []))
+    kept_files = frozenset(metadata.get("kept_files", []))
 
     # Generate missing thumbnails in background
-    background_tasks.add_task(generate_missing_thumbnails, project_path, files)
+    background_tasks.add_task(generate_missing_thumbnails, project_path, entries)
 
     # Build set of existing GIMP projects and TIFFs for quick lookup
     gimp_temp_dir = os.path.join(project_path, ".gimp_temp")
@@ -164,10 +462,14 @@ async def get_project(name: str, background_tasks: BackgroundTasks):
                 existing_tif.add(base.lower())
 
     file_list = []
-    for filepath in files:
-        info = get_file_info(filepath)
+    culled_count = 0
+    kept_count = 0
+    for entry in entries:
+        info = get_file_info(entry)
         info["culled"] = info["filename"] in culled_files
         info["kept"] = info["filename"] in kept_files
+        culled_count += info["culled"]
+        kept_count += info["kept"]
         # Check if this file has associated GIMP project or TIFF
         base_name = os.path.splitext(info["filename"])[0].lower()
         info["has_xcf"] = base_name in existing_xcf
@@ -177,12 +479,10 @@ async def get_project(name: str, background_tasks: BackgroundTasks):
     # Sort by filename
     file_list.sort(key=lambda f: f["filename"].lower())
 
-    # Calculate stats
-    culled_count = len([f for f in file_list if f["culled"]])
-    kept_count = len([f for f in file_list if f["kept"]])
+    # Stats (culled/kept counted while building the list)
     unassigned_count = len(file_list) - culled_count - kept_count
 
-    return {
+    return json_response({
         "name": name,
         "path": project_path,
         "files": file_list,
@@ -193,11 +493,11 @@ async def get_project(name: str, background_tasks: BackgroundTasks):
             "kept": kept_count,
             "unassigned": unassigned_count,
         },
-    }
+    })
 
 
 @router.delete("/{name}")
-async def delete_project(name: str):
+def delete_project(name: str):
     """Delete an entire project and all its files"""
     library_path = get_library_path()
     project_path = os.path.join(library_path, name)
@@ -207,13 +507,57 @@ async def delete_project(name: str):
 
     try:
         shutil.rmtree(project_path)
+        with _file_index_lock:
+            _file_index.pop(project_path, None)
+        invalidate_project_list()
         return {"success": True, "message": f"Project '{name}' deleted successfully"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to delete project: {str(e)}")
 
 
+# Extension -> Content-Type for the media we serve, so responses don't go
+# through mimetypes (whose answers vary with the OS registry on Windows)
+MEDIA_TYPES = {
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".gif": "image/gif",
+    ".bmp": "image/bmp",
+    ".tif": "image/tiff",
+    ".tiff": "image/tiff",
+    ".webp": "image/webp",
+    ".mp4": "video/mp4",
+    ".mov": "video/quicktime",
+    ".avi": "video/x-msvideo",
+    ".mkv": "video/x-matroska",
+    ".mts": "video/mp2t",
+    ".m2ts": "video/mp2t",
+}
+
+# Cache-Control for responses whose URL carries a version of the source file
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def serve_file(request: Request, path: str, media_type: Optional[str] = None, immutable: bool = False):
+    """
+    FileResponse with an mtime/size ETag, answering If-None-Match with a 304.
+    The stat is handed to FileResponse so it doesn't stat the file again.
+    Plain URLs don't change when a file does, so browsers are told to
+    revalidate; pass immutable=True when the URL is versioned (?v=...) and
+    the browser can keep the response without asking again.
+    """
+    if media_type is None:
+        media_type = MEDIA_TYPES.get(os.path.splitext(path)[1].lower())
+    st = os.stat(path)
+    etag = f'"{st.st_mtime_ns:x}-{st.st_size:x}"'
+    headers = {"ETag": etag, "Cache-Control": IMMUTABLE_CACHE_CONTROL if immutable else "no-cache"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return FileResponse(path, media_type=media_type, headers=headers, stat_result=st)
+
+
 @router.get("/{name}/files/{filename:path}")
-async def get_file(name: str, filename: str):
+def get_file(request: Request, name: str, filename: str):
     """Serve an image/video file (converts RAW to JPEG for browser display)"""
     library_path = get_library_path()
     project_path = os.path.join(library_path, name)
@@ -221,24 +565,41 @@ async def get_file(name: str, filename: str):
     if not is_valid_project(project_path):
         raise HTTPException(status_code=404, detail=f"Project '{name}' not found")
 
-    # Search for file in all subdirectories
-    for subdir in PROJECT_SUBDIRS:
-        filepath = os.path.join(project_path, subdir, filename)
-        if os.path.exists(filepath):
-            # Check if it's a RAW file - need to convert for browser
-            ext = os.path.splitext(filename)[1].lower()
-            if ext in RAW_EXTENSIONS:
-                preview_path = get_or_create_preview(filepath, project_path)
-                if preview_path and os.path.exists(preview_path):
-                    return FileResponse(preview_path, media_type="image/jpeg")
-            # Regular file (JPEG, video, etc) - serve directly
-            return FileResponse(filepath)
+    filepath = find_project_file(project_path, filename)
+    if filepath:
+        # Check if it's a RAW file - need to convert for browser
+        ext = os.path.splitext(filename)[1].lower()
+        if ext in RAW_EXTENSIONS:
+            preview_path = get_or_create_preview(filepath, project_path)
+            if preview_path:
+                try:
+                    return serve_file(request, preview_path, media_type="image/jpeg")
+                except FileNotFoundError:
+                    # Preview cache was cleared; regenerate on the next request
+                    forget_preview(preview_path)
+        # Regular file (JPEG, video, etc) - serve directly
+        return serve_file(request, filepath)
 
     raise HTTPException(status_code=404, detail=f"File '{filename}' not found")
 
 
+# How long a tile request waits for a thumbnail generation slot before
+# answering 429, and the Retry-After it suggests
+THUMBNAIL_WAIT = 30.0
+THUMBNAIL_RETRY_AFTER = 2
+
+
+def _thumbnails_busy() -> HTTPException:
+    """429 telling the grid to retry a tile shortly"""
+    return HTTPException(
+        status_code=429,
+        detail="Too many thumbnails being generated, try again shortly",
+        headers={"Retry-After": str(THUMBNAIL_RETRY_AFTER)},
+    )
+
+
 @router.get("/{name}/thumbnail/{filename:path}")
-async def get_thumbnail(name: str, filename: str):
+def get_thumbnail(request: Request, name: str, filename: str):
     """Serve a thumbnail for an image"""
     library_path = get_library_path()
     project_path = os.path.join(library_path, name)
@@ -246,21 +607,44 @@ async def get_thumbnail(name: str, filename: str):
     if not is_valid_project(project_path):
         raise HTTPException(status_code=404, detail=f"Project '{name}' not found")
 
-    # Search for file in all subdirectories
-    for subdir in PROJECT_SUBDIRS:
-        filepath = os.path.join(project_path, subdir, filename)
-        if os.path.exists(filepath):
-            thumbnail_path = get_or_create_thumbnail(filepath, project_path)
-            if thumbnail_path and os.path.exists(thumbnail_path):
-                return FileResponse(thumbnail_path)
-            # Fall back to original file
-            return FileResponse(filepath)
+    filepath = find_project_file(project_path, filename)
+    if filepath:
+        with _thumb_pool_lock:
+            job = _thumbnail_jobs.get(filepath)
+        thumbnail_path = None
+        if job is not None:
+            # Wait for the pre-generation job already working on this file,
+            # but don't hold a worker thread while it sits behind a long queue
+            try:
+                thumbnail_path = job.result(timeout=THUMBNAIL_WAIT)
+            except FutureTimeoutError:
+                raise _thumbnails_busy()
+            except Exception:
+                pass  # Pool shut down or broken - generate it here instead
+        if thumbnail_path is None:
+            try:
+                thumbnail_path = get_or_create_thumbnail(filepath, project_path, wait=THUMBNAIL_WAIT)
+            except ThumbnailBusy:
+                raise _thumbnails_busy()
+        if thumbnail_path and os.path.exists(thumbnail_path):
+            # The grid requests thumbnails with ?v=<source mtime/size>, so a
+            # changed source gets a new URL
+            versioned = "v" in request.query_params
+            return serve_file(request, thumbnail_path, immutable=versioned)
+        # Fall back to original file
+        return serve_file(request, filepath)
 
     raise HTTPException(status_code=404, detail=f"File '{filename}' not found")
 
 
+def _check_cull_filename(filename: str) -> None:
+    """Reject a filename that would break the one-record-per-line cull log"""
+    if "\n" in filename or "\r" in filename:
+        raise HTTPException(status_code=400, detail="Invalid filename")
+
+
 @router.post("/{name}/cull")
-async def cull_file(name: str, request: CullRequest):
+def cull_file(name: str, request: CullRequest):
     """Mark a file as culled"""
     library_path = get_library_path()
     project_path = os.path.join(library_path, name)
@@ -268,22 +652,15 @@ async def cull_file(name: str, request: CullRequest):
     if not is_valid_project(project_path):
         raise HTTPException(status_code=404, detail=f"Project '{name}' not found")
 
-    metadata = load_metadata(project_path)
-    culled_files = set(metadata.get("culled_files", []))
-    kept_files = set(metadata.get("kept_files", []))
-
-    culled_files.add(request.filename)
-    kept_files.discard(request.filename)  # Remove from kept if it was there
-
-    metadata["culled_files"] = list(culled_files)
-    metadata["kept_files"] = list(kept_files)
-    save_metadata(project_path, metadata)
+    # Also removes it from kept if it was there
+    _check_cull_filename(request.filename)
+    append_cull_op(project_path, request.filename, CULL_OP)
 
     return {"status": "culled", "filename": request.filename}
 
 
 @router.post("/{name}/keep")
-async def keep_file(name: str, request: CullRequest):
+def keep_file(name: str, request: CullRequest):
     """Mark a file as explicitly kept"""
     library_path = get_library_path()
     project_path = os.path.join(library_path, name)
@@ -291,22 +668,51 @@ async def keep_file(name: str, request: CullRequest):
     if not is_valid_project(project_path):
         raise HTTPException(status_code=404, detail=f"Project '{name}' not found")
 
-    metadata = load_metadata(project_path)
-    culled_files = set(metadata.get("culled_files", []))
-    kept_files = set(metadata.get("kept_files", []))
+    # Also removes it from culled if it was there
+    _check_cull_filename(request.filename)
+    append_cull_op(project_path, request.filename, KEEP_OP)
 
-    kept_files.add(request.filename)
-    culled_files.discard(request.filename)  # Remove from culled if it was there
+    return {"status": "kept", "filename": request.filename}
 
-    metadata["culled_files"] = list(culled_files)
-    metadata["kept_files"] = list(kept_files)
-    save_metadata(project_path, metadata)
 
-    return {"status": "kept", "filename": request.filename}
+# Threads used to unlink culled files (I/O-bound, so more than the core count)
+DELETE_WORKERS = 16
+
+
+def _delete_one_file(filepath: Optional[str]) -> Optional[str]:
+    """Delete a project file, returning an error message or None"""
+    if filepath is None:
+        return None  # Already gone
+    try:
+        os.remove(filepath)
+    except FileNotFoundError:
+        pass  # Removed since the listing was taken
+    except Exception as e:
+        return str(e)
+    return None
+
+
+def _delete_files_sync(project_path: str, filenames: List[str]):
+    """Delete files concurrently, return (deleted, errors) like delete_culled reports them"""
+    # One listing up front instead of probing every subdir for each file
+    paths = {os.path.basename(path): path for path in get_project_files(project_path)}
+    deleted = []
+    errors = []
+    with ThreadPoolExecutor(max_workers=DELETE_WORKERS) as pool:
+        results = pool.map(_delete_one_file, [paths.get(filename) for filename in filenames])
+        for filename, error in zip(filenames, results):
+            if error is None:
+                deleted.append(filename)
+            else:
+                errors.append({"filename": filename, "error": error})
+
+    forget_project_files(project_path, deleted)
+    invalidate_project_list()
+    return deleted, errors
 
 
 @router.delete("/{name}/culled")
-async def delete_culled(name: str):
+def delete_culled(name: str):
     """Delete all culled files from a project"""
     library_path = get_library_path()
     project_path = os.path.join(library_path, name)
@@ -314,35 +720,15 @@ async def delete_culled(name: str):
     if not is_valid_project(project_path):
         raise HTTPException(status_code=404, detail=f"Project '{name}' not found")
 
-    metadata = load_metadata(project_path)
-    culled_files = metadata.get("culled_files", [])
+    culled_files = load_metadata(project_path).get("culled_files", [])
 
-    deleted = []
-    errors = []
+    deleted, errors = _delete_files_sync(project_path, culled_files)
 
-    for filename in culled_files:
-        # Search in all subdirectories
-        found = False
-        for subdir in PROJECT_SUBDIRS:
-            filepath = os.path.join(project_path, subdir, filename)
-            if os.path.exists(filepath):
-                try:
-                    os.remove(filepath)
-                    deleted.append(filename)
-                    found = True
-                    break
-                except Exception as e:
-                    errors.append({"filename": filename, "error": str(e)})
-                    found = True
-                    break
-
-        if not found:
-            # File already gone, just remove from list
-            deleted.append(filename)
-
-    # Clear culled files list
-    metadata["culled_files"] = []
-    save_metadata(project_path, metadata)
+    # Clear the files we just handled from the culled list (files culled
+    # while the deletes ran stay culled)
+    handled = set(culled_files)
+    with edit_metadata(project_path) as metadata:
+        metadata["culled_files"] = [f for f in metadata.get("culled_files", []) if f not in handled]
 
     return {
         "deleted": deleted,
@@ -356,6 +742,36 @@ class OpenInAppRequest(BaseModel):
     filepath: str
 
 
+# darktable-cli runs on the request's worker thread; give up after this long
+DARKTABLE_TIMEOUT = 120
+
+# One lock per output TIFF, so a double-click waits for the conversion already
+# running and then reuses its result instead of running darktable twice
+_gimp_convert_locks = {}
+_gimp_convert_locks_lock = threading.Lock()
+
+
+def _format_edit_date(mtime: float) -> str:
+    """Format an edit file's mtime for the open-in-GIMP choices"""
+    return datetime.fromtimestamp(mtime).strftime("%Y-%m-%d %H:%M")
+
+
+def _stat_or_none(path: str) -> Optional[os.stat_result]:
+    """os.stat, or None if the file doesn't exist"""
+    try:
+        return os.stat(path)
+    except FileNotFoundError:
+        return None
+
+
+def _remove_partial_output(path: str) -> None:
+    """Remove a TIFF left behind by a failed conversion (it'd look cached)"""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
 def convert_raw_for_gimp(raw_path: str, project_path: str) -> str:
     """Convert RAW file to TIFF using darktable-cli for GIMP editing"""
     darktable_cli = r"C:\Program Files\darktable\bin\darktable-cli.exe"
@@ -371,11 +787,18 @@ def convert_raw_for_gimp(raw_path: str, project_path: str) -> str:
     base_name = os.path.splitext(os.path.basename(raw_path))[0]
     output_path = os.path.join(temp_dir, f"{base_name}.tif")
 
+    with _gimp_convert_locks_lock:
+        lock = _gimp_convert_locks.setdefault(output_path, threading.Lock())
+    with lock:
+        return _convert_raw_for_gimp_locked(darktable_cli, raw_path, temp_dir, base_name, output_path)
+
+
+def _convert_raw_for_gimp_locked(darktable_cli: str, raw_path: str, temp_dir: str, base_name: str, output_path: str) -> str:
+    """convert_raw_for_gimp body, run while holding the output's lock"""
     # Skip if already converted (use cached version)
-    if os.path.exists(output_path):
-        raw_mtime = os.path.getmtime(raw_path)
-        tif_mtime = os.path.getmtime(output_path)
-        if tif_mtime >= raw_mtime:
+    tif_st = _stat_or_none(output_path)
+    if tif_st is not None:
+        if tif_st.st_mtime >= os.stat(raw_path).st_mtime:
             print(f"[Darktable] Using cached TIFF: {output_path}")
             return output_path
         # RAW is newer, reconvert
@@ -395,21 +818,28 @@ def convert_raw_for_gimp(raw_path: str, project_path: str) -> str:
 
     print(f"[Darktable] Converting {os.path.basename(raw_path)} to TIFF...")
     print(f"[Darktable] cmd: {cmd}")
-    result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=DARKTABLE_TIMEOUT)
+    except subprocess.TimeoutExpired:
+        _remove_partial_output(output_path)
+        raise RuntimeError(f"darktable-cli timed out after {DARKTABLE_TIMEOUT}s")
     print(f"[Darktable] returncode: {result.returncode}")
     print(f"[Darktable] stdout: {result.stdout}")
     print(f"[Darktable] stderr: {result.stderr}")
 
     if result.returncode != 0:
+        _remove_partial_output(output_path)
         raise RuntimeError(f"darktable-cli failed: {result.stderr[:200]}")
 
     # Check for output - darktable creates .tif
     if not os.path.exists(output_path):
-        # Check what files exist
-        files = [f for f in os.listdir(temp_dir) if base_name in f]
-        if files:
-            # Use whatever darktable created
-            output_path = os.path.join(temp_dir, files[0])
+        # darktable may have picked another name (e.g. "<name>_01.tif" when the
+        # target existed) - take the newest TIFF named after the RAW. Only the
+        # numbered suffix is accepted so IMG_1.CR2 doesn't pick up IMG_12.tif
+        prefix = os.path.join(temp_dir, glob.escape(base_name))
+        candidates = glob.glob(prefix + ".tif*") + glob.glob(prefix + "_[0-9]*.tif*")
+        if candidates:
+            output_path = max(candidates, key=os.path.getmtime)
             print(f"[Darktable] Found output: {output_path}")
         else:
             raise RuntimeError(f"Conversion failed - no output file created")
@@ -418,8 +848,25 @@ def convert_raw_for_gimp(raw_path: str, project_path: str) -> str:
     return output_path
 
 
+def _resolve_within(project_path: str, user_path: str) -> str:
+    """
+    Resolve a client-supplied path (absolute, or relative to the project) and
+    make sure it lies inside the project, raising 403 otherwise. Compares
+    whole path components, so a sibling like "<project>-other" doesn't pass.
+    """
+    root = os.path.realpath(project_path)
+    full = os.path.realpath(os.path.join(root, user_path))
+    try:
+        inside = os.path.commonpath([full, root]) == root
+    except ValueError:
+        inside = False  # Different drive on Windows
+    if not inside:
+        raise HTTPException(status_code=403, detail="Access denied - file outside project")
+    return full
+
+
 @router.post("/{name}/open-in-gimp")
-async def open_in_gimp(name: str, request: OpenInAppRequest):
+def open_in_gimp(name: str, request: OpenInAppRequest):
     """Open an image file in GIMP. RAW files are converted via darktable first."""
     library_path = get_library_path()
     project_path = os.path.join(library_path, name)
@@ -428,15 +875,7 @@ async def open_in_gimp(name: str, request: OpenInAppRequest):
         raise HTTPException(status_code=404, detail=f"Project not found: {name}")
 
     # Build full path and validate it's within project
-    filepath = request.filepath
-    if not os.path.isabs(filepath):
-        filepath = os.path.join(project_path, filepath)
-
-    filepath = os.path.normpath(filepath)
-
-    # Security check - must be within project
-    if not filepath.startswith(os.path.normpath(project_path)):
-        raise HTTPException(status_code=403, detail="Access denied - file outside project")
+    filepath = _resolve_within(project_path, request.filepath)
 
     if not os.path.exists(filepath):
         raise HTTPException(status_code=404, detail=f"File not found: {filepath}")
@@ -457,19 +896,20 @@ async def open_in_gimp(name: str, request: OpenInAppRequest):
         xcf_path = os.path.join(temp_dir, f"{base_name}.xcf")
         tif_path = os.path.join(temp_dir, f"{base_name}.tif")
 
-        xcf_exists = os.path.exists(xcf_path)
-        tif_exists = os.path.exists(tif_path)
+        # One stat each gives both existence and the date shown in the choices
+        xcf_st = _stat_or_none(xcf_path)
+        tif_st = _stat_or_none(tif_path)
+        xcf_exists = xcf_st is not None
+        tif_exists = tif_st is not None
 
         print(f"[GIMP] Checking for existing edits: xcf={xcf_exists}, tif={tif_exists}")
 
-        from datetime import datetime
-
         if xcf_exists and tif_exists:
             # Both exist - offer all choices
-            xcf_mtime = os.path.getmtime(xcf_path)
-            tif_mtime = os.path.getmtime(tif_path)
-            xcf_date = datetime.fromtimestamp(xcf_mtime).strftime("%Y-%m-%d %H:%M")
-            tif_date = datetime.fromtimestamp(tif_mtime).strftime("%Y-%m-%d %H:%M")
+            xcf_mtime = xcf_st.st_mtime
+            tif_mtime = tif_st.st_mtime
+            xcf_date = _format_edit_date(xcf_mtime)
+            tif_date = _format_edit_date(tif_mtime)
 
             return {
                 "success": True,
@@ -483,8 +923,8 @@ async def open_in_gimp(name: str, request: OpenInAppRequest):
             }
         elif xcf_exists:
             # XCF exists - offer XCF or rebuild
-            xcf_mtime = os.path.getmtime(xcf_path)
-            xcf_date = datetime.fromtimestamp(xcf_mtime).strftime("%Y-%m-%d %H:%M")
+            xcf_mtime = xcf_st.st_mtime
+            xcf_date = _format_edit_date(xcf_mtime)
 
             return {
                 "success": True,
@@ -497,8 +937,8 @@ async def open_in_gimp(name: str, request: OpenInAppRequest):
             }
         elif tif_exists:
             # TIF exists - offer TIF or rebuild (in case TIF is corrupted)
-            tif_mtime = os.path.getmtime(tif_path)
-            tif_date = datetime.fromtimestamp(tif_mtime).strftime("%Y-%m-%d %H:%M")
+            tif_mtime = tif_st.st_mtime
+            tif_date = _format_edit_date(tif_mtime)
 
             return {
                 "success": True,
@@ -532,7 +972,7 @@ async def open_in_gimp(name: str, request: OpenInAppRequest):
 
 
 @router.post("/{name}/open-in-gimp-direct")
-async def open_in_gimp_direct(name: str, request: OpenInAppRequest):
+def open_in_gimp_direct(name: str, request: OpenInAppRequest):
     """Open a specific file in GIMP (used after user chooses from multiple edits)"""
     library_path = get_library_path()
     project_path = os.path.join(library_path, name)
@@ -540,12 +980,7 @@ async def open_in_gimp_direct(name: str, request: OpenInAppRequest):
     if not os.path.exists(project_path):
         raise HTTPException(status_code=404, detail=f"Project not found: {name}")
 
-    filepath = request.filepath
-    filepath = os.path.normpath(filepath)
-
-    # Security check - must be within project
-    if not filepath.startswith(os.path.normpath(project_path)):
-        raise HTTPException(status_code=403, detail="Access denied - file outside project")
+    filepath = _resolve_within(project_path, request.filepath)
 
     if not os.path.exists(filepath):
         raise HTTPException(status_code=404, detail=f"File not found: {filepath}")
@@ -559,7 +994,7 @@ async def open_in_gimp_direct(name: str, request: OpenInAppRequest):
 
 
 @router.post("/{name}/rebuild-tiff")
-async def rebuild_tiff_for_gimp(name: str, request: OpenInAppRequest):
+def rebuild_tiff_for_gimp(name: str, request: OpenInAppRequest):
     """Rebuild TIFF from RAW and open in GIMP (deletes existing TIF first)"""
     library_path = get_library_path()
     project_path = os.path.join(library_path, name)
@@ -568,14 +1003,7 @@ async def rebuild_tiff_for_gimp(name: str, request: OpenInAppRequest):
         raise HTTPException(status_code=404, detail=f"Project not found: {name}")
 
     # filepath should be the RAW file path
-    filepath = request.filepath
-    if not os.path.isabs(filepath):
-        filepath = os.path.join(project_path, filepath)
-    filepath = os.path.normpath(filepath)
-
-    # Security check - must be within project
-    if not filepath.startswith(os.path.normpath(project_path)):
-        raise HTTPException(status_code=403, detail="Access denied - file outside project")
+    filepath = _resolve_within(project_path, request.filepath)
 
     if not os.path.exists(filepath):
         raise HTTPException(status_code=404, detail=f"RAW file not found: {filepath}")
@@ -621,7 +1049,7 @@ class UpdateNotesRequest(BaseModel):
 
 
 @router.post("/{name}/notes")
-async def update_project_notes(name: str, request: UpdateNotesRequest):
+def update_project_notes(name: str, request: UpdateNotesRequest):
     """Update project notes"""
     library_path = get_library_path()
     project_path = os.path.join(library_path, name)
@@ -629,15 +1057,14 @@ async def update_project_notes(name: str, request: UpdateNotesRequest):
     if not is_valid_project(project_path):
         raise HTTPException(status_code=404, detail=f"Project '{name}' not found")
 
-    metadata = load_metadata(project_path)
-    metadata["notes"] = request.notes
-    save_metadata(project_path, metadata)
+    with edit_metadata(project_path) as metadata:
+        metadata["notes"] = request.notes
 
     return {"success": True, "notes": request.notes}
 
 
 @router.post("/settings/library")
-async def update_library_path(request: SetLibraryRequest):
+def update_library_path(request: SetLibraryRequest):
     """Update the library path setting"""
     path = request.path
 
@@ -656,6 +1083,13 @@ async def update_library_path(request: SetLibraryRequest):
 
 
 @router.get("/settings/library")
-async def get_library_setting():
+def get_library_setting():
     """Get the current library path"""
     return {"path": get_library_path()}
+
+
+@router.post("/settings/reload")
+def reload_settings():
+    """Re-read the config file (after editing it by hand while the app runs)"""
+    reload_config()
+    return {"success": True, "path": get_library_path()}
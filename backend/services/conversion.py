@@ -7,10 +7,28 @@ import subprocess
 import shutil
 import re
 import time
-from typing import Optional, Dict, Any, Callable
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional, Dict, Any, Callable, List, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import json_loads
+
+try:
+    import av
+    HAS_AV = True
+except ImportError:
+    HAS_AV = False
+
+# App root (backend/services/ -> backend/ -> app), resolved once at import
+APP_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 
 class ConversionPreset(Enum):
     """Available conversion presets"""
@@ -22,20 +40,34 @@ class ConversionPreset(Enum):
     PRORES_HQ = "prores_hq"
     H264_HIGH = "h264_high"
     H264_MEDIUM = "h264_medium"
+    H264_FAST = "h264_fast"
     H265_HIGH = "h265_high"
     H265_MEDIUM = "h265_medium"
+    H265_FAST = "h265_fast"
+    H264_NVENC = "h264_nvenc"  # NVIDIA GPU encode
+    HEVC_NVENC = "hevc_nvenc"  # NVIDIA GPU encode
     COPY = "copy"  # Just remux, no transcode
+    AUTO = "auto"  # HEVC_NVENC when a usable GPU is present, else AUTO_FALLBACK_PRESET
+
 
+# Input options placed before each -i to decode on the GPU. "auto" lets ffmpeg
+# pick whatever decoder hardware exists (falling back to software) and hands
+# frames back in system memory for CPU encoders; CUDA keeps decoded frames on
+# the GPU so NVENC encodes them without a copy.
+HWACCEL_AUTO = ("-hwaccel", "auto")
+HWACCEL_CUDA = ("-hwaccel", "cuda", "-hwaccel_output_format", "cuda")
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class ConversionSettings:
-    """Settings for a conversion preset"""
+    """Settings for a conversion preset (shared, so read-only)"""
     name: str
     description: str
     extension: str
-    ffmpeg_args: list
+    ffmpeg_args: Tuple[str, ...]
     estimated_size_multiplier: float  # Relative to source
     estimated_speed: float  # Multiplier vs real-time (0.5 = takes 2x video duration)
+    hwaccel: Tuple[str, ...] = HWACCEL_AUTO  # Decode options per input
 
 
 # Preset configurations
@@ -44,12 +76,12 @@ PRESETS: Dict[ConversionPreset, ConversionSettings] = {
         name="DNxHD 1080p",
         description="Avid DNxHD for 1080p editing (DaVinci Resolve compatible)",
         extension=".mov",
-        ffmpeg_args=[
+        ffmpeg_args=(
             "-c:v", "dnxhd",
             "-profile:v", "dnxhr_hq",
             "-pix_fmt", "yuv422p",
             "-c:a", "pcm_s16le",
-        ],
+        ),
         estimated_size_multiplier=17.0,
         estimated_speed=0.8,  # Fast encode
     ),
@@ -57,12 +89,12 @@ PRESETS: Dict[ConversionPreset, ConversionSettings] = {
         name="DNxHR 4K",
         description="Avid DNxHR for 4K editing (DaVinci Resolve compatible)",
         extension=".mov",
-        ffmpeg_args=[
+        ffmpeg_args=(
             "-c:v", "dnxhd",
             "-profile:v", "dnxhr_hqx",
             "-pix_fmt", "yuv422p10le",
             "-c:a", "pcm_s16le",
-        ],
+        ),
         estimated_size_multiplier=20.0,
         estimated_speed=0.4,  # 4K is slower
     ),
@@ -70,12 +102,12 @@ PRESETS: Dict[ConversionPreset, ConversionSettings] = {
         name="ProRes Proxy",
         description="Apple ProRes Proxy - smallest ProRes, good for offline editing",
         extension=".mov",
-        ffmpeg_args=[
+        ffmpeg_args=(
             "-c:v", "prores_ks",
             "-profile:v", "0",
             "-pix_fmt", "yuv422p10le",
             "-c:a", "pcm_s16le",
-        ],
+        ),
         estimated_size_multiplier=3.0,
         estimated_speed=0.6,
     ),
@@ -83,12 +115,12 @@ PRESETS: Dict[ConversionPreset, ConversionSettings] = {
         name="ProRes LT",
         description="Apple ProRes LT - good balance of quality and size",
         extension=".mov",
-        ffmpeg_args=[
+        ffmpeg_args=(
             "-c:v", "prores_ks",
             "-profile:v", "1",
             "-pix_fmt", "yuv422p10le",
             "-c:a", "pcm_s16le",
-        ],
+        ),
         estimated_size_multiplier=6.0,
         estimated_speed=0.5,
     ),
@@ -96,12 +128,12 @@ PRESETS: Dict[ConversionPreset, ConversionSettings] = {
         name="ProRes 422",
         description="Apple ProRes 422 - standard editing quality",
         extension=".mov",
-        ffmpeg_args=[
+        ffmpeg_args=(
             "-c:v", "prores_ks",
             "-profile:v", "2",
             "-pix_fmt", "yuv422p10le",
             "-c:a", "pcm_s16le",
-        ],
+        ),
         estimated_size_multiplier=10.0,
         estimated_speed=0.4,
     ),
@@ -109,12 +141,12 @@ PRESETS: Dict[ConversionPreset, ConversionSettings] = {
         name="ProRes 422 HQ",
         description="Apple ProRes 422 HQ - high quality mastering",
         extension=".mov",
-        ffmpeg_args=[
+        ffmpeg_args=(
             "-c:v", "prores_ks",
             "-profile:v", "3",
             "-pix_fmt", "yuv422p10le",
             "-c:a", "pcm_s16le",
-        ],
+        ),
         estimated_size_multiplier=15.0,
         estimated_speed=0.35,
     ),
@@ -122,13 +154,13 @@ PRESETS: Dict[ConversionPreset, ConversionSettings] = {
         name="H.264 High Quality",
         description="H.264/AVC - good for sharing, smaller files",
         extension=".mp4",
-        ffmpeg_args=[
+        ffmpeg_args=(
             "-c:v", "libx264",
             "-preset", "slow",
             "-crf", "18",
             "-c:a", "aac",
             "-b:a", "192k",
-        ],
+        ),
         estimated_size_multiplier=0.8,
         estimated_speed=0.3,  # slow preset
     ),
@@ -136,27 +168,41 @@ PRESETS: Dict[ConversionPreset, ConversionSettings] = {
         name="H.264 Medium",
         description="H.264/AVC - balanced quality and size",
         extension=".mp4",
-        ffmpeg_args=[
+        ffmpeg_args=(
             "-c:v", "libx264",
             "-preset", "medium",
             "-crf", "23",
             "-c:a", "aac",
             "-b:a", "128k",
-        ],
+        ),
         estimated_size_multiplier=0.5,
         estimated_speed=0.6,  # medium preset
     ),
+    ConversionPreset.H264_FAST: ConversionSettings(
+        name="H.264 Fast",
+        description="H.264/AVC - quick encode, slightly larger files",
+        extension=".mp4",
+        ffmpeg_args=(
+            "-c:v", "libx264",
+            "-preset", "faster",
+            "-crf", "20",
+            "-c:a", "aac",
+            "-b:a", "192k",
+        ),
+        estimated_size_multiplier=0.7,
+        estimated_speed=1.5,  # faster preset
+    ),
     ConversionPreset.H265_HIGH: ConversionSettings(
         name="H.265 High Quality",
         description="H.265/HEVC - best compression, smaller than H.264",
         extension=".mp4",
-        ffmpeg_args=[
+        ffmpeg_args=(
             "-c:v", "libx265",
             "-preset", "slow",
             "-crf", "20",
             "-c:a", "aac",
             "-b:a", "192k",
-        ],
+        ),
         estimated_size_multiplier=0.5,
         estimated_speed=0.15,  # HEVC slow is very slow
     ),
@@ -164,30 +210,104 @@ PRESETS: Dict[ConversionPreset, ConversionSettings] = {
         name="H.265 Medium",
         description="H.265/HEVC - good compression, fast encode",
         extension=".mp4",
-        ffmpeg_args=[
+        ffmpeg_args=(
             "-c:v", "libx265",
             "-preset", "medium",
             "-crf", "25",
             "-c:a", "aac",
             "-b:a", "128k",
-        ],
+        ),
         estimated_size_multiplier=0.3,
         estimated_speed=0.25,  # HEVC medium
     ),
+    ConversionPreset.H265_FAST: ConversionSettings(
+        name="H.265 Fast",
+        description="H.265/HEVC - quick encode, still smaller than H.264",
+        extension=".mp4",
+        ffmpeg_args=(
+            "-c:v", "libx265",
+            "-preset", "faster",
+            "-crf", "23",
+            "-c:a", "aac",
+            "-b:a", "192k",
+        ),
+        estimated_size_multiplier=0.45,
+        estimated_speed=0.6,  # HEVC faster
+    ),
+    ConversionPreset.H264_NVENC: ConversionSettings(
+        name="H.264 NVENC",
+        description="H.264/AVC on an NVIDIA GPU - fast encode, plays everywhere",
+        extension=".mp4",
+        ffmpeg_args=(
+            "-c:v", "h264_nvenc",
+            "-preset", "p5",
+            "-rc", "vbr",
+            "-cq", "20",
+            "-b:v", "0",
+            "-c:a", "aac",
+            "-b:a", "192k",
+        ),
+        estimated_size_multiplier=0.8,
+        estimated_speed=2.0,  # GPU encode runs well above real-time
+        hwaccel=HWACCEL_CUDA,
+    ),
+    ConversionPreset.HEVC_NVENC: ConversionSettings(
+        name="H.265 NVENC",
+        description="H.265/HEVC on an NVIDIA GPU - fast encode, small files",
+        extension=".mp4",
+        ffmpeg_args=(
+            "-c:v", "hevc_nvenc",
+            "-preset", "p4",
+            "-rc", "vbr",
+            "-cq", "23",
+            "-b:v", "0",
+            "-c:a", "aac",
+            "-b:a", "192k",
+        ),
+        estimated_size_multiplier=0.5,
+        estimated_speed=2.0,  # GPU encode runs well above real-time
+        hwaccel=HWACCEL_CUDA,
+    ),
     ConversionPreset.COPY: ConversionSettings(
         name="Copy (Remux)",
         description="Just copy streams to new container, no re-encoding",
         extension=".mov",
-        ffmpeg_args=[
+        ffmpeg_args=(
             "-c:v", "copy",
             "-c:a", "copy",
-        ],
+        ),
         estimated_size_multiplier=1.0,
         estimated_speed=10.0,  # Very fast, just copying
+        hwaccel=(),  # Nothing is decoded
     ),
 }
 
 
+# What AUTO uses when no NVENC encoder is usable
+AUTO_FALLBACK_PRESET = ConversionPreset.DNXHD_1080P
+
+# Presets that encode on the GPU
+HARDWARE_PRESETS = frozenset({ConversionPreset.H264_NVENC, ConversionPreset.HEVC_NVENC})
+
+# Concurrent NVENC sessions - consumer GeForce cards are driver-limited to a few
+NVENC_MAX_SESSIONS = 2
+
+
+def encoder_thread_args(preset: ConversionPreset, threads: Optional[int]) -> list:
+    """
+    Output options capping a software encoder at `threads` threads, for when
+    several encodes share the CPU. x265 sizes its thread pool separately
+    from -threads. GPU encoders, remuxing and threads=None get nothing
+    (ffmpeg then uses every core).
+    """
+    if threads is None or preset in HARDWARE_PRESETS or preset == ConversionPreset.COPY:
+        return []
+    args = ["-threads", str(threads)]
+    if "libx265" in PRESETS[preset].ffmpeg_args:
+        args += ["-x265-params", f"pools={threads}"]
+    return args
+
+
 def estimate_conversion_time(duration_seconds: float, preset: ConversionPreset) -> float:
     """
     Estimate how long a conversion will take in seconds.
@@ -208,8 +328,9 @@ def estimate_conversion_time(duration_seconds: float, preset: ConversionPreset)
     return duration_seconds / settings.estimated_speed
 
 
+@lru_cache(maxsize=1)
 def find_ffmpeg() -> Optional[str]:
-    """Find ffmpeg executable"""
+    """Find ffmpeg executable (looked up once per run)"""
     # Check if ffmpeg is in PATH
     ffmpeg_path = shutil.which("ffmpeg")
     if ffmpeg_path:
@@ -228,16 +349,16 @@ def find_ffmpeg() -> Optional[str]:
             return path
 
     # Check in app directory
-    app_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    bundled_ffmpeg = os.path.join(app_dir, "ffmpeg", "bin", "ffmpeg.exe")
+    bundled_ffmpeg = os.path.join(APP_DIR, "ffmpeg", "bin", "ffmpeg.exe")
     if os.path.exists(bundled_ffmpeg):
         return bundled_ffmpeg
 
     return None
 
 
+@lru_cache(maxsize=1)
 def get_ffmpeg_version() -> Optional[str]:
-    """Get ffmpeg version string"""
+    """Get ffmpeg version string (run once per process)"""
     ffmpeg = find_ffmpeg()
     if not ffmpeg:
         return None
@@ -259,18 +380,95 @@ def get_ffmpeg_version() -> Optional[str]:
     return None
 
 
-def get_video_info(filepath: str) -> Optional[Dict[str, Any]]:
-    """Get video file information using ffprobe"""
+@lru_cache(maxsize=1)
+def _list_encoders() -> str:
+    """ffmpeg's encoder list (run once per process), or "" if unavailable"""
+    ffmpeg = find_ffmpeg()
+    if not ffmpeg:
+        return ""
+    try:
+        result = subprocess.run(
+            [ffmpeg, "-hide_banner", "-encoders"],
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+        return result.stdout
+    except Exception:
+        return ""
+
+
+@lru_cache(maxsize=None)
+def encoder_available(encoder: str) -> bool:
+    """
+    Check (once per run) whether ffmpeg can actually encode with a hardware
+    encoder. Builds often list the encoder without a GPU to run it on, so a
+    tiny test encode is tried after the encoder-list check.
+    """
+    if encoder not in _list_encoders():
+        return False
+
+    try:
+        result = subprocess.run(
+            [
+                find_ffmpeg(), "-hide_banner", "-loglevel", "error",
+                "-f", "lavfi", "-i", "color=black:s=256x256:d=0.1",
+                "-c:v", encoder, "-f", "null", "-",
+            ],
+            capture_output=True,
+            timeout=30,
+        )
+        return result.returncode == 0
+    except Exception:
+        return False
+
+
+def nvenc_available() -> bool:
+    """Check whether the HEVC_NVENC preset (used by AUTO) can run here"""
+    return encoder_available("hevc_nvenc")
+
+
+def resolve_preset(preset: ConversionPreset) -> ConversionPreset:
+    """Turn AUTO into a concrete preset; other presets are returned unchanged"""
+    if preset != ConversionPreset.AUTO:
+        return preset
+    return ConversionPreset.HEVC_NVENC if nvenc_available() else AUTO_FALLBACK_PRESET
+
+
+@lru_cache(maxsize=1)
+def find_ffprobe() -> Optional[str]:
+    """Find ffprobe executable (looked up once per run)"""
     ffmpeg = find_ffmpeg()
     if not ffmpeg:
         return None
 
     # ffprobe is usually next to ffmpeg
     ffprobe = ffmpeg.replace("ffmpeg.exe", "ffprobe.exe").replace("ffmpeg", "ffprobe")
-    if not os.path.exists(ffprobe):
-        ffprobe = shutil.which("ffprobe")
-        if not ffprobe:
-            return None
+    if os.path.exists(ffprobe):
+        return ffprobe
+    return shutil.which("ffprobe")
+
+
+def get_video_info(filepath: str) -> Optional[Dict[str, Any]]:
+    """
+    Get video file information using ffprobe.
+    Cached on the file's mtime and size, so probing a file again (e.g. a
+    GoPro check followed by its conversion) doesn't spawn ffprobe twice.
+    The returned dict is shared - don't modify it.
+    """
+    try:
+        st = os.stat(filepath)
+    except OSError:
+        return None
+    return _get_video_info_cached(filepath, st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=1024)
+def _get_video_info_cached(filepath: str, mtime_ns: int, size: int) -> Optional[Dict[str, Any]]:
+    """Run ffprobe on a file (cached per mtime/size)"""
+    ffprobe = find_ffprobe()
+    if not ffprobe:
+        return None
 
     try:
         result = subprocess.run(
@@ -283,36 +481,98 @@ def get_video_info(filepath: str) -> Optional[Dict[str, Any]]:
                 filepath,
             ],
             capture_output=True,
-            text=True,
             timeout=30,
         )
         if result.returncode == 0:
-            import json
-            return json.loads(result.stdout)
+            # Parsed straight from the bytes (orjson when installed)
+            return json_loads(result.stdout)
     except Exception:
         pass
 
     return None
 
 
-def is_gopro_file(filepath: str) -> bool:
-    """Check if a file is from a GoPro camera"""
-    filename = os.path.basename(filepath).upper()
+def _av_info(container) -> Dict[str, Any]:
+    """Summarise an open PyAV container in ffprobe's -show_format/-show_streams layout"""
+    streams = []
+    for stream in container.streams:
+        ctx = stream.codec_context
+        entry = {
+            "index": stream.index,
+            "codec_type": stream.type,
+            "codec_name": ctx.name if ctx else None,
+            "tags": dict(stream.metadata),
+        }
+        if stream.type == "video" and ctx:
+            entry.update(width=ctx.width, height=ctx.height, pix_fmt=ctx.pix_fmt)
+        streams.append(entry)
 
-    # GoPro naming patterns: GH010001.MP4, GOPR0001.MP4, GP010001.MP4
-    gopro_patterns = [
-        r"^GH\d{6}\.MP4$",
-        r"^GOPR\d{4}\.MP4$",
-        r"^GP\d{6}\.MP4$",
-        r"^GX\d{6}\.MP4$",
-    ]
+    format_info = {"format_name": container.format.name, "tags": dict(container.metadata)}
+    if container.duration is not None:
+        # ffprobe reports seconds as a string
+        format_info["duration"] = str(container.duration / av.time_base)
+    return {"format": format_info, "streams": streams}
 
-    for pattern in gopro_patterns:
-        if re.match(pattern, filename):
-            return True
+
+def get_video_info_fast(filepath: str) -> Optional[Dict[str, Any]]:
+    """
+    Get video file information in-process through PyAV when it's installed,
+    so a probe doesn't pay for starting an ffprobe process. Only the format
+    duration/tags and basic stream fields are filled in.
+    Falls back to get_video_info (ffprobe) without PyAV or if PyAV can't
+    open the file.
+    """
+    if HAS_AV:
+        try:
+            with av.open(filepath) as container:
+                return _av_info(container)
+        except Exception:
+            pass
+    return get_video_info(filepath)
+
+
+# Concurrent probes in get_video_info_many
+PROBE_WORKERS = 8
+
+
+def get_video_info_many(filepaths: List[str]) -> List[Optional[Dict[str, Any]]]:
+    """
+    get_video_info_fast for several files, probing them concurrently (process
+    start-up dominates an ffprobe run, especially on Windows). Results are in
+    the order of filepaths.
+    """
+    if len(filepaths) <= 1:
+        return [get_video_info_fast(path) for path in filepaths]
+    with ThreadPoolExecutor(max_workers=min(PROBE_WORKERS, len(filepaths))) as pool:
+        return list(pool.map(get_video_info_fast, filepaths))
+
+
+# GoPro naming patterns: GH010001.MP4, GOPR0001.MP4, GP010001.MP4, GX010001.MP4
+GOPRO_FILENAME_RE = re.compile(r"^(?:GH\d{6}|GOPR\d{4}|GP\d{6}|GX\d{6})\.MP4$", re.IGNORECASE)
+
+# Looser GoPro-style names (other series/containers). Only these are worth the
+# ffprobe metadata check - every other video is assumed not to be a GoPro file,
+# which avoids spawning ffprobe once per video when scanning a mixed card.
+GOPRO_CANDIDATE_RE = re.compile(r"^(?:GX|GH|GP|GOPR|GL)\w*\.(?:mp4|mov|lrv|thm|360)$", re.IGNORECASE)
+
+
+def is_gopro_file(filepath: str, deep: bool = False) -> bool:
+    """
+    Check if a file is from a GoPro camera.
+    By default only the filename is checked, so scans and imports never spawn
+    ffprobe. With deep=True (explicit GoPro detection), GoPro-like names that
+    don't match the standard pattern also get an ffprobe metadata check.
+    """
+    filename = os.path.basename(filepath)
+
+    if GOPRO_FILENAME_RE.match(filename):
+        return True
+
+    if not deep or not GOPRO_CANDIDATE_RE.match(filename):
+        return False
 
     # Also check metadata if available
-    info = get_video_info(filepath)
+    info = get_video_info_fast(filepath)
     if info:
         format_info = info.get("format", {})
         tags = format_info.get("tags", {})
@@ -322,11 +582,37 @@ def is_gopro_file(filepath: str) -> bool:
     return False
 
 
+# Minimum seconds between progress reports passed through throttle_progress
+PROGRESS_MIN_INTERVAL = 0.25
+
+
+def throttle_progress(
+    callback: Callable[[float, str], None],
+    min_interval: float = PROGRESS_MIN_INTERVAL,
+) -> Callable[[float, str], None]:
+    """
+    Wrap a progress callback so it runs at most once per min_interval seconds.
+    The final 100% report is always delivered.
+    """
+    last_call = float("-inf")
+
+    def throttled(progress: float, message: str) -> None:
+        nonlocal last_call
+        now = time.monotonic()
+        if progress < 100 and now - last_call < min_interval:
+            return
+        last_call = now
+        callback(progress, message)
+
+    return throttled
+
+
 def convert_video(
     input_path: str,
     output_path: str,
     preset: ConversionPreset = ConversionPreset.DNXHD_1080P,
     progress_callback: Optional[Callable[[float, str], None]] = None,
+    threads: Optional[int] = None,
 ) -> Dict[str, Any]:
     """
     Convert a video file using ffmpeg.
@@ -336,6 +622,7 @@ def convert_video(
         output_path: Path for output video (extension will be adjusted based on preset)
         preset: Conversion preset to use
         progress_callback: Optional callback(progress_percent, status_message) - called periodically during conversion
+        threads: Encoder threads when other conversions run alongside (None = all cores)
 
     Returns:
         Dict with success status, output_path, duration, and estimated_time
@@ -347,6 +634,7 @@ def convert_video(
     if not os.path.exists(input_path):
         return {"success": False, "error": f"Input file not found: {input_path}"}
 
+    preset = resolve_preset(preset)
     settings = PRESETS[preset]
 
     # Ensure output has correct extension
@@ -359,7 +647,7 @@ def convert_video(
     # Get input file info
     input_size = os.path.getsize(input_path)
     duration = None
-    info = get_video_info(input_path)
+    info = get_video_info_fast(input_path)
     if info:
         format_info = info.get("format", {})
         duration = float(format_info.get("duration", 0))
@@ -367,12 +655,14 @@ def convert_video(
     # Estimate output size for progress tracking
     estimated_output_size = input_size * settings.estimated_size_multiplier
 
-    # Build ffmpeg command (no progress flag - we'll monitor file size instead)
+    # Build ffmpeg command (_run_ffmpeg adds the progress/logging flags)
     cmd = [
         ffmpeg,
         "-y",  # Overwrite output
+        *settings.hwaccel,
         "-i", input_path,
         *settings.ffmpeg_args,
+        *encoder_thread_args(preset, threads),
         output_path,
     ]
 
@@ -381,35 +671,10 @@ def convert_video(
         print(f"[FFmpeg] Duration: {duration}s, Input size: {input_size / 1024 / 1024:.1f}MB")
         print(f"[FFmpeg] Estimated output: {estimated_output_size / 1024 / 1024:.1f}MB")
 
-        process = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        )
-
-        # Monitor progress using time-based estimation
-        # File size monitoring is unreliable due to OS buffering
-        start_time = time.time()
         estimated_duration = estimate_conversion_time(duration, preset) if duration else 60
-        last_print_progress = -1
-
-        while process.poll() is None:
-            time.sleep(0.5)
-            elapsed = time.time() - start_time
-            progress = min(95, (elapsed / estimated_duration) * 100)  # Cap at 95% until done
-
-            if progress_callback:
-                progress_callback(progress, f"Converting... {progress:.1f}%")
-            if int(progress / 5) > int(last_print_progress / 5):
-                print(f"[FFmpeg] Progress: {progress:.1f}% (elapsed: {elapsed:.0f}s / est: {estimated_duration:.0f}s)")
-                last_print_progress = progress
-
-        print(f"[FFmpeg] Process finished with code: {process.returncode}")
+        returncode, stderr = _run_ffmpeg(cmd, duration, estimated_duration, progress_callback)
 
-        if process.returncode == 0:
-            # Final callback at 100%
-            if progress_callback:
-                progress_callback(100, "Complete")
+        if returncode == 0:
             return {
                 "success": True,
                 "output_path": output_path,
@@ -417,7 +682,6 @@ def convert_video(
                 "duration": duration,
             }
         else:
-            stderr = process.stderr.read().decode() if process.stderr else ""
             return {
                 "success": False,
                 "error": f"ffmpeg failed: {stderr[:500]}",
@@ -427,9 +691,165 @@ def convert_video(
         return {"success": False, "error": str(e)}
 
 
+# Read buffer for ffmpeg's -progress pipe
+FFMPEG_PIPE_BUFSIZE = 1 << 20
+
+# Lines of ffmpeg's stderr kept for the error message of a failed run
+FFMPEG_STDERR_TAIL_LINES = 50
+
+# Seconds between ffmpeg's -progress reports (its default is 0.5)
+FFMPEG_PROGRESS_PERIOD = 1
+
+
+def _run_ffmpeg(
+    cmd: list,
+    duration: Optional[float],
+    estimated_duration: float,
+    progress_callback: Optional[Callable[[float, str], None]] = None,
+):
+    """
+    Run an ffmpeg command, reporting progress while it runs.
+    Progress comes from ffmpeg's -progress key=value stream on stdout: the
+    encoded position (out_time_us) against the input duration. If the duration
+    is unknown, it falls back to elapsed time against estimated_duration.
+    Returns (returncode, stderr text).
+    """
+    # Machine-readable progress on stdout; stderr only carries errors
+    cmd = [
+        cmd[0], "-hide_banner", "-nostats", "-loglevel", "error",
+        "-progress", "pipe:1", "-stats_period", str(FFMPEG_PROGRESS_PERIOD),
+        *cmd[1:],
+    ]
+    process = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        bufsize=FFMPEG_PIPE_BUFSIZE,
+    )
+
+    # A damaged input can make ffmpeg log an error per frame; drain stderr on
+    # its own thread so a full pipe can't stall ffmpeg (and the progress loop
+    # below), keeping only the tail for the error message
+    stderr_tail = deque(maxlen=FFMPEG_STDERR_TAIL_LINES)
+    stderr_thread = threading.Thread(target=stderr_tail.extend, args=(process.stderr,), daemon=True)
+    stderr_thread.start()
+
+    start_time = time.time()
+    last_print_progress = -1
+    out_time = 0.0
+
+    # ffmpeg writes a block of key=value lines every FFMPEG_PROGRESS_PERIOD,
+    # each ending in progress=continue (or progress=end for the last one).
+    # Keys are collected until that sentinel, so the callback fires once per
+    # block. The loop is bound by the pipe, not by the per-line parsing.
+    for line in process.stdout:
+        key, _, value = line.decode("utf-8", "replace").strip().partition("=")
+        if key == "out_time_us":
+            try:
+                out_time = int(value) / 1_000_000
+            except ValueError:
+                pass  # "N/A" before the first frame
+            continue
+        if key != "progress":
+            continue
+
+        elapsed = time.time() - start_time
+        if duration:
+            progress = min(99, (out_time / duration) * 100)  # 100 is reported once ffmpeg exits cleanly
+        else:
+            progress = min(95, (elapsed / estimated_duration) * 100)
+
+        if progress_callback:
+            progress_callback(progress, f"Converting... {progress:.1f}%")
+        if int(progress / 5) > int(last_print_progress / 5):
+            print(f"[FFmpeg] Progress: {progress:.1f}% (elapsed: {elapsed:.0f}s)")
+            last_print_progress = progress
+
+    process.wait()
+    stderr_thread.join()
+    stderr = b"".join(stderr_tail).decode("utf-8", "replace")
+    print(f"[FFmpeg] Process finished with code: {process.returncode}")
+
+    if process.returncode == 0:
+        # Final callback at 100%
+        if progress_callback:
+            progress_callback(100, "Complete")
+        return 0, ""
+
+    return process.returncode, stderr
+
+
+def convert_video_batch(
+    input_paths: List[str],
+    output_paths: List[str],
+    preset: ConversionPreset = ConversionPreset.DNXHD_1080P,
+    progress_callback: Optional[Callable[[float, str], None]] = None,
+    threads: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Convert several videos with one ffmpeg process (one input/output pair each).
+    Saves a process start and codec setup per file, which matters for short
+    clips. The batch succeeds or fails as a whole - on failure callers should
+    retry the files one at a time with convert_video. threads is shared by
+    the batch's encoders, which run side by side.
+
+    Returns:
+        Dict with success status and output_paths (or error)
+    """
+    ffmpeg = find_ffmpeg()
+    if not ffmpeg:
+        return {"success": False, "error": "ffmpeg not found"}
+
+    for input_path in input_paths:
+        if not os.path.exists(input_path):
+            return {"success": False, "error": f"Input file not found: {input_path}"}
+
+    preset = resolve_preset(preset)
+    settings = PRESETS[preset]
+    output_paths = [os.path.splitext(path)[0] + settings.extension for path in output_paths]
+    for output_path in output_paths:
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+
+    # Inputs are encoded side by side: ffmpeg's reported position runs to the
+    # longest input, while wall time is about the sum of single-file estimates
+    durations = []
+    estimated_duration = 0
+    for info in get_video_info_many(input_paths):
+        duration = float(info.get("format", {}).get("duration", 0)) if info else 0
+        durations.append(duration)
+        estimated_duration += estimate_conversion_time(duration, preset) if duration else 60
+    longest = max(durations) if all(durations) else None
+
+    thread_args = encoder_thread_args(preset, threads and max(1, threads // len(input_paths)))
+    cmd = [ffmpeg, "-y"]
+    for input_path in input_paths:
+        cmd += [*settings.hwaccel, "-i", input_path]
+    for index, output_path in enumerate(output_paths):
+        # Explicit maps so each output only takes its own input's streams
+        cmd += ["-map", f"{index}:v:0", "-map", f"{index}:a:0?", *settings.ffmpeg_args, *thread_args, output_path]
+
+    try:
+        print(f"[FFmpeg] Starting batch of {len(input_paths)}: {', '.join(os.path.basename(p) for p in input_paths)}")
+        returncode, stderr = _run_ffmpeg(cmd, longest, estimated_duration, progress_callback)
+
+        if returncode == 0:
+            return {
+                "success": True,
+                "output_paths": output_paths,
+                "preset": preset.value,
+            }
+        return {
+            "success": False,
+            "error": f"ffmpeg failed: {stderr[:500]}",
+        }
+
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+
+
 def get_presets_list() -> list:
     """Get list of available presets for the frontend"""
-    return [
+    presets = [
         {
             "id": preset.value,
             "name": settings.name,
@@ -439,3 +859,12 @@ def get_presets_list() -> list:
         }
         for preset, settings in PRESETS.items()
     ]
+    fallback = PRESETS[AUTO_FALLBACK_PRESET]
+    presets.append({
+        "id": ConversionPreset.AUTO.value,
+        "name": "Auto",
+        "description": f"H.265 NVENC on an NVIDIA GPU, otherwise {fallback.name}",
+        "extension": fallback.extension,
+        "size_multiplier": fallback.estimated_size_multiplier,
+    })
+    return presets
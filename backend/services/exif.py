@@ -0,0 +1,146 @@
+"""
+Minimal EXIF reader for Bridge Burner v2
+Reads DateTimeOriginal straight from a JPEG's APP1 segment without going
+through Pillow's decoder setup - only the first 64 KB of the file is read.
+Also reads a JPEG's dimensions from its frame header.
+"""
+import struct
+from typing import Optional, Tuple
+
+# EXIF lives in the first APP1 segment, which is capped at 64 KB
+HEADER_READ_SIZE = 65536
+
+EXIF_IFD_POINTER_TAG = 0x8769
+DATETIME_ORIGINAL_TAG = 0x9003
+
+# TIFF field types we need: ASCII (2) and LONG (4)
+TYPE_ASCII = 2
+TYPE_LONG = 4
+
+# Start-of-frame markers: every SOFn except DHT (0xC4), JPG (0xC8) and DAC (0xCC)
+SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+class ExifUnsupported(Exception):
+    """The file isn't something this reader can parse (caller should fall back)"""
+
+
+def _find_ifd_entry(data: bytes, tiff_start: int, ifd_offset: int, tag: int, endian: str):
+    """Return (type, count, value_field_pos) for a tag in an IFD, or None"""
+    pos = tiff_start + ifd_offset
+    (num_entries,) = struct.unpack_from(endian + "H", data, pos)
+    pos += 2
+    for _ in range(num_entries):
+        entry_tag, entry_type, count = struct.unpack_from(endian + "HHI", data, pos)
+        if entry_tag == tag:
+            return entry_type, count, pos + 8
+        pos += 12
+    return None
+
+
+def _read_tiff_datetime_original(data: bytes, tiff_start: int) -> Optional[str]:
+    """Walk IFD0 -> Exif IFD -> DateTimeOriginal in a TIFF structure"""
+    byte_order = data[tiff_start:tiff_start + 2]
+    if byte_order == b"II":
+        endian = "<"
+    elif byte_order == b"MM":
+        endian = ">"
+    else:
+        raise ExifUnsupported("bad TIFF byte order")
+
+    magic, ifd0_offset = struct.unpack_from(endian + "HI", data, tiff_start + 2)
+    if magic != 42:
+        raise ExifUnsupported("bad TIFF magic")
+
+    entry = _find_ifd_entry(data, tiff_start, ifd0_offset, EXIF_IFD_POINTER_TAG, endian)
+    if entry is None:
+        return None
+    entry_type, count, value_pos = entry
+    if entry_type != TYPE_LONG:
+        raise ExifUnsupported("unexpected Exif IFD pointer type")
+    (exif_ifd_offset,) = struct.unpack_from(endian + "I", data, value_pos)
+
+    entry = _find_ifd_entry(data, tiff_start, exif_ifd_offset, DATETIME_ORIGINAL_TAG, endian)
+    if entry is None:
+        return None
+    entry_type, count, value_pos = entry
+    if entry_type != TYPE_ASCII:
+        return None
+    if count > 4:
+        # Value doesn't fit inline - the field holds an offset from the TIFF header
+        (value_offset,) = struct.unpack_from(endian + "I", data, value_pos)
+        value_pos = tiff_start + value_offset
+    raw = data[value_pos:value_pos + count]
+    if len(raw) < count:
+        raise ExifUnsupported("value past end of header read")
+    return raw.split(b"\x00", 1)[0].decode("ascii", "replace") or None
+
+
+def read_datetime_original(filepath: str) -> Optional[str]:
+    """
+    Read the EXIF DateTimeOriginal string (e.g. "2024:01:15 14:30:00") from a JPEG.
+
+    Returns None if the JPEG has no EXIF date. Raises ExifUnsupported if the
+    file isn't a JPEG or the EXIF data couldn't be parsed from the header, so
+    callers can fall back to a full reader like Pillow.
+    """
+    with open(filepath, "rb") as f:
+        data = f.read(HEADER_READ_SIZE)
+
+    if data[:2] != b"\xff\xd8":
+        raise ExifUnsupported("not a JPEG")
+
+    try:
+        pos = 2
+        while pos + 2 <= len(data):
+            if data[pos] != 0xFF:
+                raise ExifUnsupported("lost marker sync")
+            marker = data[pos + 1]
+            if marker == 0xFF:
+                # Fill byte
+                pos += 1
+                continue
+            if marker == 0xDA or marker == 0xD9:
+                # Start of scan / end of image - no EXIF before image data
+                return None
+            (length,) = struct.unpack_from(">H", data, pos + 2)
+            if marker == 0xE1 and data[pos + 4:pos + 10] == b"Exif\x00\x00":
+                return _read_tiff_datetime_original(data, pos + 10)
+            pos += 2 + length
+    except struct.error:
+        raise ExifUnsupported("EXIF extends past header read")
+
+    raise ExifUnsupported("EXIF segment not within header read")
+
+
+def read_jpeg_size(data: bytes) -> Optional[Tuple[int, int]]:
+    """
+    Read (width, height) from the start-of-frame header of JPEG data.
+    Returns None if the data isn't a JPEG or no frame header comes before
+    the image data.
+    """
+    if data[:2] != b"\xff\xd8":
+        return None
+
+    try:
+        pos = 2
+        while pos + 4 <= len(data):
+            if data[pos] != 0xFF:
+                return None
+            marker = data[pos + 1]
+            if marker == 0xFF:
+                # Fill byte
+                pos += 1
+                continue
+            if marker == 0xDA or marker == 0xD9:
+                return None
+            if marker in SOF_MARKERS:
+                # Length (2), sample precision (1), then height and width
+                height, width = struct.unpack_from(">HH", data, pos + 5)
+                return width, height
+            (length,) = struct.unpack_from(">H", data, pos + 2)
+            pos += 2 + length
+    except struct.error:
+        return None
+
+    return None
@@ -2,7 +2,10 @@
 File handling utilities for Bridge Burner v2
 """
 import os
-from typing import List, Dict, Any
+import shutil
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import List, Dict, Any, Iterator, Tuple, Union
 
 import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -12,31 +15,167 @@ from config import (
     IMAGE_EXTENSIONS,
     RAW_EXTENSIONS,
     VIDEO_EXTENSIONS,
+    ALL_MEDIA_EXTENSIONS,
 )
 
+try:
+    import fcntl
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False  # Windows
+
+# Linux ioctl that makes dst share src's extents (a reflink, like cp --reflink)
+FICLONE = 0x40049409
+
+# Threads used by walk_files_parallel
+SCAN_WORKERS = 8
+
+
+# Lowercase extension -> file type, so classifying a file is one dict lookup
+_EXT_FILE_TYPE = {
+    **{ext: "video" for ext in VIDEO_EXTENSIONS},
+    **{ext: "raw" for ext in RAW_EXTENSIONS},
+    **{ext: "image" for ext in IMAGE_EXTENSIONS},
+}
+
+
+def _ext_lower(filename: str) -> str:
+    """Lowercased extension including the dot ("" if none) - for bare file names"""
+    _, dot, ext = filename.rpartition(".")
+    return "." + ext.lower() if dot else ""
+
 
 def get_file_type(filename: str) -> str:
     """Determine file type based on extension"""
-    ext = os.path.splitext(filename)[1].lower()
+    return _EXT_FILE_TYPE.get(_ext_lower(filename), "other")
+
+
+def _scan_dir(path: str):
+    """
+    List one directory for walk_files.
+    Returns (file entries, subdirectory paths), skipping hidden entries and
+    not following symlinked directories (same as os.walk).
+    """
+    try:
+        with os.scandir(path) as it:
+            entries = list(it)
+    except OSError:
+        return [], []
+
+    files = []
+    subdirs = []
+    for entry in entries:
+        if entry.name.startswith("."):
+            continue
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            continue
+        if is_dir:
+            if not entry.is_symlink():
+                subdirs.append(entry.path)
+        else:
+            files.append(entry)
+    return files, subdirs
+
+
+def _scan_dir_with_stat(path: str):
+    """_scan_dir that also warms each entry's stat cache (for worker threads)"""
+    files, subdirs = _scan_dir(path)
+    for entry in files:
+        try:
+            entry.stat()
+        except OSError:
+            pass
+    return files, subdirs
+
+
+def walk_files(root: str) -> Iterator[os.DirEntry]:
+    """
+    Recursively yield DirEntry objects for all non-hidden files under root.
+    Hidden directories are skipped and symlinked directories aren't followed
+    (same as os.walk). Uses os.scandir directly so callers can read
+    entry.stat() from the directory listing instead of a separate stat per file.
+    """
+    stack = [root]
+    while stack:
+        files, subdirs = _scan_dir(stack.pop())
+        yield from files
+        # Reversed so subdirectories are visited in listing order
+        stack.extend(reversed(subdirs))
+
 
-    if ext in IMAGE_EXTENSIONS:
-        return "image"
-    elif ext in RAW_EXTENSIONS:
-        return "raw"
-    elif ext in VIDEO_EXTENSIONS:
-        return "video"
-    else:
-        return "other"
+def walk_files_parallel(root: str, max_workers: int = SCAN_WORKERS) -> List[os.DirEntry]:
+    """
+    Like walk_files, but lists directories concurrently on a thread pool.
+    Directory listing and stat are latency-bound (SD cards, NAS) and release
+    the GIL, so overlapping them speeds up large trees. Each entry's stat() is
+    already cached when returned. Results are sorted by path since completion
+    order is nondeterministic.
+    """
+    files = []
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        pending = {pool.submit(_scan_dir_with_stat, root)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                dir_files, subdirs = future.result()
+                files.extend(dir_files)
+                pending.update(pool.submit(_scan_dir_with_stat, d) for d in subdirs)
+
+    files.sort(key=lambda entry: entry.path)
+    return files
 
 
-def get_file_info(filepath: str) -> Dict[str, Any]:
-    """Get information about a file"""
-    filename = os.path.basename(filepath)
-    ext = os.path.splitext(filename)[1].lower()
-    file_type = get_file_type(filename)
+def copy_file(src: str, dst: str) -> None:
+    """
+    Copy a file with metadata, like shutil.copy2.
+    On Linux this first tries a FICLONE reflink, which on Btrfs/XFS makes the
+    copy a metadata-only operation. Otherwise copy_file_range does the copy in
+    the kernel (and lets NFS 4.2 etc. copy server-side) instead of streaming
+    data through userspace. Anything else, or a failure of both, falls back
+    to shutil.copy2.
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                if HAS_FCNTL and remaining:
+                    try:
+                        fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+                        remaining = 0
+                    except OSError:
+                        pass  # No reflink support here, or src/dst on different filesystems
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        # Some filesystems report 0 instead of failing; never
+                        # keep a short copy - redo it the portable way
+                        raise OSError("copy_file_range made no progress")
+                    remaining -= copied
+            shutil.copystat(src, dst)
+            return
+        except OSError:
+            # e.g. EXDEV on older kernels or ENOSYS - use the portable path
+            pass
+    shutil.copy2(src, dst)
+
+
+def get_file_info(file: Union[str, os.DirEntry]) -> Dict[str, Any]:
+    """
+    Get information about a file.
+    Accepts a path or a DirEntry from get_project_file_entries; a DirEntry's
+    stat comes from the directory listing where the OS provides it (Windows)
+    and is cached on the entry either way.
+    """
+    is_entry = isinstance(file, os.DirEntry)
+    filepath = file.path if is_entry else file
+    filename = file.name if is_entry else os.path.basename(filepath)
+    ext = _ext_lower(filename)
+    file_type = _EXT_FILE_TYPE.get(ext, "other")
 
     try:
-        stat = os.stat(filepath)
+        stat = file.stat() if is_entry else os.stat(filepath)
         size = stat.st_size
         modified = stat.st_mtime
     except Exception:
@@ -59,35 +198,53 @@ def get_file_info(filepath: str) -> Dict[str, Any]:
     }
 
 
+def get_project_file_entries(project_path: str) -> List[os.DirEntry]:
+    """
+    Get all media files in a project as DirEntry objects, in the same order
+    as get_project_files. Not cached - use this when the caller needs each
+    file's size/mtime anyway, so the listing supplies them.
+    """
+    entries = []
+    for subdir in PROJECT_SUBDIRS:
+        try:
+            with os.scandir(os.path.join(project_path, subdir)) as it:
+                # Skip hidden files and metadata
+                entries.extend(
+                    entry for entry in it
+                    if not entry.name.startswith(".") and _ext_lower(entry.name) in ALL_MEDIA_EXTENSIONS
+                )
+        except OSError:
+            continue
+    return entries
+
+
 def get_project_files(project_path: str) -> List[str]:
     """
     Get all media files in a project.
     Returns list of full file paths.
     """
-    files = []
-    all_extensions = IMAGE_EXTENSIONS | RAW_EXTENSIONS | VIDEO_EXTENSIONS
-
+    # Adding, removing or renaming a file bumps its directory's mtime, so the
+    # subdir mtimes are enough to tell whether a cached listing is stale
+    mtimes = []
     for subdir in PROJECT_SUBDIRS:
-        subdir_path = os.path.join(project_path, subdir)
-        if not os.path.exists(subdir_path):
-            continue
+        try:
+            mtimes.append(os.stat(os.path.join(project_path, subdir)).st_mtime_ns)
+        except OSError:
+            mtimes.append(None)
+    return list(_get_project_files_cached(project_path, tuple(mtimes)))
 
-        for filename in os.listdir(subdir_path):
-            # Skip hidden files and metadata
-            if filename.startswith("."):
-                continue
 
-            ext = os.path.splitext(filename)[1].lower()
-            if ext in all_extensions:
-                files.append(os.path.join(subdir_path, filename))
+@lru_cache(maxsize=2048)
+def _get_project_files_cached(project_path: str, subdir_mtimes: Tuple) -> Tuple[str, ...]:
+    """List a project's media files (cached per set of subdir mtimes)"""
+    return tuple(entry.path for entry in get_project_file_entries(project_path))
 
-    return files
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
 
 
 def format_file_size(size_bytes: int) -> str:
     """Format file size in human-readable format"""
-    for unit in ["B", "KB", "MB", "GB", "TB"]:
-        if size_bytes < 1024:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024
-    return f"{size_bytes:.1f} PB"
+    # Each unit is 10 more bits, so the bit length picks it without a loop
+    unit = min(max(int(size_bytes).bit_length() - 1, 0) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (10 * unit)):.1f} {_SIZE_UNITS[unit]}"
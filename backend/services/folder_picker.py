@@ -0,0 +1,95 @@
+"""
+Native folder picker for Bridge Burner v2
+On Windows the shell folder dialog is called in-process through ctypes, so
+opening it doesn't cost a PowerShell + WinForms startup on every click.
+"""
+import sys
+import threading
+from concurrent.futures import Future
+from typing import Optional
+
+# SHBrowseForFolderW flags
+BIF_RETURNONLYFSDIRS = 0x0001
+BIF_EDITBOX = 0x0010
+BIF_NEWDIALOGSTYLE = 0x0040
+
+COINIT_APARTMENTTHREADED = 0x2
+MAX_PATH = 260
+
+if sys.platform == "win32":
+    import ctypes
+    from ctypes import wintypes
+
+    class BROWSEINFOW(ctypes.Structure):
+        _fields_ = [
+            ("hwndOwner", wintypes.HWND),
+            ("pidlRoot", ctypes.c_void_p),
+            ("pszDisplayName", wintypes.LPWSTR),
+            ("lpszTitle", wintypes.LPCWSTR),
+            ("ulFlags", wintypes.UINT),
+            ("lpfn", ctypes.c_void_p),
+            ("lParam", wintypes.LPARAM),
+            ("iImage", ctypes.c_int),
+        ]
+
+    _shell32 = ctypes.windll.shell32
+    _ole32 = ctypes.windll.ole32
+
+    _shell32.SHBrowseForFolderW.argtypes = [ctypes.POINTER(BROWSEINFOW)]
+    _shell32.SHBrowseForFolderW.restype = ctypes.c_void_p
+    _shell32.SHGetPathFromIDListW.argtypes = [ctypes.c_void_p, wintypes.LPWSTR]
+    _shell32.SHGetPathFromIDListW.restype = wintypes.BOOL
+    # HRESULT restype raises OSError on failure (e.g. thread already MTA)
+    _ole32.CoInitializeEx.argtypes = [ctypes.c_void_p, wintypes.DWORD]
+    _ole32.CoInitializeEx.restype = ctypes.HRESULT
+    _ole32.CoUninitialize.argtypes = []
+    _ole32.CoUninitialize.restype = None
+    _ole32.CoTaskMemFree.argtypes = [ctypes.c_void_p]
+    _ole32.CoTaskMemFree.restype = None
+
+
+def _browse_for_folder_win32(title: str) -> Optional[str]:
+    """Show the shell folder dialog (must be called on a thread that can be made STA)"""
+    _ole32.CoInitializeEx(None, COINIT_APARTMENTTHREADED)
+    try:
+        display_name = ctypes.create_unicode_buffer(MAX_PATH)
+        info = BROWSEINFOW()
+        info.pszDisplayName = ctypes.cast(display_name, wintypes.LPWSTR)
+        info.lpszTitle = title
+        info.ulFlags = BIF_RETURNONLYFSDIRS | BIF_EDITBOX | BIF_NEWDIALOGSTYLE
+
+        pidl = _shell32.SHBrowseForFolderW(ctypes.byref(info))
+        if not pidl:
+            return None  # Cancelled
+        try:
+            path = ctypes.create_unicode_buffer(MAX_PATH)
+            if not _shell32.SHGetPathFromIDListW(pidl, path):
+                return None  # Virtual folder with no filesystem path
+            return path.value
+        finally:
+            _ole32.CoTaskMemFree(pidl)
+    finally:
+        _ole32.CoUninitialize()
+
+
+def browse_folder_native(title: str = "Select Folder") -> Future:
+    """
+    Open the Windows folder dialog on its own STA thread.
+    Returns a future resolving to the selected path, or None if cancelled.
+    The future raises OSError if the dialog isn't available (non-Windows or a
+    COM failure), so callers can fall back to another picker.
+    """
+    future = Future()
+
+    if sys.platform != "win32":
+        future.set_exception(OSError("Native folder picker is only available on Windows"))
+        return future
+
+    def run():
+        try:
+            future.set_result(_browse_for_folder_win32(title))
+        except Exception as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, name="folder-picker", daemon=True).start()
+    return future
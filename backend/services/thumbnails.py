@@ -3,12 +3,19 @@ Thumbnail generation for Bridge Burner v2
 Supports JPEG/PNG and RAW files
 """
 import os
+import io
 import hashlib
+import threading
+from functools import lru_cache
 from typing import Optional
 
 try:
     from PIL import Image
     HAS_PIL = True
+
+    # Thumbnails are small and never zoomed, so the cheaper HAMMING filter
+    # looks the same as LANCZOS there; previews keep LANCZOS
+    THUMBNAIL_RESAMPLE = Image.Resampling.HAMMING
 except ImportError:
     HAS_PIL = False
 
@@ -18,30 +25,72 @@ try:
 except ImportError:
     HAS_RAWPY = False
 
+try:
+    import xxhash
+    HAS_XXHASH = True
+except ImportError:
+    HAS_XXHASH = False
+
+try:
+    import numpy
+    from turbojpeg import TurboJPEG, TJPF_RGB, TJSAMP_420
+    HAS_TURBOJPEG = True
+except ImportError:
+    HAS_TURBOJPEG = False
+
 import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from config import THUMBNAIL_SIZE, THUMBNAIL_QUALITY, RAW_EXTENSIONS
+from services.exif import read_jpeg_size
+
+
+# At most this many thumbnails are decoded at once in this process; cache hits
+# don't take a slot
+THUMBNAIL_GENERATE_SLOTS = os.cpu_count() or 1
+_generate_slots = threading.BoundedSemaphore(THUMBNAIL_GENERATE_SLOTS)
 
 
+# EXIF Orientation tag, and the rotation each orientation value needs
+EXIF_ORIENTATION_TAG = 0x0112
+ORIENTATION_ROTATIONS = {3: 180, 6: 270, 8: 90}
+
+
+class ThumbnailBusy(Exception):
+    """No generation slot freed up within the caller's wait time"""
+
+
+@lru_cache(maxsize=64)
 def get_thumbnail_dir(project_path: str) -> str:
-    """Get the thumbnail cache directory for a project"""
+    """
+    Get the thumbnail cache directory for a project (created on the first
+    call per project, so cache hits don't re-check it)
+    """
     thumb_dir = os.path.join(project_path, ".thumbnails")
-    if not os.path.exists(thumb_dir):
-        os.makedirs(thumb_dir, exist_ok=True)
+    os.makedirs(thumb_dir, exist_ok=True)
     return thumb_dir
 
 
-def get_thumbnail_filename(filepath: str) -> str:
-    """Generate a unique thumbnail filename based on file path and mtime"""
-    try:
-        mtime = os.stat(filepath).st_mtime
-    except Exception:
-        mtime = 0
+def _cache_hash(key: str) -> str:
+    """
+    12 hex char hash for a cache filename. Not used for anything
+    security-related, so it's xxh3 when xxhash is installed, otherwise
+    6-byte blake2b from the stdlib.
+    """
+    hash_input = key.encode()
+    if HAS_XXHASH:
+        return f"{xxhash.xxh3_64_intdigest(hash_input):016x}"[:12]
+    return hashlib.blake2b(hash_input, digest_size=6).hexdigest()
 
-    # Create hash of path + mtime for cache invalidation
-    hash_input = f"{filepath}:{mtime}"
-    file_hash = hashlib.md5(hash_input.encode()).hexdigest()[:12]
+
+def get_thumbnail_filename(filepath: str) -> str:
+    """
+    Generate a unique thumbnail filename based on file path.
+    The name stays the same when the source is edited, so the thumbnail is
+    overwritten rather than orphaned; each thumbnail carries its source's
+    mtime instead (see get_or_create_thumbnail).
+    """
+    file_hash = _cache_hash(filepath)
 
     basename = os.path.splitext(os.path.basename(filepath))[0]
     return f"{basename}_{file_hash}.jpg"
@@ -54,32 +103,33 @@ def create_thumbnail_from_image(filepath: str, thumb_path: str) -> bool:
 
     try:
         with Image.open(filepath) as img:
+            # Let the JPEG decoder scale down by up to 1/8 while decoding, so
+            # the full-resolution image is never built; thumbnail() below
+            # does the final resize
+            if img.format == "JPEG":
+                img.draft("RGB", THUMBNAIL_SIZE)
+
             # Handle EXIF rotation
             try:
-                from PIL import ExifTags
-                for orientation in ExifTags.TAGS.keys():
-                    if ExifTags.TAGS[orientation] == "Orientation":
-                        break
-
-                exif = img._getexif()
-                if exif is not None:
-                    orientation_value = exif.get(orientation)
-                    if orientation_value == 3:
-                        img = img.rotate(180, expand=True)
-                    elif orientation_value == 6:
-                        img = img.rotate(270, expand=True)
-                    elif orientation_value == 8:
-                        img = img.rotate(90, expand=True)
+                rotation = ORIENTATION_ROTATIONS.get(img.getexif().get(EXIF_ORIENTATION_TAG))
+                if rotation:
+                    img = img.rotate(rotation, expand=True)
             except Exception:
                 pass
 
-            # Convert to RGB if necessary
-            if img.mode in ("RGBA", "P"):
+            # Palette images are converted first, since Pillow would resize
+            # them with nearest-neighbour
+            if img.mode == "P":
                 img = img.convert("RGB")
 
             # Create thumbnail
-            img.thumbnail(THUMBNAIL_SIZE, Image.Resampling.LANCZOS)
-            img.save(thumb_path, "JPEG", quality=THUMBNAIL_QUALITY)
+            img.thumbnail(THUMBNAIL_SIZE, THUMBNAIL_RESAMPLE)
+
+            # Anything else JPEG can't store (RGBA, LA, 16-bit...) is
+            # converted after the resize, on far fewer pixels
+            if img.mode not in ("RGB", "L", "CMYK"):
+                img = img.convert("RGB")
+            _save_jpeg(img, thumb_path, THUMBNAIL_QUALITY)
             return True
 
     except Exception as e:
@@ -87,7 +137,80 @@ def create_thumbnail_from_image(filepath: str, thumb_path: str) -> bool:
         return False
 
 
-def create_thumbnail_from_raw(filepath: str, thumb_path: str) -> bool:
+@lru_cache(maxsize=1)
+def _get_turbojpeg():
+    """TurboJPEG handle, or None if PyTurboJPEG or libturbojpeg is missing (loaded once)"""
+    if not HAS_TURBOJPEG:
+        return None
+    try:
+        return TurboJPEG()
+    except Exception:
+        return None
+
+
+def _save_jpeg(img, dest_path: str, quality: int) -> None:
+    """
+    Encode an image to a JPEG file. RGB images go straight from their pixel
+    buffer through libjpeg-turbo when it's available; otherwise Pillow encodes.
+    """
+    tj = _get_turbojpeg()
+    if tj is None or img.mode != "RGB":
+        img.save(dest_path, "JPEG", quality=quality)
+        return
+    encoded = tj.encode(numpy.asarray(img), quality=quality, pixel_format=TJPF_RGB, jpeg_subsample=TJSAMP_420)
+    with open(dest_path, "wb") as f:
+        f.write(encoded)
+
+
+def _jpeg_scale_denominator(width: int, height: int, size: tuple) -> int:
+    """
+    Largest libjpeg scale-down (8, 4, 2 or 1) that still leaves at least the
+    pixels of the image fitted into size, for the final resize to work from
+    """
+    ratio = min(size[0] / width, size[1] / height)
+    fit_width, fit_height = max(1, round(width * ratio)), max(1, round(height * ratio))
+    return next((n for n in (8, 4, 2) if width // n >= fit_width and height // n >= fit_height), 1)
+
+
+def save_scaled_jpeg(data: bytes, dest_path: str, size: tuple, quality: int) -> None:
+    """
+    Write JPEG data to dest_path, scaled down to fit size. Data that already
+    fits is written as-is; larger images are decoded at 1/2-1/8 scale by the
+    JPEG decoder itself before the final resize, so the full-resolution
+    image is never decoded.
+    Uses libjpeg-turbo through PyTurboJPEG when available, otherwise Pillow.
+    """
+    tj = _get_turbojpeg()
+    dimensions = read_jpeg_size(data)
+    if dimensions is None:
+        # Frame header not where we looked - let the decoder find it
+        if tj is not None:
+            dimensions = tj.decode_header(data)[:2]
+        else:
+            with Image.open(io.BytesIO(data)) as img:
+                dimensions = img.size
+    width, height = dimensions
+
+    if width <= size[0] and height <= size[1]:
+        # Already thumbnail-sized - no decode or encode at all
+        with open(dest_path, "wb") as f:
+            f.write(data)
+        return
+
+    if tj is None:
+        with Image.open(io.BytesIO(data)) as img:
+            img.draft("RGB", size)
+            img.thumbnail(size, THUMBNAIL_RESAMPLE)
+            img.save(dest_path, "JPEG", quality=quality)
+        return
+
+    scale = _jpeg_scale_denominator(width, height, size)
+    img = Image.fromarray(tj.decode(data, pixel_format=TJPF_RGB, scaling_factor=(1, scale)))
+    img.thumbnail(size, THUMBNAIL_RESAMPLE)
+    _save_jpeg(img, dest_path, quality)
+
+
+def create_thumbnail_from_raw(filepath: str, thumb_path: str, quality: int = THUMBNAIL_QUALITY) -> bool:
     """Create thumbnail from a RAW file using rawpy"""
     if not HAS_RAWPY or not HAS_PIL:
         return False
@@ -98,32 +221,29 @@ def create_thumbnail_from_raw(filepath: str, thumb_path: str) -> bool:
             try:
                 thumb = raw.extract_thumb()
                 if thumb.format == rawpy.ThumbFormat.JPEG:
-                    with open(thumb_path, "wb") as f:
-                        f.write(thumb.data)
-
-                    # Resize if too large
-                    with Image.open(thumb_path) as img:
-                        if img.size[0] > THUMBNAIL_SIZE[0] or img.size[1] > THUMBNAIL_SIZE[1]:
-                            img.thumbnail(THUMBNAIL_SIZE, Image.Resampling.LANCZOS)
-                            img.save(thumb_path, "JPEG", quality=THUMBNAIL_QUALITY)
+                    save_scaled_jpeg(thumb.data, thumb_path, THUMBNAIL_SIZE, quality)
                     return True
                 elif thumb.format == rawpy.ThumbFormat.BITMAP:
                     img = Image.fromarray(thumb.data)
-                    img.thumbnail(THUMBNAIL_SIZE, Image.Resampling.LANCZOS)
-                    img.save(thumb_path, "JPEG", quality=THUMBNAIL_QUALITY)
+                    img.thumbnail(THUMBNAIL_SIZE, THUMBNAIL_RESAMPLE)
+                    _save_jpeg(img, thumb_path, quality)
                     return True
             except Exception:
                 pass
 
-            # Fall back to full processing (slower but works for all RAW files)
+            # Fall back to full processing (slower but works for all RAW files).
+            # Thumbnails end up at 300 px, so the cheapest demosaic will do
             rgb = raw.postprocess(
                 use_camera_wb=True,
                 half_size=True,  # Faster processing
-                no_auto_bright=False,
+                no_auto_bright=True,
+                demosaic_algorithm=rawpy.DemosaicAlgorithm.LINEAR,
+                fbdd_noise_reduction=rawpy.FBDDNoiseReductionMode.Off,
+                output_bps=8,
             )
             img = Image.fromarray(rgb)
-            img.thumbnail(THUMBNAIL_SIZE, Image.Resampling.LANCZOS)
-            img.save(thumb_path, "JPEG", quality=THUMBNAIL_QUALITY)
+            img.thumbnail(THUMBNAIL_SIZE, THUMBNAIL_RESAMPLE)
+            _save_jpeg(img, thumb_path, quality)
             return True
 
     except Exception as e:
@@ -131,10 +251,31 @@ def create_thumbnail_from_raw(filepath: str, thumb_path: str) -> bool:
         return False
 
 
-def get_or_create_thumbnail(filepath: str, project_path: str) -> Optional[str]:
+def _create_atomically(create, filepath: str, dest_path: str, mtime_ns: Optional[int] = None) -> bool:
+    """
+    Run create(filepath, path) against a temp file and rename it into place,
+    so a concurrent request never serves a half-written JPEG. With mtime_ns,
+    the file is given that mtime before it appears.
+    """
+    tmp_path = f"{dest_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        if not create(filepath, tmp_path):
+            return False
+        if mtime_ns is not None:
+            os.utime(tmp_path, ns=(mtime_ns, mtime_ns))
+        os.replace(tmp_path, dest_path)
+        return True
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def get_or_create_thumbnail(filepath: str, project_path: str, wait: Optional[float] = None) -> Optional[str]:
     """
     Get or create a thumbnail for a file.
     Returns the thumbnail path, or None if thumbnail cannot be created.
+    Creating one waits for a generation slot; raises ThumbnailBusy if none
+    frees up within wait seconds (None waits indefinitely).
     """
     ext = os.path.splitext(filepath)[1].lower()
 
@@ -143,22 +284,35 @@ def get_or_create_thumbnail(filepath: str, project_path: str) -> Optional[str]:
     if not is_raw and not HAS_PIL:
         return None
 
+    try:
+        mtime_ns = os.stat(filepath).st_mtime_ns
+    except OSError:
+        return None
+
     # Get thumbnail path
     thumb_dir = get_thumbnail_dir(project_path)
     thumb_filename = get_thumbnail_filename(filepath)
     thumb_path = os.path.join(thumb_dir, thumb_filename)
 
-    # Return existing thumbnail if it exists
-    if os.path.exists(thumb_path):
-        return thumb_path
+    # Return the existing thumbnail if it was made from this version of the
+    # file - thumbnails are stamped with their source's mtime
+    try:
+        if os.stat(thumb_path).st_mtime_ns == mtime_ns:
+            return thumb_path
+    except OSError:
+        pass
 
     # Create new thumbnail
-    if is_raw:
-        if create_thumbnail_from_raw(filepath, thumb_path):
-            return thumb_path
-    else:
-        if create_thumbnail_from_image(filepath, thumb_path):
+    if not _generate_slots.acquire(timeout=wait):
+        raise ThumbnailBusy(filepath)
+    try:
+        # get_thumbnail_dir is memoized - the folder may have been deleted since
+        os.makedirs(thumb_dir, exist_ok=True)
+        create = create_thumbnail_from_raw if is_raw else create_thumbnail_from_image
+        if _create_atomically(create, filepath, thumb_path, mtime_ns):
             return thumb_path
+    finally:
+        _generate_slots.release()
 
     return None
 
@@ -176,15 +330,20 @@ def get_preview_dir(project_path: str) -> str:
     return preview_dir
 
 
-def get_preview_filename(filepath: str) -> str:
-    """Generate a unique preview filename based on file path and mtime"""
+def _get_mtime(filepath: str) -> float:
+    """File mtime, or 0 if it can't be read"""
     try:
-        mtime = os.stat(filepath).st_mtime
-    except Exception:
-        mtime = 0
+        return os.stat(filepath).st_mtime
+    except OSError:
+        return 0
+
+
+def get_preview_filename(filepath: str, mtime: Optional[float] = None) -> str:
+    """Generate a unique preview filename based on file path and mtime"""
+    if mtime is None:
+        mtime = _get_mtime(filepath)
 
-    hash_input = f"{filepath}:{mtime}"
-    file_hash = hashlib.md5(hash_input.encode()).hexdigest()[:12]
+    file_hash = _cache_hash(f"{filepath}:{mtime}")
 
     basename = os.path.splitext(os.path.basename(filepath))[0]
     return f"{basename}_{file_hash}_preview.jpg"
@@ -209,22 +368,24 @@ def create_preview_from_raw(filepath: str, preview_path: str) -> bool:
                     img = Image.fromarray(thumb.data)
                     if img.mode != "RGB":
                         img = img.convert("RGB")
-                    img.save(preview_path, "JPEG", quality=PREVIEW_QUALITY)
+                    _save_jpeg(img, preview_path, PREVIEW_QUALITY)
                     return True
             except Exception:
                 pass
 
-            # Fall back to full RAW processing
+            # Fall back to full RAW processing (PPG is fast and still looks
+            # good at preview size)
             rgb = raw.postprocess(
                 use_camera_wb=True,
                 half_size=False,  # Full resolution
-                no_auto_bright=False,
+                no_auto_bright=True,
+                demosaic_algorithm=rawpy.DemosaicAlgorithm.PPG,
             )
             img = Image.fromarray(rgb)
             # Resize if massive (some RAWs are 50+ megapixels)
             if img.size[0] > PREVIEW_MAX_SIZE[0] or img.size[1] > PREVIEW_MAX_SIZE[1]:
                 img.thumbnail(PREVIEW_MAX_SIZE, Image.Resampling.LANCZOS)
-            img.save(preview_path, "JPEG", quality=PREVIEW_QUALITY)
+            _save_jpeg(img, preview_path, PREVIEW_QUALITY)
             return True
 
     except Exception as e:
@@ -232,6 +393,10 @@ def create_preview_from_raw(filepath: str, preview_path: str) -> bool:
         return False
 
 
+# (RAW path, RAW mtime) -> preview path, for previews known to exist
+_ready_previews = {}
+
+
 def get_or_create_preview(filepath: str, project_path: str) -> Optional[str]:
     """
     Get or create a full-size preview for a RAW file.
@@ -245,17 +410,27 @@ def get_or_create_preview(filepath: str, project_path: str) -> Optional[str]:
     if not HAS_RAWPY:
         return None
 
+    # Previews already known to exist skip the directory and file checks;
+    # the RAW's mtime is part of the key so an edited RAW gets a new one
+    mtime = _get_mtime(filepath)
+    preview_path = _ready_previews.get((filepath, mtime))
+    if preview_path:
+        return preview_path
+
     # Get preview path
     preview_dir = get_preview_dir(project_path)
-    preview_filename = get_preview_filename(filepath)
+    preview_filename = get_preview_filename(filepath, mtime)
     preview_path = os.path.join(preview_dir, preview_filename)
 
-    # Return existing preview if it exists
-    if os.path.exists(preview_path):
-        return preview_path
-
-    # Create new preview
-    if create_preview_from_raw(filepath, preview_path):
+    # Return existing preview if it exists, otherwise create it
+    if os.path.exists(preview_path) or _create_atomically(create_preview_from_raw, filepath, preview_path):
+        _ready_previews[(filepath, mtime)] = preview_path
         return preview_path
 
     return None
+
+
+def forget_preview(preview_path: str) -> None:
+    """Drop a preview that turned out to be missing (e.g. cache folder deleted)"""
+    for key in [key for key, path in list(_ready_previews.items()) if path == preview_path]:
+        _ready_previews.pop(key, None)
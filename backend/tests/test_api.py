@@ -40,6 +40,27 @@ class TestRootEndpoint:
         assert "text/html" in response.headers["content-type"]
 
 
+class TestStaticFiles:
+    """Tests for the prebuilt static file index"""
+
+    def test_static_file_served(self):
+        """Test frontend assets are served from the index"""
+        response = client.get("/static/js/app.js")
+        assert response.status_code == 200
+        assert "etag" in response.headers
+
+    def test_static_file_not_modified(self):
+        """Test matching If-None-Match returns 304"""
+        etag = client.get("/static/js/app.js").headers["etag"]
+        response = client.get("/static/js/app.js", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
+    def test_static_file_missing(self):
+        """Test unknown and traversal paths are not served"""
+        assert client.get("/static/nonexistent.js").status_code == 404
+        assert client.get("/static/../backend/main.py").status_code == 404
+
+
 class TestProjectsAPI:
     """Tests for projects API endpoints"""
 
@@ -126,6 +147,99 @@ class TestImportAPI:
             assert "total_size" in data
             assert data["counts"]["total"] >= 2
 
+    def test_scan_relative_paths_and_counts(self):
+        """Test scan reports paths relative to the source and per-category counts"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            os.makedirs(os.path.join(temp_dir, "DCIM"))
+            for rel_path in ["DCIM/a.jpg", "b.cr2", "c.txt"]:
+                with open(os.path.join(temp_dir, rel_path), "w") as f:
+                    f.write("x")
+
+            data = client.post("/api/import/scan", json={"path": temp_dir + os.sep}).json()
+            assert data["files"]["jpeg"][0]["relative_path"] == os.path.join("DCIM", "a.jpg")
+            assert data["counts"] == {"raw": 1, "jpeg": 1, "video": 0, "gopro": 0, "other": 1, "total": 3}
+            assert data["total_size"] == 3
+
+    def test_scan_cache_invalidated_by_new_file(self):
+        """Test repeated scans are cached until the folder changes"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with open(os.path.join(temp_dir, "a.jpg"), "w") as f:
+                f.write("fake jpeg")
+
+            first = client.post("/api/import/scan", json={"path": temp_dir}).json()
+            second = client.post("/api/import/scan", json={"path": temp_dir}).json()
+            assert first == second
+
+            with open(os.path.join(temp_dir, "b.jpg"), "w") as f:
+                f.write("fake jpeg")
+            # Bump mtime explicitly in case the filesystem's resolution is coarse
+            stat = os.stat(temp_dir)
+            os.utime(temp_dir, (stat.st_atime, stat.st_mtime + 5))
+
+            third = client.post("/api/import/scan", json={"path": temp_dir}).json()
+            assert third["counts"]["jpeg"] == 2
+
+    def test_scan_cache_is_bounded(self, tmp_path, monkeypatch):
+        """Test scanning many folders keeps only the newest results, and expired ones are dropped"""
+        from routers import imports
+        monkeypatch.setattr(imports, "_scan_cache", {})
+
+        folders = []
+        for i in range(imports.SCAN_CACHE_MAX_ENTRIES + 2):
+            folder = tmp_path / f"card{i}"
+            folder.mkdir()
+            folders.append(os.path.abspath(folder))
+            assert client.post("/api/import/scan", json={"path": str(folder)}).status_code == 200
+
+        assert list(imports._scan_cache) == folders[-imports.SCAN_CACHE_MAX_ENTRIES:]
+
+        monkeypatch.setattr(imports, "SCAN_CACHE_TTL", 0)
+        client.post("/api/import/scan", json={"path": folders[0]})
+        assert list(imports._scan_cache) == [folders[0]]
+
+    def test_preview_image_caching_headers(self):
+        """Test preview images carry an ETag and honour If-None-Match"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            filepath = os.path.join(temp_dir, "a.jpg")
+            with open(filepath, "w") as f:
+                f.write("fake jpeg")
+
+            response = client.get("/api/import/preview-image", params={"filepath": filepath})
+            assert response.status_code == 200
+            etag = response.headers["etag"]
+            assert response.headers["cache-control"] == "no-cache"
+
+            version = etag.strip('"')
+            response = client.get("/api/import/preview-image", params={"filepath": filepath, "v": version})
+            assert "immutable" in response.headers["cache-control"]
+
+            response = client.get(
+                "/api/import/preview-image",
+                params={"filepath": filepath},
+                headers={"If-None-Match": etag},
+            )
+            assert response.status_code == 304
+
+    def test_date_previews_stream(self):
+        """Test date-previews streams one line per date then a summary"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for name, mtime in [("a.jpg", 1700000000), ("b.jpg", 1700000000), ("c.jpg", 1710000000)]:
+                filepath = os.path.join(temp_dir, name)
+                with open(filepath, "w") as f:
+                    f.write("fake jpeg")
+                os.utime(filepath, (mtime, mtime))
+
+            response = client.post("/api/import/date-previews", json={"path": temp_dir})
+            assert response.status_code == 200
+            lines = [json.loads(line) for line in response.text.splitlines()]
+
+            dates = [line for line in lines if line["type"] == "date"]
+            assert len(dates) == 2
+            assert dates[0]["date"] > dates[1]["date"]
+            assert sorted(d["total_count"] for d in dates) == [1, 2]
+            assert all(len(d["samples"]) == d["total_count"] for d in dates)
+            assert lines[-1] == {"type": "done", "path": temp_dir, "total_dates": 2, "total_files": 3}
+
     def test_disk_space(self):
         """Test disk space check"""
         response = client.get("/api/import/disk-space")
@@ -158,6 +272,91 @@ class TestImportAPI:
         )
         assert response.status_code == 404
 
+    def test_import_numbers_files_in_walk_order(self, tmp_path, monkeypatch):
+        """Test import-v2 numbers files sequentially and avoids name collisions"""
+        from routers import imports as imports_router
+        library_path = tmp_path / "library"
+        monkeypatch.setattr(imports_router, "get_library_path", lambda: str(library_path))
+
+        source = tmp_path / "card"
+        (source / "DCIM").mkdir(parents=True)
+        for name in ["a.jpg", "b.jpg", "DCIM/c.jpg", "notes.txt"]:
+            (source / name).write_text(name)
+        # A same-named file already in the project must not be overwritten
+        (library_path / "trip" / "Other").mkdir(parents=True)
+        (library_path / "trip" / "Other" / "notes.txt").write_text("old")
+
+        response = client.post(
+            "/api/import/import-v2",
+            json={"source_path": str(source), "project_name": "trip", "file_prefix": ""},
+        )
+        assert response.status_code == 200
+        job = client.get(f"/api/import/jobs/{response.json()['job_id']}").json()
+        assert job["status"] == "completed"
+        assert job["imported"]["JPEG"] == 3
+
+        jpegs = sorted(os.listdir(library_path / "trip" / "JPEG"))
+        assert [n for n in jpegs if not n.startswith(".")] == ["a.jpg", "b.jpg", "c.jpg"]
+        assert (library_path / "trip" / "Other" / "notes_1.txt").read_text() == "notes.txt"
+
+    def test_import_prefix_continues_numbering(self, tmp_path, monkeypatch):
+        """Test prefixed imports continue after the highest existing number"""
+        from routers import imports as imports_router
+        library_path = tmp_path / "library"
+        monkeypatch.setattr(imports_router, "get_library_path", lambda: str(library_path))
+
+        jpeg_dir = library_path / "trip" / "JPEG"
+        jpeg_dir.mkdir(parents=True)
+        for name in ["Trip_0007.jpg", "trip_0003.jpg", "trip_extra_0050.jpg"]:
+            (jpeg_dir / name).write_text("old")
+        source = tmp_path / "card"
+        source.mkdir()
+        (source / "IMG_0001.JPG").write_text("new")
+
+        response = client.post(
+            "/api/import/import-v2",
+            json={"source_path": str(source), "project_name": "trip", "file_prefix": "trip"},
+        )
+        assert response.status_code == 200
+        assert (jpeg_dir / "trip_0008.jpg").read_text() == "new"
+
+    def test_date_filter_uses_mtime_for_raw_files(self, tmp_path):
+        """Test the import date filter matches RAW files by local mtime day"""
+        from datetime import datetime
+        from routers import imports as imports_router
+        date_filter = imports_router.build_date_filter(["2024-01-15", "not-a-date"])
+
+        raw = tmp_path / "IMG_0001.CR2"
+        raw.write_text("raw")
+        for stamp, expected in [
+            ("2024-01-15 00:00:00", True),
+            ("2024-01-15 23:59:59", True),
+            ("2024-01-16 00:00:00", False),
+            ("2024-01-14 12:00:00", False),
+        ]:
+            ts = datetime.strptime(stamp, "%Y-%m-%d %H:%M:%S").timestamp()
+            os.utime(raw, (ts, ts))
+            entry = next(e for e in os.scandir(tmp_path) if e.name == raw.name)
+            assert imports_router.passes_date_filter(entry, ".cr2", date_filter) is expected
+
+        # Non-photo files and no filter always pass
+        assert imports_router.passes_date_filter(entry, ".mp4", date_filter)
+        assert imports_router.passes_date_filter(entry, ".cr2", None)
+
+    def test_project_info_detects_prefix(self, tmp_path, monkeypatch):
+        """Test the file prefix is read from the first numbered file"""
+        from routers import imports as imports_router
+        monkeypatch.setattr(imports_router, "get_library_path", lambda: str(tmp_path))
+
+        (tmp_path / "trip" / "RAW").mkdir(parents=True)
+        (tmp_path / "trip" / "RAW" / ".hidden_0001.cr2").write_text("x")
+        (tmp_path / "trip" / "JPEG").mkdir()
+        (tmp_path / "trip" / "JPEG" / "beach_day_0004.jpg").write_text("x")
+
+        response = client.get("/api/import/project-info/trip")
+        assert response.status_code == 200
+        assert response.json()["detected_prefix"] == "beach_day"
+
 
 class TestProjectWithTempDir:
     """Tests that use a temporary project directory"""
@@ -209,6 +408,16 @@ class TestProjectWithTempDir:
         project_names = [p["name"] for p in data["projects"]]
         assert temp_project["name"] in project_names
 
+    def test_list_projects_reflects_culls(self, temp_project):
+        """Test the cached listing is refreshed by our own changes"""
+        def culled_count():
+            projects = client.get("/api/projects").json()["projects"]
+            return next(p["culled_count"] for p in projects if p["name"] == temp_project["name"])
+
+        assert culled_count() == 0
+        client.post(f"/api/projects/{temp_project['name']}/cull", json={"filename": "test1.jpg"})
+        assert culled_count() == 1
+
     def test_get_project_details(self, temp_project):
         """Test getting project details"""
         response = client.get(f"/api/projects/{temp_project['name']}")
@@ -246,6 +455,200 @@ class TestProjectWithTempDir:
         data = response.json()
         assert data["status"] == "kept"
 
+    def test_cull_ops_are_logged_and_folded(self, temp_project):
+        """Test culls append to the log and a metadata save folds them in"""
+        from routers import projects as projects_router
+        name = temp_project["name"]
+        client.post(f"/api/projects/{name}/cull", json={"filename": "test1.jpg"})
+        client.post(f"/api/projects/{name}/cull", json={"filename": "test2.jpg"})
+        client.post(f"/api/projects/{name}/keep", json={"filename": "test1.jpg"})
+
+        log_path = os.path.join(temp_project["path"], ".culled.log")
+        with open(log_path) as f:
+            assert f.read() == "+test1.jpg\n+test2.jpg\n-test1.jpg\n"
+
+        data = client.get(f"/api/projects/{name}").json()
+        assert data["metadata"]["culled_files"] == ["test2.jpg"]
+        assert data["metadata"]["kept_files"] == ["test1.jpg"]
+
+        client.post(f"/api/projects/{name}/notes", json={"notes": "done"})
+        assert not os.path.exists(log_path)
+        with open(os.path.join(temp_project["path"], ".metadata.json")) as f:
+            saved = json.load(f)
+        assert saved["culled_files"] == ["test2.jpg"]
+        assert saved["kept_files"] == ["test1.jpg"]
+        assert projects_router.load_metadata(temp_project["path"])["notes"] == "done"
+
+    def test_cull_rejects_newline_in_filename(self, temp_project):
+        """Test filenames that would split a cull log record are refused"""
+        name = temp_project["name"]
+        for endpoint in ("cull", "keep"):
+            for filename in ("a\n+b.jpg", "a\r.jpg"):
+                response = client.post(f"/api/projects/{name}/{endpoint}", json={"filename": filename})
+                assert response.status_code == 400
+        assert not os.path.exists(os.path.join(temp_project["path"], ".culled.log"))
+
+    def test_cull_log_recovers_from_torn_record(self, temp_project):
+        """Test a record torn by a crash is dropped, not merged into the next one"""
+        name = temp_project["name"]
+        log_path = os.path.join(temp_project["path"], ".culled.log")
+        for torn in (b"+IMG_", "+caf\u00e9.jpg".encode("utf-8")[:-5]):
+            with open(log_path, "wb") as f:
+                f.write(b"+test1.jpg\n" + torn)
+
+            assert client.get(f"/api/projects/{name}").json()["metadata"]["culled_files"] == ["test1.jpg"]
+            client.post(f"/api/projects/{name}/cull", json={"filename": "test2.jpg"})
+            with open(log_path, "rb") as f:
+                assert f.read() == b"+test1.jpg\n+test2.jpg\n"
+
+    def test_get_file_conditional_get(self, temp_project):
+        """Test served files carry an ETag and repeat requests get a 304"""
+        url = f"/api/projects/{temp_project['name']}/files/test1.jpg"
+        response = client.get(url)
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+
+        response = client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+
+        with open(os.path.join(temp_project["path"], "JPEG", "test1.jpg"), "w") as f:
+            f.write("edited jpeg 1")
+        response = client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+    def test_versioned_thumbnail_is_immutable(self, temp_project):
+        """Test thumbnails requested with ?v= can be cached by the browser"""
+        from PIL import Image
+        Image.new("RGB", (64, 48), "red").save(os.path.join(temp_project["path"], "JPEG", "real.jpg"))
+        url = f"/api/projects/{temp_project['name']}/thumbnail/real.jpg"
+
+        response = client.get(url, params={"v": "1"})
+        assert response.status_code == 200
+        assert "immutable" in response.headers["cache-control"]
+        assert client.get(url).headers["cache-control"] == "no-cache"
+
+    def test_submit_thumbnail_generates_on_pool(self, temp_project):
+        """Test thumbnails queued by get_project are generated on the process pool"""
+        from PIL import Image
+        from routers.projects import submit_thumbnail
+        from services.thumbnails import get_thumbnail_dir
+        filepath = os.path.join(temp_project["path"], "JPEG", "real.jpg")
+        Image.new("RGB", (64, 48), "red").save(filepath)
+
+        thumb_path = submit_thumbnail(filepath, temp_project["path"]).result(timeout=30)
+        assert thumb_path is not None
+        assert os.path.dirname(thumb_path) == get_thumbnail_dir(temp_project["path"])
+        assert os.path.exists(thumb_path)
+
+    def test_thumbnail_busy_returns_429(self, temp_project, monkeypatch):
+        """Test a tile gets a 429 when every generation slot stays busy"""
+        from PIL import Image
+        from routers import projects
+        from services import thumbnails
+        Image.new("RGB", (64, 48), "red").save(os.path.join(temp_project["path"], "JPEG", "real.jpg"))
+        monkeypatch.setattr(projects, "THUMBNAIL_WAIT", 0.0)
+
+        for _ in range(thumbnails.THUMBNAIL_GENERATE_SLOTS):
+            thumbnails._generate_slots.acquire()
+        try:
+            response = client.get(f"/api/projects/{temp_project['name']}/thumbnail/real.jpg")
+        finally:
+            for _ in range(thumbnails.THUMBNAIL_GENERATE_SLOTS):
+                thumbnails._generate_slots.release()
+        assert response.status_code == 429
+        assert "retry-after" in response.headers
+
+    def test_thumbnail_waiting_on_queued_job_returns_429(self, temp_project, monkeypatch):
+        """Test a tile whose pre-generation job doesn't finish in time gets a 429"""
+        from concurrent.futures import Future
+        from routers import projects
+        filepath = os.path.join(temp_project["path"], "JPEG", "real.jpg")
+        with open(filepath, "wb") as f:
+            f.write(b"jpeg")
+        monkeypatch.setattr(projects, "THUMBNAIL_WAIT", 0.0)
+        monkeypatch.setitem(projects._thumbnail_jobs, filepath, Future())
+
+        response = client.get(f"/api/projects/{temp_project['name']}/thumbnail/real.jpg")
+        assert response.status_code == 429
+        assert "retry-after" in response.headers
+
+    def test_resolve_within_rejects_other_drive(self, temp_project, monkeypatch):
+        """Test a path on another drive is a 403, not an error from commonpath"""
+        from fastapi import HTTPException
+        from routers import projects
+
+        def other_drive(paths):
+            raise ValueError("Paths don't have the same drive")
+
+        monkeypatch.setattr(projects.os.path, "commonpath", other_drive)
+        with pytest.raises(HTTPException) as exc_info:
+            projects._resolve_within(temp_project["path"], "D:\\photo.jpg")
+        assert exc_info.value.status_code == 403
+
+    def test_open_in_gimp_rejects_sibling_prefix(self, temp_project):
+        """Test a path in a sibling folder sharing the project's name prefix is refused"""
+        sibling = temp_project["path"] + "-other"
+        os.makedirs(sibling)
+        with open(os.path.join(sibling, "x.jpg"), "w") as f:
+            f.write("outside")
+
+        for endpoint in ("open-in-gimp", "open-in-gimp-direct", "rebuild-tiff"):
+            response = client.post(
+                f"/api/projects/{temp_project['name']}/{endpoint}",
+                json={"filepath": os.path.join(sibling, "x.jpg")},
+            )
+            assert response.status_code == 403
+
+    def test_darktable_fallback_ignores_other_raws_tiffs(self, tmp_path, monkeypatch):
+        """Test the renamed-output fallback doesn't pick up a TIFF of a longer-named RAW"""
+        import subprocess
+        from routers import projects
+
+        raw_path = str(tmp_path / "IMG_1.CR2")
+        with open(raw_path, "wb") as f:
+            f.write(b"raw")
+
+        def fake_darktable(cmd, **kwargs):
+            for name in ("IMG_1_01.tif", "IMG_12.tif"):
+                with open(tmp_path / name, "wb") as f:
+                    f.write(b"tiff")
+            return subprocess.CompletedProcess(cmd, 0, "", "")
+
+        monkeypatch.setattr(projects.subprocess, "run", fake_darktable)
+        output = projects._convert_raw_for_gimp_locked(
+            "darktable-cli", raw_path, str(tmp_path), "IMG_1", str(tmp_path / "IMG_1.tif")
+        )
+        assert os.path.basename(output) == "IMG_1_01.tif"
+
+    def test_get_file_media_type_and_range(self, temp_project):
+        """Test videos get their Content-Type from the extension and support Range"""
+        with open(os.path.join(temp_project["path"], "Video", "clip.mts"), "wb") as f:
+            f.write(b"0123456789")
+        url = f"/api/projects/{temp_project['name']}/files/clip.mts"
+
+        response = client.get(url, headers={"Range": "bytes=2-5"})
+        assert response.status_code == 206
+        assert response.headers["content-type"] == "video/mp2t"
+        assert response.content == b"2345"
+
+    def test_get_file_follows_moved_file(self, temp_project):
+        """Test a file is still served after it moves to another subdir"""
+        url = f"/api/projects/{temp_project['name']}/files/test2.jpg"
+        assert client.get(url).status_code == 200
+
+        os.rename(
+            os.path.join(temp_project["path"], "JPEG", "test2.jpg"),
+            os.path.join(temp_project["path"], "Other", "test2.jpg"),
+        )
+        response = client.get(url)
+        assert response.status_code == 200
+        assert response.content == b"fake jpeg 2"
+
+        os.remove(os.path.join(temp_project["path"], "Other", "test2.jpg"))
+        assert client.get(url).status_code == 404
+
     def test_delete_culled_empty(self, temp_project):
         """Test deleting culled files when none are culled"""
         response = client.delete(f"/api/projects/{temp_project['name']}/culled")
@@ -272,5 +675,54 @@ class TestProjectWithTempDir:
         assert not os.path.exists(os.path.join(project_path, "JPEG", "test1.jpg"))
 
 
+class SlowPool:
+    """Pool stand-in whose submit is slow, to widen the window between lookup and insert"""
+
+    def __init__(self):
+        self.submitted = []
+
+    def submit(self, fn, *args):
+        import time
+        from concurrent.futures import Future
+        self.submitted.append(args)
+        time.sleep(0.05)
+        return Future()
+
+
+def call_concurrently(fn, count=2):
+    """Call fn from several threads at once and return their results"""
+    import threading
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(fn())) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+class TestJobSubmission:
+    """Tests for joining in-flight pool jobs"""
+
+    @pytest.mark.parametrize("module_name, pool_getter, jobs_attr, submit", [
+        ("imports", "get_raw_pool", "_raw_preview_jobs",
+         lambda module, tmp: module.submit_raw_preview("a.cr2", str(tmp / "ab" / "cdef.jpg"))),
+        ("projects", "get_thumb_pool", "_thumbnail_jobs",
+         lambda module, tmp: module.submit_thumbnail(str(tmp / "JPEG" / "a.jpg"), str(tmp))),
+    ])
+    def test_submit_joins_concurrent_request(self, module_name, pool_getter, jobs_attr, submit, tmp_path, monkeypatch):
+        """Test two simultaneous submits for one file queue a single job"""
+        import importlib
+        module = importlib.import_module(f"routers.{module_name}")
+        pool = SlowPool()
+        monkeypatch.setattr(module, pool_getter, lambda: pool)
+        monkeypatch.setattr(module, jobs_attr, {})
+
+        futures = call_concurrently(lambda: submit(module, tmp_path))
+
+        assert len(pool.submitted) == 1
+        assert futures[0] is futures[1]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -3,6 +3,7 @@ Unit tests for Bridge Burner services
 """
 import os
 import sys
+import io
 import tempfile
 import shutil
 import pytest
@@ -18,7 +19,16 @@ from config import (
     get_config,
     get_library_path,
 )
-from services.files import get_file_type, get_file_info, get_project_files, format_file_size
+from services.files import (
+    get_file_type,
+    get_file_info,
+    get_project_files,
+    get_project_file_entries,
+    format_file_size,
+    walk_files,
+    walk_files_parallel,
+    copy_file,
+)
 from services.conversion import (
     ConversionPreset,
     PRESETS,
@@ -26,6 +36,7 @@ from services.conversion import (
     estimate_conversion_time,
     is_gopro_file,
     get_presets_list,
+    throttle_progress,
 )
 
 
@@ -67,6 +78,46 @@ class TestConfig:
         assert isinstance(path, str)
         assert len(path) > 0
 
+    def test_save_config_refreshes_cache(self, tmp_path, monkeypatch):
+        """Saved config should be returned by the next get_config call"""
+        import config
+
+        monkeypatch.setattr(config, "CONFIG_FILE_V2", str(tmp_path / "config.json"))
+        monkeypatch.setattr(config, "CONFIG_FILE_V1", str(tmp_path / "missing.json"))
+        monkeypatch.setattr(config, "_MISSING_CONFIG", False)
+        monkeypatch.setattr(config, "_LIBRARY_PATH", None)
+
+        # Neither file exists yet - defaults, remembered as missing
+        assert config.get_library_path() == config.DEFAULT_LIBRARY_PATH
+        assert config._MISSING_CONFIG
+
+        config.save_config({"library_path": "/first"})
+        assert config.get_config()["library_path"] == "/first"
+
+        # Mutating the returned dict must not leak into the cache
+        config.get_config()["library_path"] = "/mutated"
+        assert config.get_library_path() == "/first"
+
+        config.set_library_path("/second")
+        assert config.get_library_path() == "/second"
+
+    def test_reload_config_picks_up_hand_edits(self, tmp_path, monkeypatch):
+        """The memoized library path should only change on save or reload"""
+        import config
+
+        config_file = tmp_path / "config.json"
+        monkeypatch.setattr(config, "CONFIG_FILE_V2", str(config_file))
+        monkeypatch.setattr(config, "CONFIG_FILE_V1", str(tmp_path / "missing.json"))
+        monkeypatch.setattr(config, "_LIBRARY_PATH", None)
+
+        config.save_config({"library_path": "/first"})
+        assert config.get_library_path() == "/first"
+
+        config_file.write_text('{"library_path": "/edited"}')
+        assert config.get_library_path() == "/first"
+        config.reload_config()
+        assert config.get_library_path() == "/edited"
+
 
 class TestFileService:
     """Tests for file service"""
@@ -101,6 +152,9 @@ class TestFileService:
         assert "KB" in format_file_size(5000)
         assert "MB" in format_file_size(5000000)
         assert "GB" in format_file_size(5000000000)
+        assert format_file_size(1023) == "1023.0 B"
+        assert format_file_size(1024) == "1.0 KB"
+        assert format_file_size(1048575) == "1024.0 KB"
 
     def test_get_file_info_with_temp_file(self):
         """Test getting file info from a real file"""
@@ -143,6 +197,22 @@ class TestFileService:
             files = get_project_files(temp_dir)
             assert len(files) == 2
 
+    def test_get_project_files_sees_new_files(self):
+        """Test that the cached listing picks up files added later"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for subdir in PROJECT_SUBDIRS:
+                os.makedirs(os.path.join(temp_dir, subdir))
+
+            with open(os.path.join(temp_dir, "JPEG", "a.jpg"), "w") as f:
+                f.write("fake jpeg")
+            assert len(get_project_files(temp_dir)) == 1
+
+            with open(os.path.join(temp_dir, "JPEG", "b.jpg"), "w") as f:
+                f.write("fake jpeg")
+            os.remove(os.path.join(temp_dir, "JPEG", "a.jpg"))
+            files = get_project_files(temp_dir)
+            assert [os.path.basename(f) for f in files] == ["b.jpg"]
+
     def test_get_project_files_ignores_hidden(self):
         """Test that hidden files are ignored"""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -159,6 +229,122 @@ class TestFileService:
             assert len(files) == 1
             assert "visible.jpg" in files[0]
 
+    def test_get_file_info_from_project_entries(self):
+        """Test that DirEntry-based file info matches the path-based listing"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for subdir in PROJECT_SUBDIRS:
+                os.makedirs(os.path.join(temp_dir, subdir))
+            with open(os.path.join(temp_dir, "RAW", "test.cr2"), "w") as f:
+                f.write("fake raw")
+            with open(os.path.join(temp_dir, "JPEG", ".hidden.jpg"), "w") as f:
+                f.write("hidden")
+
+            entries = get_project_file_entries(temp_dir)
+            assert [e.path for e in entries] == get_project_files(temp_dir)
+            info = get_file_info(entries[0])
+            assert info == get_file_info(entries[0].path)
+            assert info["subdir"] == "RAW"
+            assert info["size"] == len("fake raw")
+
+    def test_walk_files_recurses_and_skips_hidden(self):
+        """Test walk_files finds nested files and skips hidden files/dirs"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            os.makedirs(os.path.join(temp_dir, "DCIM", "100CANON"))
+            os.makedirs(os.path.join(temp_dir, ".Trashes"))
+            for rel_path in ["top.jpg", "DCIM/100CANON/IMG_0001.CR2", ".hidden.jpg", ".Trashes/old.jpg"]:
+                with open(os.path.join(temp_dir, rel_path), "w") as f:
+                    f.write("x")
+
+            names = sorted(entry.name for entry in walk_files(temp_dir))
+            assert names == ["IMG_0001.CR2", "top.jpg"]
+
+            parallel_names = sorted(entry.name for entry in walk_files_parallel(temp_dir))
+            assert parallel_names == names
+
+    def test_copy_file_preserves_content_and_mtime(self):
+        """Test copy_file copies bytes and metadata like shutil.copy2"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            src = os.path.join(temp_dir, "src.jpg")
+            dst = os.path.join(temp_dir, "dst.jpg")
+            data = os.urandom(200000)
+            with open(src, "wb") as f:
+                f.write(data)
+            os.utime(src, (1700000000, 1700000000))
+
+            copy_file(src, dst)
+
+            with open(dst, "rb") as f:
+                assert f.read() == data
+            assert os.stat(dst).st_mtime == os.stat(src).st_mtime
+
+    @pytest.mark.skipif(not hasattr(os, "copy_file_range"), reason="needs os.copy_file_range")
+    def test_copy_file_falls_back_when_copy_file_range_stalls(self, tmp_path, monkeypatch):
+        """Test a copy_file_range that returns 0 early doesn't leave a truncated copy"""
+        from services import files
+        monkeypatch.setattr(files, "HAS_FCNTL", False)
+        monkeypatch.setattr(files.os, "copy_file_range", lambda *args: 0)
+        src = tmp_path / "src.jpg"
+        dst = tmp_path / "dst.jpg"
+        data = os.urandom(200000)
+        src.write_bytes(data)
+
+        copy_file(str(src), str(dst))
+
+        assert dst.read_bytes() == data
+
+
+class TestExifReader:
+    """Tests for the header-only EXIF date reader"""
+
+    def _write_jpeg_with_exif(self, path, date_value, big_endian=False):
+        """Write a minimal JPEG header with IFD0 -> Exif IFD -> DateTimeOriginal"""
+        import struct
+        e = ">" if big_endian else "<"
+        value = date_value.encode("ascii") + b"\x00"
+        # TIFF header, IFD0 at 8 with one entry (Exif pointer), Exif IFD at 26
+        tiff = (b"MM" if big_endian else b"II") + struct.pack(e + "HI", 42, 8)
+        tiff += struct.pack(e + "H", 1) + struct.pack(e + "HHII", 0x8769, 4, 1, 26) + struct.pack(e + "I", 0)
+        tiff += struct.pack(e + "H", 1) + struct.pack(e + "HHII", 0x9003, 2, len(value), 44) + struct.pack(e + "I", 0)
+        tiff += value
+        app1 = b"Exif\x00\x00" + tiff
+        with open(path, "wb") as f:
+            f.write(b"\xff\xd8\xff\xe1" + struct.pack(">H", len(app1) + 2) + app1 + b"\xff\xda")
+
+    def test_read_datetime_original(self, tmp_path):
+        """Test date is read from little- and big-endian EXIF"""
+        from services.exif import read_datetime_original
+
+        for big_endian in (False, True):
+            path = str(tmp_path / f"img_{big_endian}.jpg")
+            self._write_jpeg_with_exif(path, "2024:01:15 14:30:00", big_endian)
+            assert read_datetime_original(path) == "2024:01:15 14:30:00"
+
+    def test_read_datetime_original_missing(self, tmp_path):
+        """Test JPEG without EXIF returns None and non-JPEG is rejected"""
+        from services.exif import read_datetime_original, ExifUnsupported
+
+        path = tmp_path / "plain.jpg"
+        path.write_bytes(b"\xff\xd8\xff\xda")
+        assert read_datetime_original(str(path)) is None
+
+        path = tmp_path / "not_a.jpg"
+        path.write_bytes(b"fake jpeg")
+        with pytest.raises(ExifUnsupported):
+            read_datetime_original(str(path))
+
+    def test_read_jpeg_size(self):
+        """Test dimensions come from the frame header of baseline and progressive JPEGs"""
+        from PIL import Image
+        from services.exif import read_jpeg_size
+
+        for progressive in (False, True):
+            buf = io.BytesIO()
+            Image.new("RGB", (160, 120)).save(buf, "JPEG", progressive=progressive)
+            assert read_jpeg_size(buf.getvalue()) == (160, 120)
+
+        assert read_jpeg_size(b"fake jpeg") is None
+        assert read_jpeg_size(b"\xff\xd8\xff\xda") is None
+
 
 class TestConversionService:
     """Tests for video conversion service"""
@@ -176,7 +362,7 @@ class TestConversionService:
             assert settings.name, f"{preset} missing name"
             assert settings.description, f"{preset} missing description"
             assert settings.extension, f"{preset} missing extension"
-            assert isinstance(settings.ffmpeg_args, list), f"{preset} ffmpeg_args not list"
+            assert isinstance(settings.ffmpeg_args, tuple), f"{preset} ffmpeg_args not tuple"
             assert settings.estimated_size_multiplier > 0, f"{preset} invalid size multiplier"
             assert settings.estimated_speed > 0, f"{preset} invalid speed"
 
@@ -207,11 +393,96 @@ class TestConversionService:
         assert is_gopro_file("video.mp4") == False
         assert is_gopro_file("DSC_0001.MOV") == False
 
+    def test_resolve_auto_preset(self, monkeypatch):
+        """Test AUTO picks NVENC only when it's usable"""
+        from services import conversion
+        monkeypatch.setattr(conversion, "nvenc_available", lambda: True)
+        assert conversion.resolve_preset(ConversionPreset.AUTO) == ConversionPreset.HEVC_NVENC
+        monkeypatch.setattr(conversion, "nvenc_available", lambda: False)
+        assert conversion.resolve_preset(ConversionPreset.AUTO) == conversion.AUTO_FALLBACK_PRESET
+        assert conversion.resolve_preset(ConversionPreset.PRORES_LT) == ConversionPreset.PRORES_LT
+
+    def test_preset_hwaccel(self):
+        """Test GPU presets decode with CUDA and remuxing decodes nothing"""
+        from services import conversion
+        for preset in conversion.HARDWARE_PRESETS:
+            assert conversion.PRESETS[preset].hwaccel == conversion.HWACCEL_CUDA
+        assert conversion.PRESETS[ConversionPreset.COPY].hwaccel == ()
+        assert conversion.PRESETS[ConversionPreset.PRORES_LT].hwaccel == conversion.HWACCEL_AUTO
+
+    def test_get_video_info_is_cached(self, monkeypatch, tmp_path):
+        """Test ffprobe runs once per file version"""
+        import subprocess
+        from services import conversion
+        calls = []
+
+        def fake_run(cmd, **kwargs):
+            calls.append(cmd)
+            return subprocess.CompletedProcess(cmd, 0, stdout=b'{"format": {"duration": "1.5"}}')
+
+        monkeypatch.setattr(conversion, "find_ffprobe", lambda: "ffprobe")
+        monkeypatch.setattr(conversion.subprocess, "run", fake_run)
+        video = tmp_path / "clip.mp4"
+        video.write_bytes(b"video")
+
+        assert conversion.get_video_info(str(video))["format"]["duration"] == "1.5"
+        conversion.get_video_info(str(video))
+        assert len(calls) == 1
+
+        video.write_bytes(b"edited video")
+        conversion.get_video_info(str(video))
+        assert len(calls) == 2
+
+    def test_get_video_info_fast_falls_back_to_ffprobe(self, monkeypatch, tmp_path):
+        """Test the fast probe uses ffprobe when PyAV isn't available"""
+        from services import conversion
+        video = tmp_path / "clip.mp4"
+        video.write_bytes(b"video")
+        info = {"format": {"duration": "2.0"}}
+        monkeypatch.setattr(conversion, "HAS_AV", False)
+        monkeypatch.setattr(conversion, "get_video_info", lambda path: info)
+
+        assert conversion.get_video_info_fast(str(video)) is info
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="uses a shell script as a fake ffmpeg")
+    def test_run_ffmpeg_survives_noisy_stderr(self, tmp_path):
+        """Test a flood of stderr output can't stall the progress loop"""
+        from services import conversion
+        fake = tmp_path / "ffmpeg"
+        fake.write_text(
+            "#!/bin/sh\n"
+            "echo out_time_us=500000\n"
+            "echo progress=continue\n"
+            "i=0; while [ $i -lt 3000 ]; do echo 'error while decoding frame' >&2; i=$((i+1)); done\n"
+            "echo progress=end\n"
+            "exit 1\n"
+        )
+        fake.chmod(0o755)
+        reports = []
+
+        returncode, stderr = conversion._run_ffmpeg(
+            [str(fake), "-i", "in.mp4", "out.mp4"], 1.0, 10.0, lambda p, m: reports.append(p)
+        )
+        assert returncode == 1
+        assert "error while decoding frame" in stderr
+        assert reports[0] == pytest.approx(50.0)
+
+    def test_encoder_thread_args(self):
+        """Test software encoders get a thread cap and GPU/remux presets don't"""
+        from services.conversion import encoder_thread_args
+        assert encoder_thread_args(ConversionPreset.PRORES_LT, None) == []
+        assert encoder_thread_args(ConversionPreset.PRORES_LT, 4) == ["-threads", "4"]
+        assert encoder_thread_args(ConversionPreset.H265_MEDIUM, 4) == ["-threads", "4", "-x265-params", "pools=4"]
+        assert encoder_thread_args(ConversionPreset.HEVC_NVENC, 4) == []
+        assert encoder_thread_args(ConversionPreset.COPY, 4) == []
+
     def test_get_presets_list(self):
         """Test getting presets as list for frontend"""
         presets = get_presets_list()
         assert isinstance(presets, list)
-        assert len(presets) == len(PRESETS)
+        # Every concrete preset, plus "auto"
+        assert len(presets) == len(PRESETS) + 1
+        assert presets[-1]["id"] == ConversionPreset.AUTO.value
 
         for preset in presets:
             assert "id" in preset
@@ -226,6 +497,33 @@ class TestConversionService:
         # Just verify it returns string or None
         assert result is None or isinstance(result, str)
 
+    @pytest.mark.skipif(sys.platform == "win32", reason="uses a shell script as a fake ffmpeg")
+    def test_run_ffmpeg_parses_progress_stream(self, tmp_path):
+        """Test progress is read from ffmpeg's -progress key=value output"""
+        from services.conversion import _run_ffmpeg
+        fake_ffmpeg = tmp_path / "ffmpeg"
+        fake_ffmpeg.write_text(
+            "#!/bin/sh\n"
+            "printf 'out_time_us=N/A\\nprogress=continue\\n'\n"
+            "printf 'frame=10\\nout_time_us=1000000\\nprogress=continue\\n'\n"
+            "printf 'out_time_us=2000000\\nprogress=end\\n'\n"
+        )
+        fake_ffmpeg.chmod(0o755)
+
+        calls = []
+        returncode, _ = _run_ffmpeg([str(fake_ffmpeg)], 2.0, 60, lambda p, m: calls.append(p))
+        assert returncode == 0
+        assert calls == [0, 50, 99, 100]
+
+    def test_throttle_progress(self):
+        """Test throttled callbacks drop rapid updates but always deliver 100%"""
+        calls = []
+        throttled = throttle_progress(lambda p, m: calls.append(p), min_interval=60)
+        throttled(10, "a")
+        throttled(20, "b")
+        throttled(100, "done")
+        assert calls == [10, 100]
+
 
 class TestThumbnailService:
     """Tests for thumbnail service"""
@@ -267,6 +565,141 @@ class TestThumbnailService:
         finally:
             os.unlink(temp_path)
 
+    def test_save_scaled_jpeg(self, tmp_path):
+        """Test embedded JPEGs are scaled to fit, and small ones written untouched"""
+        from PIL import Image
+        from services.thumbnails import save_scaled_jpeg, THUMBNAIL_SIZE
+
+        def jpeg_bytes(size):
+            buf = io.BytesIO()
+            Image.new("RGB", size, (200, 40, 40)).save(buf, "JPEG")
+            return buf.getvalue()
+
+        large = tmp_path / "large.jpg"
+        save_scaled_jpeg(jpeg_bytes((2400, 1600)), str(large), THUMBNAIL_SIZE, 85)
+        with Image.open(large) as img:
+            assert img.size == (300, 200)
+
+        small_data = jpeg_bytes((200, 100))
+        small = tmp_path / "small.jpg"
+        save_scaled_jpeg(small_data, str(small), THUMBNAIL_SIZE, 85)
+        assert small.read_bytes() == small_data
+
+    def test_jpeg_scale_denominator(self):
+        """Test the decode scale leaves enough pixels for the fitted thumbnail"""
+        from services.thumbnails import _jpeg_scale_denominator, THUMBNAIL_SIZE
+
+        assert _jpeg_scale_denominator(6000, 4000, THUMBNAIL_SIZE) == 8
+        assert _jpeg_scale_denominator(1200, 800, THUMBNAIL_SIZE) == 4
+        # One side already under 300 px but the image still doesn't fit
+        assert _jpeg_scale_denominator(320, 240, THUMBNAIL_SIZE) == 1
+        assert _jpeg_scale_denominator(6000, 200, THUMBNAIL_SIZE) == 8
+
+    def test_create_thumbnail_from_large_jpeg(self, tmp_path):
+        """Test a large JPEG (decoded at reduced scale) still fills the thumbnail box"""
+        from PIL import Image
+        from services.thumbnails import create_thumbnail_from_image
+
+        source = tmp_path / "big.jpg"
+        Image.new("RGB", (4000, 3000), (20, 120, 200)).save(source)
+        thumb = tmp_path / "thumb.jpg"
+
+        assert create_thumbnail_from_image(str(source), str(thumb))
+        with Image.open(thumb) as img:
+            assert img.size == (300, 225)
+
+    def test_create_thumbnail_from_non_rgb_png(self, tmp_path):
+        """Test PNG modes JPEG can't store are converted for the thumbnail"""
+        from PIL import Image
+        from services.thumbnails import create_thumbnail_from_image
+
+        for mode in ("RGBA", "LA", "P"):
+            source = tmp_path / f"{mode}.png"
+            Image.new(mode, (900, 600)).save(source)
+            thumb = tmp_path / f"{mode}.jpg"
+
+            assert create_thumbnail_from_image(str(source), str(thumb))
+            with Image.open(thumb) as img:
+                assert img.mode == "RGB"
+                assert img.size == (300, 200)
+
+    def test_create_thumbnail_applies_exif_orientation(self, tmp_path):
+        """Test a JPEG tagged as rotated 90 degrees gets an upright thumbnail"""
+        from PIL import Image
+        from services.thumbnails import create_thumbnail_from_image, EXIF_ORIENTATION_TAG
+
+        source = tmp_path / "rotated.jpg"
+        img = Image.new("RGB", (400, 200))
+        exif = img.getexif()
+        exif[EXIF_ORIENTATION_TAG] = 6
+        img.save(source, exif=exif)
+        thumb = tmp_path / "thumb.jpg"
+
+        assert create_thumbnail_from_image(str(source), str(thumb))
+        with Image.open(thumb) as result:
+            assert result.size == (150, 300)
+
+    def test_thumbnail_regenerated_in_place_after_edit(self, tmp_path):
+        """Test an edited source reuses its thumbnail name and gets a fresh thumbnail"""
+        from PIL import Image
+        from services.thumbnails import get_or_create_thumbnail
+
+        source = tmp_path / "photo.jpg"
+        Image.new("RGB", (64, 48)).save(source)
+        first = get_or_create_thumbnail(str(source), str(tmp_path))
+        assert os.stat(first).st_mtime_ns == os.stat(source).st_mtime_ns
+
+        Image.new("RGB", (48, 64)).save(source)
+        os.utime(source, ns=(1_000_000_000, 1_000_000_000))  # Even an older mtime counts as a change
+        assert get_or_create_thumbnail(str(source), str(tmp_path)) == first
+        with Image.open(first) as img:
+            assert img.size == (48, 64)
+        assert len(os.listdir(os.path.dirname(first))) == 1
+
+    def test_thumbnail_dir_recreated_after_delete(self, tmp_path):
+        """Test the memoized thumbnail folder is recreated if someone deletes it"""
+        from PIL import Image
+        from services.thumbnails import get_or_create_thumbnail, get_thumbnail_dir
+
+        source = tmp_path / "photo.jpg"
+        Image.new("RGB", (64, 48)).save(source)
+
+        first = get_or_create_thumbnail(str(source), str(tmp_path))
+        assert os.path.exists(first)
+
+        shutil.rmtree(get_thumbnail_dir(str(tmp_path)))
+        assert get_or_create_thumbnail(str(source), str(tmp_path)) == first
+        assert os.path.exists(first)
+
+    def test_ready_previews_skip_regeneration(self, tmp_path, monkeypatch):
+        """Test a RAW preview is created once and remembered until it goes missing"""
+        from services import thumbnails
+
+        created = []
+
+        def fake_create(filepath, preview_path):
+            created.append(preview_path)
+            with open(preview_path, "wb") as f:
+                f.write(b"jpeg")
+            return True
+
+        monkeypatch.setattr(thumbnails, "HAS_RAWPY", True)
+        monkeypatch.setattr(thumbnails, "create_preview_from_raw", fake_create)
+        monkeypatch.setattr(thumbnails, "_ready_previews", {})
+
+        raw_path = str(tmp_path / "IMG_0001.CR2")
+        with open(raw_path, "wb") as f:
+            f.write(b"raw")
+
+        first = thumbnails.get_or_create_preview(raw_path, str(tmp_path))
+        assert thumbnails.get_or_create_preview(raw_path, str(tmp_path)) == first
+        assert len(created) == 1
+
+        os.remove(first)
+        thumbnails.forget_preview(first)
+        assert thumbnails.get_or_create_preview(raw_path, str(tmp_path)) == first
+        assert len(created) == 2
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
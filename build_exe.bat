@@ -38,6 +38,7 @@ echo.
     --hidden-import uvicorn.lifespan.on ^
     --hidden-import uvicorn.loops ^
     --hidden-import uvicorn.loops.auto ^
+    --hidden-import httptools ^
     --hidden-import email.mime.text ^
     --collect-submodules uvicorn ^
     --collect-submodules fastapi ^
@@ -45,10 +45,12 @@ const API = {
      * Get thumbnail URL
      * @param {string} projectName - Project name
      * @param {string} filename - File name
+     * @param {string} [version] - Changes when the file does (lets the browser cache the thumbnail)
      * @returns {string}
      */
-    getThumbnailUrl(projectName, filename) {
-        return `${this.baseUrl}/${encodeURIComponent(projectName)}/thumbnail/${encodeURIComponent(filename)}`;
+    getThumbnailUrl(projectName, filename, version) {
+        const url = `${this.baseUrl}/${encodeURIComponent(projectName)}/thumbnail/${encodeURIComponent(filename)}`;
+        return version ? `${url}?v=${encodeURIComponent(version)}` : url;
     },
 
     /**
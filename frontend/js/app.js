@@ -32,6 +32,21 @@ function debounce(fn, cooldownMs = 500) {
     };
 }
 
+/**
+ * Retry a thumbnail that failed to load (e.g. the server answered 429 while
+ * busy generating others), backing off 2s, 4s, 8s... up to a few attempts
+ */
+const THUMBNAIL_RETRIES = 4;
+function retryThumbnail(img) {
+    const attempt = parseInt(img.dataset.retries || '0');
+    if (attempt >= THUMBNAIL_RETRIES) return;
+    img.dataset.retries = attempt + 1;
+    setTimeout(() => {
+        // Skip tiles dropped by a re-render in the meantime
+        if (img.isConnected) img.src = img.src;
+    }, 2000 * 2 ** attempt);
+}
+
 const App = {
     // Current state
     currentProject: null,
@@ -292,7 +307,7 @@ const App = {
 
         this.elements.imageGrid.innerHTML = this.filteredFiles.map((file, index) => {
             const thumbnailUrl = file.can_thumbnail
-                ? API.getThumbnailUrl(this.currentProject.name, file.filename)
+                ? API.getThumbnailUrl(this.currentProject.name, file.filename, `${file.modified}-${file.size}`)
                 : '';
             const isVideo = file.type === 'video';
             const hasEdits = file.has_xcf || file.has_tif;
@@ -333,6 +348,12 @@ const App = {
                 }
             });
 
+            // Retry thumbnails the server was too busy to generate
+            const img = item.querySelector('img');
+            if (img) {
+                img.addEventListener('error', () => retryThumbnail(img));
+            }
+
             // Cull button
             item.querySelector('.btn-cull').addEventListener('click', (e) => {
                 e.stopPropagation();
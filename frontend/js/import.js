@@ -25,9 +25,14 @@ const Import = {
         'prores_hq': 15,
         'h264_high': 0.8,
         'h264_medium': 0.5,
+        'h264_fast': 0.7,
         'h265_high': 0.5,
         'h265_medium': 0.3,
+        'h265_fast': 0.45,
+        'h264_nvenc': 0.8,
+        'hevc_nvenc': 0.5,
         'copy': 1,
+        'auto': 17, // Assume the DNxHD fallback (the larger estimate)
     },
 
     /**
@@ -154,7 +159,7 @@ const Import = {
                 throw new Error(error.detail || 'Failed to load previews');
             }
 
-            const data = await response.json();
+            const data = await this.readDatePreviewStream(response, container);
 
             if (data.dates.length === 0) {
                 container.innerHTML = '<div class="date-preview-loading">No images found</div>';
@@ -195,7 +200,7 @@ const Import = {
                                 // Try to load all images (including RAW) via the preview endpoint
                                 return `<img
                                     class="date-preview-thumb"
-                                    src="/api/import/preview-image?filepath=${encodeURIComponent(sample.filepath)}"
+                                    src="/api/import/preview-image?filepath=${encodeURIComponent(sample.filepath)}${sample.version ? `&v=${sample.version}` : ''}"
                                     alt="${sample.filename}"
                                     title="${sample.filename}${sample.is_raw ? ' (RAW)' : ''}"
                                     loading="lazy"
@@ -239,6 +244,43 @@ const Import = {
         }
     },
 
+    /**
+     * Read the NDJSON date-previews stream, showing scan progress as it arrives.
+     * Returns { path, dates, total_dates, total_files }.
+     */
+    async readDatePreviewStream(response, container) {
+        const data = { dates: [] };
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        let buffer = '';
+
+        const handleLine = (line) => {
+            if (!line.trim()) return;
+            const msg = JSON.parse(line);
+            if (msg.type === 'progress') {
+                container.innerHTML = `<div class="date-preview-loading">Loading date previews... ${msg.scanned} images scanned</div>`;
+            } else if (msg.type === 'date') {
+                data.dates.push(msg);
+            } else if (msg.type === 'done') {
+                data.path = msg.path;
+                data.total_dates = msg.total_dates;
+                data.total_files = msg.total_files;
+            }
+        };
+
+        while (true) {
+            const { done, value } = await reader.read();
+            if (done) break;
+            buffer += decoder.decode(value, { stream: true });
+            const lines = buffer.split('\n');
+            buffer = lines.pop();
+            lines.forEach(handleLine);
+        }
+        handleLine(buffer + decoder.decode());
+
+        return data;
+    },
+
     /**
      * Format date string for display
      */